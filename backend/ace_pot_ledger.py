@@ -0,0 +1,68 @@
+"""
+Ace pot ledger with a maintained balance.
+
+Every ace_pot row stores balance_after, the pot balance once that row was
+written, and the ace_pot_balance table holds the current total. Both are
+updated in the same transaction as the row, with the balance row locked, so
+reading the pot is a single-row lookup and the history can be paged with its
+running totals without summing the table.
+"""
+
+from decimal import Decimal
+
+from database import db, expire_loaded
+from models import AcePot, AcePotBalance
+
+BALANCE_ID = 1
+
+
+def _locked_balance_row():
+    """The balance row, locked until commit (created on first use)"""
+    row = AcePotBalance.query.filter_by(balance_id=BALANCE_ID).with_for_update().first()
+    if row is None:
+        row = AcePotBalance(balance_id=BALANCE_ID, balance=Decimal('0.00'))
+        db.session.add(row)
+    return row
+
+
+def current_balance(lock=False):
+    """Current ace pot total; lock=True holds the balance row until commit"""
+    if lock:
+        return _locked_balance_row().balance
+    balance = db.session.query(AcePotBalance.balance).filter_by(balance_id=BALANCE_ID).scalar()
+    return balance if balance is not None else Decimal('0.00')
+
+
+def add_ace_pot_entry(tournament_id, date, description, amount):
+    """Append an ace pot row and move the balance with it"""
+    pot = _locked_balance_row()
+    pot.balance = Decimal(str(pot.balance or 0)) + Decimal(str(amount))
+    entry = AcePot(
+        tournament_id=tournament_id,
+        date=date,
+        description=description,
+        amount=amount,
+        balance_after=pot.balance
+    )
+    db.session.add(entry)
+    return entry
+
+
+def delete_ace_pot_entries(*criteria):
+    """Delete matching rows, shifting the running balance of every later row; returns the rows removed"""
+    removed = db.session.query(AcePot.ace_pot_id, AcePot.amount).filter(*criteria).order_by(AcePot.ace_pot_id).all()
+    if not removed:
+        return 0
+
+    pot = _locked_balance_row()
+    table = AcePot.__table__
+    for ace_pot_id, amount in removed:
+        db.session.execute(
+            table.update()
+            .where(table.c.ace_pot_id > ace_pot_id)
+            .values(balance_after=table.c.balance_after - amount)
+        )
+    expire_loaded(AcePot, 'balance_after')
+    AcePot.query.filter(AcePot.ace_pot_id.in_([ace_pot_id for ace_pot_id, _ in removed])).delete()
+    pot.balance = Decimal(str(pot.balance or 0)) - sum(Decimal(str(amount)) for _, amount in removed)
+    return len(removed)
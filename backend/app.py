@@ -11,7 +11,8 @@ load_dotenv()
 if os.getenv('AWS_EXECUTION_ENV') and os.path.exists('.env.production'):
     load_dotenv('.env.production', override=True)
 app = Flask(__name__)
-CORS(app, supports_credentials=True)
+# The snapshot ETag has to be readable cross-origin for If-None-Match revalidation
+CORS(app, supports_credentials=True, expose_headers=['ETag'])
 
 # Get WebSocket allowed origins from environment
 websocket_origins = os.getenv('WEBSOCKET_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000').split(',')
@@ -62,6 +63,8 @@ from routes.matches import matches_bp
 from routes.ace_pot import ace_pot_bp
 from routes.auth import auth_bp
 from routes.admin_audit import admin_audit_bp
+from routes.leaderboard import leaderboard_bp
+from routes.seasons import seasons_bp
 from routes.tournament_edit import tournament_edit_bp
 
 app.register_blueprint(auth_bp)
@@ -70,8 +73,23 @@ app.register_blueprint(tournaments_bp)
 app.register_blueprint(matches_bp)
 app.register_blueprint(ace_pot_bp)
 app.register_blueprint(admin_audit_bp)
+app.register_blueprint(leaderboard_bp)
+app.register_blueprint(seasons_bp)
 app.register_blueprint(tournament_edit_bp)
 
+# Resume completion jobs interrupted by a restart; runs under any WSGI server, not only app.run
+from completion_jobs import start_job_sweeper
+start_job_sweeper(app)
+
+@app.cli.command('backfill-ratings')
+def backfill_ratings_command():
+    """Rebuild player ratings by replaying every completed match"""
+    from ratings import backfill_ratings
+
+    matches_rated, players_rated = backfill_ratings()
+    db.session.commit()
+    print(f"Rated {players_rated} players from {matches_rated} matches")
+
 @app.route('/')
 def health_check():
     return jsonify({"status": "DG Putt API is running", "timestamp": datetime.now().isoformat()})
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark bracket generation for large fields, both a fresh build and
+stamping team ids onto a cached template. Before timing, every field size up
+to the largest one is checked to keep seeds 1 and 2 apart until the winners
+bracket final.
+
+Run from the backend directory:
+    python benchmarks/bracket_benchmark.py [team_count ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bracket_engine import build_bracket, stamp_bracket
+
+DEFAULT_SIZES = [16, 64, 256, 1000, 1024]
+RUNS = 20
+
+
+def time_call(func, team_count, runs=RUNS):
+    """Return (best, average) time in milliseconds for func(team_ids)"""
+    team_ids = list(range(1, team_count + 1))
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(team_ids)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), sum(timings) / len(timings)
+
+
+def winners_path(bracket, seed):
+    """Winners bracket match ids a seed plays through if it never loses"""
+    slot = next(slot for slot in bracket.slots
+                if slot.round_type == 'Winners' and seed in (slot.team1_id, slot.team2_id))
+    path = []
+    while slot and slot.round_type == 'Winners':
+        path.append(slot.match_id)
+        slot = bracket.get(slot.winner_advances_to_match_id)
+    return path
+
+
+def check_top_seeds(team_count):
+    """Seeds 1 and 2 must not be able to meet before the winners bracket final"""
+    bracket = build_bracket(list(range(1, team_count + 1)))
+    second_path = set(winners_path(bracket, 2))
+    meeting = next(match_id for match_id in winners_path(bracket, 1) if match_id in second_path)
+    if bracket.get(meeting).round_number != bracket.wb_rounds - 1:
+        raise SystemExit(f'{team_count} teams: seeds 1 and 2 meet in winners round {bracket.get(meeting).round_number}')
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    for team_count in range(4, max(sizes) + 1):
+        check_top_seeds(team_count)
+    print(f"{'teams':>6} {'matches':>8} {'build ms':>9} {'avg ms':>9} {'stamp ms':>9} {'avg ms':>9}")
+    for team_count in sizes:
+        match_count = len(build_bracket(list(range(1, team_count + 1))).slots)
+        build_best, build_avg = time_call(build_bracket, team_count)
+        stamp_best, stamp_avg = time_call(stamp_bracket, team_count)
+        print(f"{team_count:>6} {match_count:>8} {build_best:>9.2f} {build_avg:>9.2f} "
+              f"{stamp_best:>9.2f} {stamp_avg:>9.2f}")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the teammate-history-aware pairing against the random swap loop
+create_tournament used before, on fields that already share a season of
+history.
+
+Run from the backend directory:
+    python benchmarks/pairing_benchmark.py [player_count ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from team_pairing import pair_players, repeat_cost
+
+DEFAULT_SIZES = [16, 64, 200, 500]
+# Past events each field has played together before the measured one
+HISTORY_EVENTS = 30
+RUNS = 20
+
+
+def random_pairing(player_ids, pair_counts=None, rng=random):
+    """The original swap loop: pop a player and pair them with a random remaining one"""
+    player_list = list(player_ids)
+    pairs = []
+    while len(player_list) >= 2:
+        player_one = player_list.pop()
+        n = len(player_list)
+        index = rng.randint(0, n - 1)
+        player_two = player_list[index]
+        player_list[index] = player_list[n - 1]
+        player_list.pop()
+        pairs.append((player_one, player_two))
+    return pairs, player_list[0] if player_list else None
+
+
+def build_history(player_ids, events, pairing, rng):
+    """times_paired counts after a number of events paired with the given method"""
+    pair_counts = {player_id: {} for player_id in player_ids}
+    for _ in range(events):
+        pairs, _ = pairing(player_ids, pair_counts, rng=rng)
+        for a, b in pairs:
+            pair_counts[a][b] = pair_counts[a].get(b, 0) + 1
+            pair_counts[b][a] = pair_counts[b].get(a, 0) + 1
+    return pair_counts
+
+
+def measure(pairing, player_ids, pair_counts, runs=RUNS, seed=7):
+    """Return (average ms, average repeat cost, average teams with a repeat)"""
+    rng = random.Random(seed)
+    timings, costs, repeats = [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        pairs, _ = pairing(player_ids, pair_counts, rng=rng)
+        timings.append((time.perf_counter() - start) * 1000)
+        costs.append(repeat_cost(pairs, pair_counts))
+        repeats.append(sum(1 for a, b in pairs if pair_counts[a].get(b)))
+    return sum(timings) / runs, sum(costs) / runs, sum(repeats) / runs
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'players':>8} {'method':>9} {'avg ms':>8} {'repeats':>8} {'teams':>7}")
+    for player_count in sizes:
+        player_ids = list(range(1, player_count + 1))
+        # Random history is the worst case: the old method left repeats scattered across every field
+        pair_counts = build_history(player_ids, HISTORY_EVENTS, random_pairing, random.Random(1))
+        for name, pairing in [('random', random_pairing), ('optimized', pair_players)]:
+            average, cost, repeats = measure(pairing, player_ids, pair_counts)
+            print(f"{player_count:>8} {name:>9} {average:>8.2f} {cost:>8.1f} {repeats:>7.1f}")
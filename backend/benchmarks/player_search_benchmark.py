@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark typeahead lookups against the in-process player search index for
+large player bases.
+
+Run from the backend directory:
+    python benchmarks/player_search_benchmark.py [player_count ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from player_search import PlayerSearchIndex
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+QUERIES = ['j', 'jo', 'joh', 'john', 'john sm', 'smi', 'son', 'jonhson', 'ace']
+RUNS = 200
+
+FIRST_NAMES = ['John', 'Johnny', 'Sarah', 'Mike', 'Maria', 'Jose', 'Ann', 'Chris', 'Pat', 'Sam',
+               'Alex', 'Jordan', 'Taylor', 'Casey', 'Jamie', 'Morgan', 'Riley', 'Avery', 'Quinn', 'Drew']
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Lopez',
+              'Wilson', 'Anderson', 'Thomas', 'Moore', 'Jackson', 'Martin', 'Lee', 'Thompson', 'White']
+NICKNAMES = [None, None, None, 'Ace', 'Big Bag', 'Slider', 'Airmail', 'Hooker', 'Cornstar']
+
+
+def make_players(count, seed=1):
+    rng = random.Random(seed)
+    return [(player_id,
+             f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {player_id}',
+             rng.choice(NICKNAMES),
+             rng.choice(['Pro', 'Am', 'Junior'])) for player_id in range(1, count + 1)]
+
+
+def time_queries(index, runs=RUNS):
+    """Return (best, average, worst query average) lookup time in milliseconds"""
+    averages = []
+    best = float('inf')
+    for query in QUERIES:
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            index.search(query, limit=10)
+            timings.append((time.perf_counter() - start) * 1000)
+        best = min(best, min(timings))
+        averages.append(sum(timings) / len(timings))
+    return best, sum(averages) / len(averages), max(averages)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'players':>8} {'build ms':>9} {'best ms':>8} {'avg ms':>8} {'worst ms':>9}")
+    for player_count in sizes:
+        players = make_players(player_count)
+        start = time.perf_counter()
+        index = PlayerSearchIndex(players)
+        build = (time.perf_counter() - start) * 1000
+        best, average, worst = time_queries(index)
+        print(f"{player_count:>8} {build:>9.1f} {best:>8.3f} {average:>8.3f} {worst:>9.3f}")
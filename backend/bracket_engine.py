@@ -0,0 +1,329 @@
+"""
+In-memory double elimination bracket engine.
+
+Builds the winners, losers and championship graph for a field of teams
+using (round_type, round_number, position_in_round) and match_id indexes,
+so every lookup while wiring advancement paths, seeding and removing byes
+is O(1) and the whole build is linear in the number of matches.
+
+The topology only depends on the team count, so finished brackets are kept
+as seed-numbered templates in a bounded LRU cache and new events just stamp
+their team ids onto the cached template.
+"""
+
+import math
+from functools import lru_cache
+
+TEMPLATE_CACHE_SIZE = 64
+
+
+def bracket_size_for(team_count):
+    """Smallest power of two that fits every team"""
+    return 1 << (team_count - 1).bit_length() if team_count & (team_count - 1) else team_count
+
+
+def standard_seed_order(bracket_size):
+    """Seed number in each first round slot, two slots per match, so that seeds 1 and 2
+    sit in opposite halves, 1-4 in different quarters and so on, and every opening
+    match pairs seeds adding up to bracket_size + 1"""
+    order = [1]
+    while len(order) < bracket_size:
+        total = 2 * len(order) + 1
+        order = [seed for top in order for seed in (top, total - top)]
+    return order
+
+
+class BracketSlot:
+    """A single match in the bracket graph, independent of the ORM"""
+    __slots__ = (
+        'match_id', 'stage_type', 'round_type', 'round_number', 'position_in_round',
+        'stage_match_number', 'match_order', 'team1_id', 'team2_id', 'match_status',
+        'winner_advances_to_match_id', 'loser_advances_to_match_id'
+    )
+
+    def __init__(self, match_id, stage_type, round_type, round_number, position_in_round):
+        self.match_id = match_id
+        self.stage_type = stage_type
+        self.round_type = round_type
+        self.round_number = round_number
+        self.position_in_round = position_in_round
+        self.stage_match_number = match_id
+        self.match_order = match_id
+        self.team1_id = None
+        self.team2_id = None
+        self.match_status = 'Pending'
+        self.winner_advances_to_match_id = None
+        self.loser_advances_to_match_id = None
+
+    def as_row(self):
+        """Column values for a Match row"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Bracket:
+    """Ordered collection of bracket slots with position and match_id indexes"""
+
+    def __init__(self, team_count):
+        self.team_count = team_count
+        self.bracket_size = bracket_size_for(team_count)
+        self.byes_needed = self.bracket_size - team_count
+        self.wb_rounds = int(math.log2(self.bracket_size))
+        self.lb_rounds = 0
+        self.by_id = {}
+        self.by_position = {}
+        self.rounds = {}
+        self.removed_match_ids = []
+        self.championship = None
+
+    def add(self, slot):
+        self.by_id[slot.match_id] = slot
+        self.by_position[(slot.round_type, slot.round_number, slot.position_in_round)] = slot
+        self.rounds.setdefault((slot.round_type, slot.round_number), []).append(slot)
+        return slot
+
+    def remove(self, slot):
+        # Round lists are filtered lazily in round() so removal stays O(1)
+        del self.by_id[slot.match_id]
+        del self.by_position[(slot.round_type, slot.round_number, slot.position_in_round)]
+        self.removed_match_ids.append(slot.match_id)
+
+    def get(self, match_id):
+        return self.by_id.get(match_id)
+
+    def at(self, round_type, round_number, position_in_round):
+        return self.by_position.get((round_type, round_number, position_in_round))
+
+    def round(self, round_type, round_number):
+        return [slot for slot in self.rounds.get((round_type, round_number), []) if slot.match_id in self.by_id]
+
+    @property
+    def slots(self):
+        """Slots in match_id order (dicts keep insertion order)"""
+        return list(self.by_id.values())
+
+
+def build_bracket(team_ids):
+    """Build a seeded double elimination bracket for the given team ids"""
+    bracket = Bracket(len(team_ids))
+    next_id = _create_winners_bracket(bracket, 1)
+    next_id = _create_losers_bracket(bracket, next_id)
+    bracket.championship = bracket.add(BracketSlot(next_id, 'Finals', 'Championship', 0, 0))
+    _set_advancement_paths(bracket)
+    _seed_teams_and_handle_byes(bracket, team_ids)
+    _set_match_order(bracket)
+    return bracket
+
+
+class BracketTemplate:
+    """Immutable bracket topology with 1-based seed numbers in the team columns"""
+
+    def __init__(self, bracket):
+        self.team_count = bracket.team_count
+        self.rows = tuple(tuple(slot.as_row().items()) for slot in dependency_order(bracket.slots))
+        self.advancement_edges = tuple(
+            (slot.match_id, slot.winner_advances_to_match_id, slot.loser_advances_to_match_id)
+            for slot in bracket.slots
+        )
+        self.bye_match_ids = tuple(bracket.removed_match_ids)
+        self.match_order = tuple(
+            slot.match_id for slot in sorted(bracket.slots, key=lambda slot: slot.match_order)
+        )
+
+    def stamp(self, team_ids):
+        """Row dicts with seed numbers replaced by team ids, in dependency order"""
+        if len(team_ids) != self.team_count:
+            raise ValueError(f'Template is for {self.team_count} teams, got {len(team_ids)}')
+
+        rows = []
+        for template_row in self.rows:
+            row = dict(template_row)
+            if row['team1_id']:
+                row['team1_id'] = team_ids[row['team1_id'] - 1]
+            if row['team2_id']:
+                row['team2_id'] = team_ids[row['team2_id'] - 1]
+            rows.append(row)
+        return rows
+
+
+def dependency_order(slots):
+    """Order slots so every advancement target comes before the matches feeding it"""
+    by_id = {slot.match_id: slot for slot in slots}
+    feeders = {match_id: [] for match_id in by_id}
+    waiting_on = {}
+    for slot in slots:
+        targets = {slot.winner_advances_to_match_id, slot.loser_advances_to_match_id} & by_id.keys()
+        waiting_on[slot.match_id] = len(targets)
+        for target_id in targets:
+            feeders[target_id].append(slot.match_id)
+
+    ready = [match_id for match_id, count in waiting_on.items() if count == 0]
+    ordered = []
+    while ready:
+        match_id = ready.pop()
+        ordered.append(by_id[match_id])
+        for feeder_id in feeders[match_id]:
+            waiting_on[feeder_id] -= 1
+            if waiting_on[feeder_id] == 0:
+                ready.append(feeder_id)
+
+    if len(ordered) != len(slots):
+        raise ValueError('Bracket advancement paths contain a cycle')
+    return ordered
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def bracket_template(team_count):
+    """Cached topology for a team count, seeded with seed numbers 1..team_count"""
+    return BracketTemplate(build_bracket(list(range(1, team_count + 1))))
+
+
+def stamp_bracket(team_ids):
+    """Match rows for the given seeded team ids, built from the cached template"""
+    return bracket_template(len(team_ids)).stamp(team_ids)
+
+
+def _create_winners_bracket(bracket, match_id):
+    for round_num in range(bracket.wb_rounds):
+        for pos in range(bracket.bracket_size >> (round_num + 1)):
+            bracket.add(BracketSlot(match_id, 'Group_A', 'Winners', round_num, pos))
+            match_id += 1
+    return match_id
+
+
+def _create_losers_bracket(bracket, match_id):
+    wb_round = 0
+    lb_round = 0
+    prev_round_count = 0
+    loser_matches_needed = bracket.bracket_size - 2
+
+    # Standard alternating pattern
+    while loser_matches_needed > 0:
+        if lb_round == 0 or lb_round % 2 == 1:  # odd rounds get WB losers
+            matches_in_round = math.ceil(((bracket.bracket_size >> (wb_round + 1)) + prev_round_count) / 2)
+            wb_round += 1
+        else:  # even rounds resolve LB matches
+            matches_in_round = math.ceil(prev_round_count / 2)
+        prev_round_count = matches_in_round
+
+        for pos in range(matches_in_round):
+            bracket.add(BracketSlot(match_id, 'Group_A', 'Losers', lb_round, pos + 1))
+            loser_matches_needed -= 1
+            match_id += 1
+        lb_round += 1
+
+    bracket.lb_rounds = lb_round
+    return match_id
+
+
+def _set_advancement_paths(bracket):
+    """Set winner and loser advancement paths for all matches"""
+    championship_id = bracket.championship.match_id
+    last_wb_round = bracket.wb_rounds - 1
+    last_lb_round = bracket.lb_rounds - 1
+
+    # Winners bracket progression
+    for round_num in range(bracket.wb_rounds):
+        for match in bracket.round('Winners', round_num):
+            if round_num < last_wb_round:
+                next_match = bracket.at('Winners', round_num + 1, match.position_in_round // 2)
+                if next_match:
+                    match.winner_advances_to_match_id = next_match.match_id
+            else:
+                match.winner_advances_to_match_id = championship_id
+
+    # LB internal progressions, tracking how many feeders each LB match has
+    assigned = {}
+    for round_num in range(bracket.lb_rounds):
+        current_round = bracket.round('Losers', round_num)
+        if round_num < last_lb_round:
+            next_round = bracket.round('Losers', round_num + 1)
+            for i, match in enumerate(current_round):
+                target = next_round[i % len(next_round)]
+                match.winner_advances_to_match_id = target.match_id
+                assigned[target.match_id] = assigned.get(target.match_id, 0) + 1
+        else:
+            for match in current_round:
+                match.winner_advances_to_match_id = championship_id
+
+    # WB losers drop to LB (only odd rounds accept WB losers). Slots only ever
+    # fill up, so each target round keeps a cursor at its first open match.
+    cursors = {}
+    for round_num in range(bracket.wb_rounds):
+        if round_num == last_wb_round:
+            target_round = last_lb_round
+        else:
+            target_round = 0 if round_num == 0 else round_num * 2 - 1
+
+        targets = bracket.round('Losers', target_round)
+        if target_round == 1:
+            targets = targets[::-1]
+
+        cursor = cursors.get(target_round, 0)
+        for wb_match in bracket.round('Winners', round_num):
+            while cursor < len(targets) and assigned.get(targets[cursor].match_id, 0) >= 2:
+                cursor += 1
+            if cursor == len(targets):
+                break
+            target = targets[cursor]
+            wb_match.loser_advances_to_match_id = target.match_id
+            assigned[target.match_id] = assigned.get(target.match_id, 0) + 1
+        cursors[target_round] = cursor
+
+
+def _place_team(match, team_id):
+    if match.team1_id is None:
+        match.team1_id = team_id
+    elif match.team2_id is None:
+        match.team2_id = team_id
+    if match.team1_id and match.team2_id:
+        match.match_status = 'Scheduled'
+
+
+def _seed_teams_and_handle_byes(bracket, team_ids):
+    """Seed teams (strongest first) into standard bracket positions and handle bye advancement"""
+    order = standard_seed_order(bracket.bracket_size)
+    played = []
+
+    for match in list(bracket.round('Winners', 0)):
+        top_seed, bottom_seed = order[2 * match.position_in_round], order[2 * match.position_in_round + 1]
+        if bottom_seed > bracket.team_count:
+            # The missing opponent makes this a bye: the top seed skips the first round
+            next_match = bracket.get(match.winner_advances_to_match_id)
+            if next_match:
+                _place_team(next_match, team_ids[top_seed - 1])
+            bracket.remove(match)
+        else:
+            match.team1_id = team_ids[top_seed - 1]
+            match.team2_id = team_ids[bottom_seed - 1]
+            match.match_status = 'Scheduled'
+            played.append(match)
+
+    _handle_losers_bracket_byes(bracket, played)
+
+
+def _handle_losers_bracket_byes(bracket, wb_first_round):
+    """Drop LB opening matches left with fewer than two feeders after WB byes"""
+    if bracket.byes_needed == 0:
+        return
+
+    feeders = {}
+    for wb_match in wb_first_round:
+        feeders.setdefault(wb_match.loser_advances_to_match_id, []).append(wb_match)
+
+    for lb_match in list(bracket.round('Losers', 0)):
+        feeding_wb_matches = feeders.get(lb_match.match_id, [])
+        if len(feeding_wb_matches) <= 1:
+            if feeding_wb_matches:
+                # Single parent - redirect its loser to where this LB match winner would go
+                feeding_wb_matches[0].loser_advances_to_match_id = lb_match.winner_advances_to_match_id
+            bracket.remove(lb_match)
+
+
+def _set_match_order(bracket):
+    """Order by round, winners before losers, then match_id; championship keeps its id"""
+    order = 1
+    for round_num in range(max(bracket.wb_rounds, bracket.lb_rounds)):
+        for round_type in ('Winners', 'Losers'):
+            for match in bracket.round(round_type, round_num):
+                match.match_order = order
+                order += 1
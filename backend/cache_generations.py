@@ -0,0 +1,31 @@
+"""
+Shared generation counters for in-process caches.
+
+Every worker process keeps its own copy of a cache, so invalidating memory
+only helps the process that made the write. Writers also bump a named row
+in cache_generations after committing; readers compare that generation (one
+primary key lookup) with the one their copy was built from and rebuild when
+it has moved.
+"""
+
+from database import db
+from models import CacheGeneration
+
+
+def current_generation(name):
+    """Shared generation for a cache; 0 before its first bump"""
+    return db.session.query(CacheGeneration.generation).filter_by(name=name).scalar() or 0
+
+
+def bump_generation(name):
+    """Move a cache's shared generation on in its own short transaction and return it; call after the write commits"""
+    table = CacheGeneration.__table__
+    bumped = db.session.execute(
+        table.update().where(table.c.name == name).values(generation=table.c.generation + 1)
+    ).rowcount
+    if not bumped:
+        db.session.add(CacheGeneration(name=name, generation=1))
+    # Still inside the bumping transaction, so this is our own increment
+    generation = current_generation(name)
+    db.session.commit()
+    return generation
@@ -0,0 +1,103 @@
+"""
+Per-player career statistics.
+
+When a tournament completes, record_career_stats writes one
+player_tournament_stats row per player (team, place, match wins and losses,
+ace pot) and folds those rows into player_career_stats with one INSERT for
+first-timers and one UPDATE. Like the payouts ledger, the per-tournament rows
+are what gets subtracted again when a tournament is deleted or recalculated,
+so manual place edits in between cannot skew the totals.
+"""
+
+from sqlalchemy import case, select
+
+from database import db, expire_loaded
+from models import PlayerCareerStats, PlayerTournamentStats, Team
+from placements import team_match_stats
+
+# Career column -> expression over a player_tournament_stats row
+_CONTRIBUTIONS = {
+    'tournaments_played': lambda rows: 1,
+    'match_wins': lambda rows: rows.c.wins,
+    'match_losses': lambda rows: rows.c.losses,
+    'podiums': lambda rows: case((rows.c.final_place <= 3, 1), else_=0),
+    'ace_pots_won': lambda rows: case((rows.c.won_ace_pot, 1), else_=0),
+    'place_total': lambda rows: db.func.coalesce(rows.c.final_place, 0),
+    'places_counted': lambda rows: case((rows.c.final_place.isnot(None), 1), else_=0)
+}
+
+
+def career_to_dict(stats):
+    """JSON shape of a player's career stats (zeros when they have none yet)"""
+    played = stats.tournaments_played if stats else 0
+    wins = stats.match_wins if stats else 0
+    losses = stats.match_losses if stats else 0
+    return {
+        'tournaments_played': played,
+        'match_wins': wins,
+        'match_losses': losses,
+        'win_rate': round(wins / (wins + losses), 3) if wins + losses else None,
+        'podiums': stats.podiums if stats else 0,
+        'ace_pots_won': stats.ace_pots_won if stats else 0,
+        'average_place': round(stats.place_total / stats.places_counted, 2) if stats and stats.places_counted else None
+    }
+
+
+def _apply(tournament_id, credit):
+    """Add (or subtract) a tournament's recorded rows to every affected career row in one UPDATE"""
+    career = PlayerCareerStats.__table__
+    rows = PlayerTournamentStats.__table__
+    players = select(rows.c.player_id).where(rows.c.tournament_id == tournament_id)
+
+    if credit:
+        db.session.execute(career.insert().from_select(
+            ['player_id'],
+            players.where(rows.c.player_id.notin_(select(career.c.player_id)))
+        ))
+
+    values = {}
+    for column, contribution in _CONTRIBUTIONS.items():
+        amount = select(db.func.coalesce(db.func.sum(contribution(rows)), 0)).where(
+            rows.c.tournament_id == tournament_id,
+            rows.c.player_id == career.c.player_id
+        ).scalar_subquery()
+        values[column] = career.c[column] + amount if credit else career.c[column] - amount
+
+    db.session.execute(career.update().where(career.c.player_id.in_(players)).values(values))
+    expire_loaded(PlayerCareerStats)
+
+
+def record_career_stats(tournament_id):
+    """Record each player's result in a completed tournament and add it to their career; returns the rows written"""
+    teams = db.session.query(
+        Team.team_id, Team.player1_id, Team.player2_id, Team.final_place
+    ).filter(Team.tournament_id == tournament_id).all()
+    stats = team_match_stats(tournament_id)
+
+    rows = []
+    for team_id, player1_id, player2_id, final_place in teams:
+        team_stats = stats.get(team_id, {'wins': 0, 'losses': 0})
+        for player_id in {player1_id, player2_id} - {None}:
+            rows.append({
+                'player_id': player_id,
+                'tournament_id': tournament_id,
+                'team_id': team_id,
+                'final_place': final_place,
+                'wins': team_stats['wins'],
+                'losses': team_stats['losses'],
+                'won_ace_pot': final_place == 1 and team_stats['losses'] == 0
+            })
+
+    if rows:
+        db.session.execute(PlayerTournamentStats.__table__.insert(), rows)
+        _apply(tournament_id, credit=True)
+    return rows
+
+
+def reverse_career_stats(tournament_id):
+    """Take a tournament's recorded rows back out of every career; returns the number of rows reversed"""
+    reversed_rows = PlayerTournamentStats.query.filter_by(tournament_id=tournament_id).count()
+    if reversed_rows:
+        _apply(tournament_id, credit=False)
+        PlayerTournamentStats.query.filter_by(tournament_id=tournament_id).delete()
+    return reversed_rows
@@ -0,0 +1,216 @@
+"""
+Background pipeline for tournament completion.
+
+Scoring the deciding championship match only queues a completion job in the
+same transaction that marks the tournament Completed; placing teams, teammate
+history, seasonal points, payouts and career stats then run on a small thread
+pool after the response has gone out.
+
+Jobs are persisted in completion_jobs. Each stage commits together with the
+job's stages_done counter, so a retry resumes at the first unfinished stage
+and never applies a stage twice. Workers claim a job with a conditional
+UPDATE, so the same job cannot run on two threads at once. A rescore that
+reopens or re-completes a tournament reverses the stages the job applied.
+
+Every process sweeps for queued jobs on start-up and then periodically, and
+puts back Running jobs whose heartbeat (updated_at, touched by each stage
+commit) has gone stale because the process running them died.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from database import db
+from models import CompletionJob
+from leaderboard_cache import invalidate as invalidate_leaderboard
+from tournament_state import bump_version
+
+COMPLETION_STAGES = ('places', 'teammate_history', 'seasonal_points', 'payouts', 'career_stats')
+MAX_WORKERS = 2
+MAX_ATTEMPTS = 3
+STALE_RUNNING_AFTER = timedelta(minutes=5)
+SWEEP_INTERVAL_SECONDS = 60
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='completion')
+        return _executor
+
+
+def _stage_functions():
+    # Imported lazily: the stage implementations live alongside the scoring routes
+    from placements import update_final_places
+    from payouts import record_payouts
+    from career_stats import record_career_stats
+    from routes.matches import _update_teammate_history, _update_seasonal_points
+    return {
+        'places': update_final_places,
+        'teammate_history': _update_teammate_history,
+        'seasonal_points': _update_seasonal_points,
+        'payouts': record_payouts,
+        'career_stats': record_career_stats
+    }
+
+
+def _stage_reversals():
+    from placements import clear_final_places
+    from payouts import reverse_payouts
+    from career_stats import reverse_career_stats
+    from routes.matches import _reverse_teammate_history, _reverse_seasonal_points
+    return {
+        'places': clear_final_places,
+        'teammate_history': _reverse_teammate_history,
+        'seasonal_points': _reverse_seasonal_points,
+        'payouts': reverse_payouts,
+        'career_stats': reverse_career_stats
+    }
+
+
+def reverse_completion(job):
+    """Undo the stages a job has applied, newest first, in the current transaction"""
+    reversals = _stage_reversals()
+    for stage in reversed(COMPLETION_STAGES[:job.stages_done]):
+        reversals[stage](job.tournament_id)
+    job.stages_done = 0
+    job.attempts = 0
+    job.error = None
+
+
+def job_to_dict(job):
+    return {
+        'job_id': job.job_id,
+        'tournament_id': job.tournament_id,
+        'status': job.status,
+        'stage': COMPLETION_STAGES[job.stages_done] if job.stages_done < len(COMPLETION_STAGES) else None,
+        'stages_done': job.stages_done,
+        'stages_total': len(COMPLETION_STAGES),
+        'progress': round(100 * job.stages_done / len(COMPLETION_STAGES)),
+        'attempts': job.attempts,
+        'error': job.error
+    }
+
+
+def withdraw_completion(tournament_id):
+    """Reverse a finished job's stages and drop the job, for a tournament being reopened"""
+    job = CompletionJob.query.filter_by(tournament_id=tournament_id).first()
+    if job is not None:
+        reverse_completion(job)
+        db.session.delete(job)
+
+
+def queue_completion(tournament_id):
+    """Add (or re-queue) the completion job in the current transaction; submit it after commit
+
+    A tournament completed again after a rescore first has the previous run's
+    stages reversed, so the job starts over against the new results.
+    """
+    job = CompletionJob.query.filter_by(tournament_id=tournament_id).first()
+    if job is None:
+        job = CompletionJob(tournament_id=tournament_id, status='Queued', stages_done=0, attempts=0)
+        db.session.add(job)
+    elif job.status in ('Completed', 'Failed'):
+        reverse_completion(job)
+        job.status = 'Queued'
+    return job
+
+
+def submit_completion_job(job_id):
+    """Run a committed job on the worker pool (inline when COMPLETION_JOBS_INLINE is set)"""
+    app = current_app._get_current_object()
+    if app.config.get('COMPLETION_JOBS_INLINE'):
+        run_completion_job(app, job_id)
+    else:
+        _get_executor().submit(run_completion_job, app, job_id)
+
+
+def resume_pending_jobs(app):
+    """Re-queue stale Running jobs and submit every queued job; returns the submitted job ids"""
+    with app.app_context():
+        table = CompletionJob.__table__
+        db.session.execute(
+            table.update()
+            .where(table.c.status == 'Running', table.c.updated_at < datetime.utcnow() - STALE_RUNNING_AFTER)
+            .values(status='Queued')
+        )
+        db.session.commit()
+        job_ids = [job_id for (job_id,) in db.session.query(CompletionJob.job_id).filter_by(status='Queued').all()]
+        for job_id in job_ids:
+            submit_completion_job(job_id)
+    return job_ids
+
+
+def _sweep(app):
+    while True:
+        try:
+            resume_pending_jobs(app)
+        except Exception as e:
+            print(f"Completion job sweep failed: {e}")
+        time.sleep(SWEEP_INTERVAL_SECONDS)
+
+
+def start_job_sweeper(app):
+    """Resume interrupted jobs now and keep reclaiming stale ones from a daemon thread"""
+    threading.Thread(target=_sweep, args=(app,), name='completion-sweeper', daemon=True).start()
+
+
+def _claim(job_id):
+    """Move a queued job to Running; False if another worker already has it"""
+    table = CompletionJob.__table__
+    claimed = db.session.execute(
+        table.update()
+        .where(table.c.job_id == job_id, table.c.status == 'Queued')
+        .values(status='Running', attempts=table.c.attempts + 1)
+    ).rowcount
+    db.session.commit()
+    return claimed == 1
+
+
+def _emit(app, event, job):
+    socketio = app.extensions.get('socketio')
+    if socketio:
+        socketio.emit(event, job_to_dict(job), room=f'tournament_{job.tournament_id}')
+
+
+def run_completion_job(app, job_id):
+    """Run the remaining stages of a job, retrying failed stages up to MAX_ATTEMPTS"""
+    with app.app_context():
+        stages = _stage_functions()
+        while _claim(job_id):
+            job = CompletionJob.query.get(job_id)
+            try:
+                for index in range(job.stages_done, len(COMPLETION_STAGES)):
+                    stages[COMPLETION_STAGES[index]](job.tournament_id)
+                    bump_version(job.tournament_id)
+                    job.stages_done = index + 1
+                    db.session.commit()
+                    invalidate_leaderboard()
+                    _emit(app, 'tournament_completion_progress', job)
+
+                job.status = 'Completed'
+                job.error = None
+                db.session.commit()
+                _emit(app, 'tournament_completed', job)
+                return job.status
+            except Exception as e:
+                db.session.rollback()
+                job = CompletionJob.query.get(job_id)
+                if job is None:
+                    # Withdrawn while running, e.g. its tournament was deleted
+                    return None
+                job.error = str(e)[:255]
+                job.status = 'Failed' if job.attempts >= MAX_ATTEMPTS else 'Queued'
+                db.session.commit()
+                if job.status == 'Failed':
+                    _emit(app, 'tournament_completion_failed', job)
+                    return job.status
+        return None
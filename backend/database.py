@@ -1,3 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
+
+
+def expire_loaded(model, *attributes):
+    """Expire attributes on loaded instances after a Core UPDATE changed them behind the ORM"""
+    for instance in list(db.session.identity_map.values()):
+        if isinstance(instance, model):
+            db.session.expire(instance, attributes or None)
@@ -0,0 +1,114 @@
+"""
+In-process materialized leaderboard.
+
+Seasonal standings only move when a tournament finishes, is recalculated or
+deleted (or the player list itself changes), so each per-division, per-sort
+board is built once with ranks and tie-breaks already applied and served
+from memory until one of those writes calls invalidate().
+
+Every worker keeps its own copy, so invalidate() also bumps the shared
+'leaderboard' generation and each read checks it before trusting memory. A
+cold or stale board is filled with the window-function ranking query, which
+walks the (division, value DESC, player_id) indexes. The generation is the
+snapshot version and ETag, so every worker answers with the same one.
+"""
+
+import threading
+
+from cache_generations import bump_generation, current_generation
+from database import db
+from models import RegisteredPlayer
+
+GENERATION_NAME = 'leaderboard'
+DIVISIONS = ('Pro', 'Am', 'Junior')
+SORTS = ('points', 'cash')
+SORT_COLUMNS = {
+    'points': RegisteredPlayer.seasonal_points,
+    'cash': RegisteredPlayer.seasonal_cash
+}
+
+# Primary value first, the other seasonal total breaks ties, then name and id
+_SORT_KEYS = {
+    'points': lambda row: (-row['seasonal_points'], -row['seasonal_cash'], row['player_name'].lower(), row['player_id']),
+    'cash': lambda row: (-row['seasonal_cash'], -row['seasonal_points'], row['player_name'].lower(), row['player_id'])
+}
+
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+_snapshot = None
+
+
+class LeaderboardSnapshot:
+    """Ranked boards for one generation, keyed by (division or None for everyone, sort) and filled on first use"""
+
+    def __init__(self, version):
+        self.version = version
+        self.etag = f'lb-{version}'
+        self.boards = {}
+        self.positions = {}
+
+    def board(self, division, sort):
+        key = (division, sort)
+        if key not in self.boards:
+            with _build_lock:
+                if key not in self.boards:
+                    board = _load_board(division, sort)
+                    self.positions[key] = {row['player_id']: index for index, row in enumerate(board)}
+                    self.boards[key] = board
+        return self.boards[key]
+
+    def page(self, division, sort, after_player_id=None, limit=50):
+        """(rows, next_cursor) starting after the given player; KeyError if that player is not on the board"""
+        board = self.board(division, sort)
+        start = self.positions[(division, sort)][after_player_id] + 1 if after_player_id is not None else 0
+        rows = board[start:start + limit]
+        next_cursor = rows[-1]['player_id'] if start + limit < len(board) and rows else None
+        return rows, next_cursor
+
+
+def _load_board(division, sort):
+    """One board from the ranking query; ranks are shared by equal values, tie-breaks applied after"""
+    column = SORT_COLUMNS[sort]
+    query = db.session.query(
+        RegisteredPlayer.player_id,
+        RegisteredPlayer.player_name,
+        RegisteredPlayer.nickname,
+        RegisteredPlayer.division,
+        RegisteredPlayer.seasonal_points,
+        RegisteredPlayer.seasonal_cash,
+        db.func.rank().over(order_by=column.desc()).label('rank')
+    )
+    if division:
+        query = query.filter(RegisteredPlayer.division == division)
+    rows = query.order_by(column.desc(), RegisteredPlayer.player_id.asc()).all()
+
+    board = sorted(({
+        'player_id': row.player_id,
+        'player_name': row.player_name,
+        'nickname': row.nickname,
+        'division': row.division,
+        'seasonal_points': row.seasonal_points or 0,
+        'seasonal_cash': float(row.seasonal_cash or 0),
+        'rank': row.rank
+    } for row in rows), key=_SORT_KEYS[sort])
+    for position, row in enumerate(board, 1):
+        row['position'] = position
+    return board
+
+
+def get_snapshot():
+    """Snapshot for the current shared generation, replacing ours if another worker has moved it on"""
+    global _snapshot
+    generation = current_generation(GENERATION_NAME)
+    with _lock:
+        if _snapshot is None or _snapshot.version != generation:
+            _snapshot = LeaderboardSnapshot(generation)
+        return _snapshot
+
+
+def invalidate():
+    """Drop boards after a committed write that changes standings, in this and every other worker"""
+    global _snapshot
+    with _lock:
+        _snapshot = None
+    bump_generation(GENERATION_NAME)
@@ -49,6 +49,15 @@ class SeasonStanding(db.Model):
     season_year = db.Column(db.Integer, primary_key=True)
     division = db.Column(db.Enum('Pro', 'Am', 'Junior'), nullable=False)
     final_place = db.Column(db.Integer)
+    seasonal_points = db.Column(db.Integer, nullable=False, default=0)
+    seasonal_cash = db.Column(db.Numeric(10, 2), nullable=False, default=0.00)
+
+class Season(db.Model):
+    __tablename__ = 'seasons'
+    
+    season_year = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    players_ranked = db.Column(db.Integer, nullable=False, default=0)
+    closed_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class Tournament(db.Model):
     __tablename__ = 'tournaments'
@@ -59,6 +68,8 @@ class Tournament(db.Model):
     total_teams = db.Column(db.Integer)
     ace_pot_payout = db.Column(db.Numeric(10, 2), default=0.00)
     stations = db.Column(db.Integer, default=6)
+    auto_dispatch = db.Column(db.Boolean, default=False)
+    version = db.Column(db.Integer, nullable=False, default=1)
 
 class AcePot(db.Model):
     __tablename__ = 'ace_pot'
@@ -68,6 +79,82 @@ class AcePot(db.Model):
     date = db.Column(db.Date, nullable=False)
     description = db.Column(db.String(255), nullable=False)
     amount = db.Column(db.Numeric(10, 2), nullable=False)
+    balance_after = db.Column(db.Numeric(10, 2), nullable=False, default=0.00)
+
+class AcePotBalance(db.Model):
+    __tablename__ = 'ace_pot_balance'
+    
+    balance_id = db.Column(db.Integer, primary_key=True)
+    balance = db.Column(db.Numeric(10, 2), nullable=False, default=0.00)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class Payout(db.Model):
+    __tablename__ = 'payouts'
+    
+    payout_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournaments.tournament_id'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('registered_players.player_id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.team_id'), nullable=False)
+    final_place = db.Column(db.Integer, nullable=False)
+    amount = db.Column(db.Numeric(10, 2), nullable=False)
+    ace_pot_amount = db.Column(db.Numeric(10, 2), default=0.00)
+
+class CompletionJob(db.Model):
+    __tablename__ = 'completion_jobs'
+    
+    job_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournaments.tournament_id'), nullable=False, unique=True)
+    status = db.Column(db.Enum('Queued', 'Running', 'Completed', 'Failed'), nullable=False, default='Queued')
+    stages_done = db.Column(db.Integer, nullable=False, default=0)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class CacheGeneration(db.Model):
+    __tablename__ = 'cache_generations'
+    
+    name = db.Column(db.String(50), primary_key=True)
+    generation = db.Column(db.BigInteger, nullable=False, default=0)
+
+class PlayerTournamentStats(db.Model):
+    __tablename__ = 'player_tournament_stats'
+    
+    player_id = db.Column(db.Integer, db.ForeignKey('registered_players.player_id'), primary_key=True)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournaments.tournament_id'), primary_key=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.team_id'), nullable=False)
+    final_place = db.Column(db.Integer)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    won_ace_pot = db.Column(db.Boolean, nullable=False, default=False)
+
+class PlayerCareerStats(db.Model):
+    __tablename__ = 'player_career_stats'
+    
+    player_id = db.Column(db.Integer, db.ForeignKey('registered_players.player_id'), primary_key=True)
+    tournaments_played = db.Column(db.Integer, nullable=False, default=0)
+    match_wins = db.Column(db.Integer, nullable=False, default=0)
+    match_losses = db.Column(db.Integer, nullable=False, default=0)
+    podiums = db.Column(db.Integer, nullable=False, default=0)
+    ace_pots_won = db.Column(db.Integer, nullable=False, default=0)
+    place_total = db.Column(db.Integer, nullable=False, default=0)
+    places_counted = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class PlayerRating(db.Model):
+    __tablename__ = 'player_ratings'
+    
+    player_id = db.Column(db.Integer, db.ForeignKey('registered_players.player_id'), primary_key=True)
+    rating = db.Column(db.Float, nullable=False, default=1500.0)
+    matches_rated = db.Column(db.Integer, nullable=False, default=0)
+
+class PlayerRatingChange(db.Model):
+    __tablename__ = 'player_rating_changes'
+    
+    tournament_id = db.Column(db.Integer, db.ForeignKey('tournaments.tournament_id'), primary_key=True)
+    match_id = db.Column(db.Integer, primary_key=True)
+    player_id = db.Column(db.Integer, db.ForeignKey('registered_players.player_id'), primary_key=True)
+    delta = db.Column(db.Float, nullable=False)
 
 class Team(db.Model):
     __tablename__ = 'teams'
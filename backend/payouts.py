@@ -0,0 +1,134 @@
+"""
+Cash payouts for completed tournaments.
+
+record_payouts works out what each player on the first and second place teams
+is owed, writes one payouts row per player in a single insert and credits
+seasonal_cash from those rows with one set-based UPDATE. The payouts table is
+the record of what was actually paid, so reverse_payouts undoes a tournament
+by subtracting exactly those rows (and dropping its ace pot payout entry)
+instead of re-deriving the amounts.
+"""
+
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from ace_pot_ledger import add_ace_pot_entry, current_balance, delete_ace_pot_entries
+from database import db, expire_loaded
+from models import AcePot, Match, Payout, RegisteredPlayer, Team, Tournament, TournamentRegistration
+
+
+def _place_payouts(total_payout_pot):
+    """(first_place_payout, second_place_payout) for a pot"""
+    if total_payout_pot <= 60:
+        second_place_payout = 20
+    else:
+        second_place_payout = min(40, total_payout_pot - 40) if total_payout_pot > 40 else 0
+    return total_payout_pot - second_place_payout, second_place_payout
+
+
+def _went_undefeated(tournament_id, team_id):
+    """True if the team lost none of its completed matches (byes excluded)"""
+    results = db.session.query(Match.team1_id, Match.team1_score, Match.team2_score).filter(
+        Match.tournament_id == tournament_id,
+        Match.match_status == 'Completed',
+        Match.team2_id.isnot(None),
+        db.or_(Match.team1_id == team_id, Match.team2_id == team_id)
+    ).all()
+    return all((team1_score > team2_score) == (team1_id == team_id) for team1_id, team1_score, team2_score in results)
+
+
+def _apply_ledger(tournament_id, credit):
+    """Add (or subtract) each player's recorded payouts to seasonal_cash in one UPDATE"""
+    players = RegisteredPlayer.__table__
+    ledger = Payout.__table__
+    total = select(db.func.sum(ledger.c.amount)).where(
+        ledger.c.tournament_id == tournament_id,
+        ledger.c.player_id == players.c.player_id
+    ).scalar_subquery()
+
+    db.session.execute(
+        players.update()
+        .where(players.c.player_id.in_(select(ledger.c.player_id).where(ledger.c.tournament_id == tournament_id)))
+        .values(seasonal_cash=db.func.coalesce(players.c.seasonal_cash, 0) + (total if credit else -total))
+    )
+    expire_loaded(RegisteredPlayer, 'seasonal_cash')
+
+
+def record_payouts(tournament_id):
+    """Pay out a completed tournament and record every payment in the ledger; returns the rows written"""
+    total_participants = db.session.query(db.func.count(TournamentRegistration.player_id)).filter(
+        TournamentRegistration.tournament_id == tournament_id
+    ).scalar()
+    first_place_payout, second_place_payout = _place_payouts(5 * total_participants)
+
+    placed_teams = db.session.query(
+        Team.team_id, Team.player1_id, Team.player2_id, Team.is_ghost_team, Team.final_place
+    ).filter(Team.tournament_id == tournament_id, Team.final_place.in_((1, 2))).order_by(Team.final_place).all()
+    first_place_team = next((team for team in placed_teams if team.final_place == 1), None)
+
+    # Undefeated champions take the whole ace pot across all tournaments
+    ace_pot_payout = 0
+    if first_place_team and _went_undefeated(tournament_id, first_place_team.team_id):
+        ace_pot_payout = current_balance(lock=True) or 0
+        first_place_payout += ace_pot_payout
+
+        if ace_pot_payout > 0:
+            names = dict(db.session.query(RegisteredPlayer.player_id, RegisteredPlayer.player_name).filter(
+                RegisteredPlayer.player_id.in_([first_place_team.player1_id, first_place_team.player2_id])
+            ).all())
+            if first_place_team.player2_id in names and not first_place_team.is_ghost_team:
+                team_names = f"{names[first_place_team.player1_id]} & {names[first_place_team.player2_id]}"
+            else:
+                team_names = names.get(first_place_team.player1_id)
+
+            add_ace_pot_entry(tournament_id, db.func.current_date(), f'Ace pot payout to {team_names}', -ace_pot_payout)
+
+    tournament = Tournament.query.get(tournament_id)
+    if tournament:
+        tournament.ace_pot_payout = ace_pot_payout
+
+    # Only registered players are paid
+    candidates = [player_id for team in placed_teams for player_id in (team.player1_id, team.player2_id) if player_id]
+    registered = {player_id for (player_id,) in db.session.query(TournamentRegistration.player_id).filter(
+        TournamentRegistration.tournament_id == tournament_id,
+        TournamentRegistration.player_id.in_(candidates)
+    ).all()} if candidates else set()
+
+    rows = []
+    paid = set()
+    for team in placed_teams:
+        teammates_count = 2 if team.player2_id and not team.is_ghost_team else 1
+        team_payout = first_place_payout if team.final_place == 1 else second_place_payout
+        team_ace_pot = ace_pot_payout if team.final_place == 1 else 0
+        for player_id in (team.player1_id, team.player2_id):
+            if player_id not in registered or player_id in paid:
+                continue
+            paid.add(player_id)
+            rows.append({
+                'tournament_id': tournament_id,
+                'player_id': player_id,
+                'team_id': team.team_id,
+                'final_place': team.final_place,
+                'amount': Decimal(str(team_payout / teammates_count)),
+                'ace_pot_amount': Decimal(str(team_ace_pot / teammates_count))
+            })
+
+    if rows:
+        db.session.execute(Payout.__table__.insert(), rows)
+        _apply_ledger(tournament_id, credit=True)
+    return rows
+
+
+def reverse_payouts(tournament_id):
+    """Undo exactly what the ledger recorded for a tournament; returns the number of rows reversed"""
+    reversed_rows = Payout.query.filter_by(tournament_id=tournament_id).count()
+    if reversed_rows:
+        _apply_ledger(tournament_id, credit=False)
+        Payout.query.filter_by(tournament_id=tournament_id).delete()
+
+    delete_ace_pot_entries(AcePot.tournament_id == tournament_id, AcePot.amount < 0)
+    tournament = Tournament.query.get(tournament_id)
+    if tournament:
+        tournament.ace_pot_payout = 0
+    return reversed_rows
@@ -0,0 +1,134 @@
+"""
+Final placement for a completed tournament.
+
+The championship decides 1st and 2nd. Every other team is placed by when it
+was eliminated: walking completed matches from the last one played backwards,
+each loser that has no place yet takes the next place from 3rd down. Teams
+knocked out in the same round also form a tie group that shares the best place
+of that round, which the audit view reports next to the sequential place.
+
+calculate_placements works on already-loaded rows; update_final_places loads a
+tournament's matches once and writes every final_place in one UPDATE.
+team_match_stats folds the same completed matches into per-team win/loss
+counts for points and career stats.
+"""
+
+from sqlalchemy import case
+
+from database import db, expire_loaded
+from models import Match, Team
+
+
+def match_result(match):
+    """(winner_id, loser_id) of a completed match; byes have no loser"""
+    if match.team2_id is None:
+        return match.team1_id, None
+    if match.team1_score > match.team2_score:
+        return match.team1_id, match.team2_id
+    return match.team2_id, match.team1_id
+
+
+def team_match_stats(tournament_id):
+    """Wins and losses per team from one pass over the tournament's completed matches (byes excluded)"""
+    results = db.session.query(Match.team1_id, Match.team2_id, Match.team1_score, Match.team2_score).filter(
+        Match.tournament_id == tournament_id,
+        Match.match_status == 'Completed',
+        Match.team2_id.isnot(None)
+    ).all()
+
+    stats = {}
+    for result in results:
+        winner_id, loser_id = match_result(result)
+        stats.setdefault(winner_id, {'wins': 0, 'losses': 0})['wins'] += 1
+        stats.setdefault(loser_id, {'wins': 0, 'losses': 0})['losses'] += 1
+    return stats
+
+
+def calculate_placements(matches, current_places=None):
+    """Finishing order from completed matches.
+
+    current_places maps every team_id in the tournament to its current
+    final_place (or None); teams that already have a place are not moved,
+    except 1st and 2nd which always follow the championship. Returns
+    (places, tie_groups) where places maps team_id to a newly assigned place and
+    tie_groups lists the teams eliminated together in each round.
+    """
+    places_so_far = dict(current_places or {})
+    places = {}
+
+    # Find championship matches to determine 1st and 2nd
+    championship_matches = [m for m in matches if m.round_type == 'Championship' and m.match_status == 'Completed']
+    if championship_matches:
+        final_match = max(championship_matches, key=lambda m: m.round_number)
+        winner_id, runner_up_id = match_result(final_match)
+        for team_id, place in ((winner_id, 1), (runner_up_id, 2)):
+            if team_id in places_so_far:
+                places[team_id] = places_so_far[team_id] = place
+
+    # Latest eliminations first; championship matches are already handled
+    eliminations = sorted(
+        (m for m in matches if m.round_type != 'Championship' and m.match_status == 'Completed'),
+        key=lambda m: m.match_order, reverse=True
+    )
+
+    tie_groups = []
+    current_place = 3
+    for match in eliminations:
+        losing_team_id = match_result(match)[1]
+        if losing_team_id not in places_so_far or places_so_far[losing_team_id]:
+            continue
+
+        places[losing_team_id] = places_so_far[losing_team_id] = current_place
+        round_key = (match.round_type, match.round_number)
+        if tie_groups and tie_groups[-1]['round'] == round_key:
+            tie_groups[-1]['team_ids'].append(losing_team_id)
+        else:
+            tie_groups.append({'round': round_key, 'place': current_place, 'team_ids': [losing_team_id]})
+        current_place += 1
+
+    return places, [{
+        'round_type': group['round'][0],
+        'round_number': group['round'][1],
+        'place': group['place'],
+        'team_ids': group['team_ids']
+    } for group in tie_groups]
+
+
+def update_final_places(tournament_id, preserve_existing=True):
+    """Compute and store final places from one match load and a single UPDATE.
+
+    With preserve_existing=False every place is recomputed from the bracket,
+    discarding manual overrides. Returns the tie groups.
+    """
+    matches = db.session.query(
+        Match.round_type, Match.round_number, Match.match_order, Match.match_status,
+        Match.team1_id, Match.team2_id, Match.team1_score, Match.team2_score
+    ).filter(Match.tournament_id == tournament_id, Match.match_status == 'Completed').all()
+
+    teams = db.session.query(Team.team_id, Team.final_place).filter(Team.tournament_id == tournament_id).all()
+    current_places = {team_id: (final_place if preserve_existing else None) for team_id, final_place in teams}
+
+    places, tie_groups = calculate_placements(matches, current_places)
+
+    team_table = Team.__table__
+    if not preserve_existing:
+        values = {'final_place': case(places, value=team_table.c.team_id, else_=None) if places else None}
+        db.session.execute(team_table.update().where(team_table.c.tournament_id == tournament_id).values(values))
+    elif places:
+        db.session.execute(
+            team_table.update()
+            .where(team_table.c.team_id.in_(list(places)))
+            .values(final_place=case(places, value=team_table.c.team_id))
+        )
+    expire_loaded(Team, 'final_place')
+
+    return tie_groups
+
+
+def clear_final_places(tournament_id):
+    """Drop every team's final place with one UPDATE"""
+    team_table = Team.__table__
+    db.session.execute(
+        team_table.update().where(team_table.c.tournament_id == tournament_id).values(final_place=None)
+    )
+    expire_loaded(Team, 'final_place')
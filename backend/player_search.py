@@ -0,0 +1,243 @@
+"""
+In-process typeahead index over player names and nicknames.
+
+Normalized names sit in one sorted list, so name prefixes come out of a bisect
+already in result order. The other words of a name and the nickname sit in a
+second sorted token list. Trigram postings, each kept in name order, catch
+matches in the middle of a word and small typos once the query has three or
+more characters. Every tier stops scanning as soon as it has enough results,
+which keeps lookups well under a millisecond for large player bases.
+
+The index is built from one query on first use and then kept current by
+index_players() after each committed create or update. It lives per process,
+so writes also bump the shared 'player_search' generation and every search
+rebuilds the index first if another worker has moved it on.
+"""
+
+import heapq
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+
+from cache_generations import bump_generation, current_generation
+from database import db
+from models import RegisteredPlayer
+
+GENERATION_NAME = 'player_search'
+
+# Ranking tiers, best first
+EXACT, NAME_PREFIX, WORD_PREFIX, SUBSTRING, FUZZY = range(5)
+MIN_SIMILARITY = 0.5
+# Most players a fuzzy lookup will score
+FUZZY_CANDIDATES = 2000
+MAX_LIMIT = 50
+
+
+def normalize(text):
+    """Lower-case, accent-free, single-spaced form used for matching"""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return ' '.join(text.lower().split())
+
+
+def _trigrams(text):
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _remove_sorted(items, item):
+    index = bisect_left(items, item)
+    if index < len(items) and items[index] == item:
+        del items[index]
+
+
+class PlayerSearchIndex:
+    """Prefix and trigram index of (player_id, player_name, nickname, division)"""
+
+    def __init__(self, players=()):
+        self.players = {}
+        self.normalized = {}
+        self.trigram_sets = {}
+        self.names = []
+        self.words = []
+        self.trigrams = {}
+        for player in players:
+            self._store(*player)
+
+        # Bulk build sorts each list once instead of inserting entry by entry
+        for player_id, (name, _) in self.normalized.items():
+            self.names.append((name, player_id))
+            self.words.extend(self._words(player_id))
+            for trigram in self.trigram_sets[player_id]:
+                self.trigrams.setdefault(trigram, []).append((name, player_id))
+        self.names.sort()
+        self.words.sort()
+        for postings in self.trigrams.values():
+            postings.sort()
+
+    def _store(self, player_id, player_name, nickname=None, division=None):
+        self.players[player_id] = {
+            'player_id': player_id,
+            'player_name': player_name,
+            'nickname': nickname,
+            'division': division
+        }
+        name, nickname = self.normalized[player_id] = (normalize(player_name), normalize(nickname))
+        self.trigram_sets[player_id] = _trigrams(name) | (_trigrams(nickname) if nickname else set())
+
+    def _words(self, player_id):
+        """(token, name, player_id) entries for every word after the first and the nickname"""
+        name, nickname = self.normalized[player_id]
+        tokens = set(name.split()[1:])
+        if nickname:
+            tokens |= {nickname} | set(nickname.split())
+        return [(token, name, player_id) for token in tokens]
+
+    def add(self, player_id, player_name, nickname=None, division=None):
+        """Insert or replace one player"""
+        self.remove(player_id)
+        self._store(player_id, player_name, nickname, division)
+        name = self.normalized[player_id][0]
+        insort(self.names, (name, player_id))
+        for entry in self._words(player_id):
+            insort(self.words, entry)
+        for trigram in self.trigram_sets[player_id]:
+            insort(self.trigrams.setdefault(trigram, []), (name, player_id))
+
+    def remove(self, player_id):
+        if player_id not in self.players:
+            return
+        name = self.normalized[player_id][0]
+        _remove_sorted(self.names, (name, player_id))
+        for entry in self._words(player_id):
+            _remove_sorted(self.words, entry)
+        for trigram in self.trigram_sets[player_id]:
+            postings = self.trigrams[trigram]
+            _remove_sorted(postings, (name, player_id))
+            if not postings:
+                del self.trigrams[trigram]
+        del self.players[player_id]
+        del self.normalized[player_id]
+        del self.trigram_sets[player_id]
+
+    def search(self, query, limit=10, division=None):
+        """Best matches first as player dicts with their match tier and similarity"""
+        query = normalize(query)
+        if not query or limit <= 0:
+            return []
+
+        # player_id -> (tier, -similarity, order within the tier)
+        found = {}
+
+        def take(player_id, tier, order, similarity=1.0):
+            if player_id in found:
+                return False
+            if division is not None and self.players[player_id]['division'] != division:
+                return False
+            found[player_id] = (tier, -similarity, order)
+            return True
+
+        # Names starting with the query, in name order; exact names sort first
+        taken = 0
+        index = bisect_left(self.names, (query,))
+        while taken < limit and index < len(self.names) and self.names[index][0].startswith(query):
+            name, player_id = self.names[index]
+            taken += take(player_id, EXACT if name == query else NAME_PREFIX, (name,))
+            index += 1
+
+        # Later words and nicknames starting with the query, best token first
+        taken = 0
+        index = bisect_left(self.words, (query,))
+        while taken < limit and index < len(self.words) and self.words[index][0].startswith(query):
+            token, name, player_id = self.words[index]
+            exact = token == query == self.normalized[player_id][1]
+            taken += take(player_id, EXACT if exact else WORD_PREFIX, (token, name))
+            index += 1
+
+        if len(found) < limit and len(query) >= 3:
+            self._search_trigrams(query, limit - len(found), take)
+
+        ranked = heapq.nsmallest(limit, found, key=lambda player_id: (found[player_id], player_id))
+        return [dict(self.players[player_id], tier=found[player_id][0], score=round(-found[player_id][1], 3))
+                for player_id in ranked]
+
+    def _search_trigrams(self, query, wanted, take):
+        """Fill in mid-word matches, then typos sharing enough trigrams with the query"""
+        query_trigrams = _trigrams(query)
+        postings = sorted((self.trigrams[trigram] for trigram in query_trigrams if trigram in self.trigrams), key=len)
+
+        # Substrings contain every interior trigram, so the rarest one lists them all in name order
+        interior = {query[i:i + 3] for i in range(len(query) - 2)}
+        rarest = min((self.trigrams.get(trigram, []) for trigram in interior), key=len)
+        taken = 0
+        for name, player_id in rarest:
+            if taken >= wanted:
+                return
+            if any(query in text for text in self.normalized[player_id]):
+                taken += take(player_id, SUBSTRING, (name,))
+
+        # A fuzzy match shares at least MIN_SIMILARITY of the query's trigrams, so it
+        # appears in one of the rarest (1 - MIN_SIMILARITY) of them plus one
+        needed = max(1, int(len(query_trigrams) * MIN_SIMILARITY + 0.999))
+        candidates = {}
+        for trigram_postings in postings[:len(query_trigrams) - needed + 1]:
+            if len(candidates) + len(trigram_postings) > FUZZY_CANDIDATES:
+                break
+            for name, player_id in trigram_postings:
+                candidates[player_id] = name
+        for player_id, name in candidates.items():
+            similarity = len(query_trigrams & self.trigram_sets[player_id]) / len(query_trigrams)
+            if similarity >= MIN_SIMILARITY:
+                take(player_id, FUZZY, (name,), similarity)
+
+
+_lock = threading.Lock()
+_index = None
+_generation = None
+
+
+def _build():
+    rows = db.session.query(
+        RegisteredPlayer.player_id,
+        RegisteredPlayer.player_name,
+        RegisteredPlayer.nickname,
+        RegisteredPlayer.division
+    ).all()
+    return PlayerSearchIndex(tuple(row) for row in rows)
+
+
+def _current_index():
+    """Local index, rebuilt when the shared generation has moved past the one it was built at"""
+    global _index, _generation
+    generation = current_generation(GENERATION_NAME)
+    if _index is None or _generation != generation:
+        _index = _build()
+        _generation = generation
+    return _index
+
+
+def search_players(query, limit=10, division=None):
+    """Ranked typeahead matches, building the index on first use"""
+    with _lock:
+        return _current_index().search(query, min(limit, MAX_LIMIT), division)
+
+
+def index_players(players):
+    """Add or refresh committed players here and tell the other workers to rebuild"""
+    global _generation
+    with _lock:
+        if _index is not None:
+            for player in players:
+                _index.add(player.player_id, player.player_name, player.nickname, player.division)
+        expected = _generation + 1 if _generation is not None else None
+        generation = bump_generation(GENERATION_NAME)
+        # Only still current if no other worker wrote in between
+        _generation = generation if generation == expected else None
+
+
+def invalidate():
+    """Drop the index so the next search in every worker rebuilds it"""
+    global _index
+    with _lock:
+        _index = None
+        bump_generation(GENERATION_NAME)
@@ -0,0 +1,180 @@
+"""
+Incremental player ratings.
+
+Every scored non-bye match moves the ratings of its players Elo-style: a
+team is rated as the mean of its players, the expected result comes from
+the gap between the two teams, and each player moves by their own K factor
+times the surprise. New players use a larger K until they have a few rated
+matches, so they find their level quickly. A match touches one row per
+player in player_ratings and writes one player_rating_changes row per
+player, so scoring stays O(1) per match.
+
+Like the payouts ledger, those change rows are what gets subtracted again
+when a result is rescored, cleared by a rescore upstream or deleted with its
+tournament. backfill_ratings() rebuilds both tables from every completed
+match in one streaming pass, oldest tournament first.
+
+generate_matches seeds teams by rating, strongest first, into standard bracket
+positions: the best teams take the byes and cannot meet each other early.
+"""
+
+from sqlalchemy.orm import aliased
+
+from database import db
+from models import Match, PlayerRating, PlayerRatingChange, Team, Tournament
+
+INITIAL_RATING = 1500.0
+# Rating gap at which the stronger team is expected to win ten times out of eleven
+RATING_SCALE = 400.0
+K_FACTOR = 24.0
+PROVISIONAL_K_FACTOR = 48.0
+PROVISIONAL_MATCHES = 10
+# Matches read per fetch and change rows per executemany in the backfill
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def k_factor(matches_rated):
+    return PROVISIONAL_K_FACTOR if matches_rated < PROVISIONAL_MATCHES else K_FACTOR
+
+
+def match_deltas(team1, team2, team1_won):
+    """{player_id: rating change} for one result; teams are lists of (player_id, rating, matches_rated)"""
+    team1_rating = sum(rating for _, rating, _ in team1) / len(team1)
+    team2_rating = sum(rating for _, rating, _ in team2) / len(team2)
+    team1_expected = 1 / (1 + 10 ** ((team2_rating - team1_rating) / RATING_SCALE))
+    team1_surprise = (1.0 if team1_won else 0.0) - team1_expected
+
+    deltas = {player_id: k_factor(matches_rated) * team1_surprise for player_id, _, matches_rated in team1}
+    deltas.update({player_id: -k_factor(matches_rated) * team1_surprise for player_id, _, matches_rated in team2})
+    return deltas
+
+
+def _load_ratings(player_ids):
+    """{player_id: PlayerRating} with row locks, adding unrated players at the initial rating"""
+    ratings = {rating.player_id: rating for rating in PlayerRating.query.filter(
+        PlayerRating.player_id.in_(player_ids)
+    ).with_for_update()} if player_ids else {}
+    for player_id in player_ids:
+        if player_id not in ratings:
+            ratings[player_id] = PlayerRating(player_id=player_id, rating=INITIAL_RATING, matches_rated=0)
+            db.session.add(ratings[player_id])
+    return ratings
+
+
+def rate_match(match):
+    """Apply a completed non-bye match to its players' ratings and record the changes"""
+    if match.match_status != 'Completed' or not match.team1_id or not match.team2_id:
+        return
+    rosters = {team_id: [p for p in (player1_id, player2_id) if p] for team_id, player1_id, player2_id in db.session.query(
+        Team.team_id, Team.player1_id, Team.player2_id
+    ).filter(Team.team_id.in_([match.team1_id, match.team2_id]))}
+    team1_players, team2_players = rosters.get(match.team1_id), rosters.get(match.team2_id)
+    if not team1_players or not team2_players:
+        return
+
+    ratings = _load_ratings(team1_players + team2_players)
+    deltas = match_deltas(
+        [(p, ratings[p].rating, ratings[p].matches_rated) for p in team1_players],
+        [(p, ratings[p].rating, ratings[p].matches_rated) for p in team2_players],
+        match.team1_score > match.team2_score
+    )
+    for player_id, delta in deltas.items():
+        ratings[player_id].rating += delta
+        ratings[player_id].matches_rated += 1
+        db.session.add(PlayerRatingChange(
+            tournament_id=match.tournament_id, match_id=match.match_id, player_id=player_id, delta=delta
+        ))
+
+
+def _reverse(*criteria):
+    changes = PlayerRatingChange.query.filter(*criteria).all()
+    if not changes:
+        return 0
+    ratings = _load_ratings(sorted({change.player_id for change in changes}))
+    for change in changes:
+        ratings[change.player_id].rating -= change.delta
+        ratings[change.player_id].matches_rated -= 1
+        db.session.delete(change)
+    return len(changes)
+
+
+def unrate_matches(tournament_id, match_ids):
+    """Take back the rating changes of results that no longer stand; returns the rows reversed"""
+    if not match_ids:
+        return 0
+    return _reverse(PlayerRatingChange.tournament_id == tournament_id, PlayerRatingChange.match_id.in_(match_ids))
+
+
+def reverse_ratings(tournament_id):
+    """Take back every rating change from a tournament; returns the rows reversed"""
+    return _reverse(PlayerRatingChange.tournament_id == tournament_id)
+
+
+def seed_by_rating(teams):
+    """Renumber seed_number strongest team first and return the team ids in seed order"""
+    player_ids = {p for team in teams for p in (team.player1_id, team.player2_id) if p}
+    ratings = dict(db.session.query(PlayerRating.player_id, PlayerRating.rating).filter(
+        PlayerRating.player_id.in_(player_ids)
+    )) if player_ids else {}
+
+    def team_rating(team):
+        players = [p for p in (team.player1_id, team.player2_id) if p]
+        return sum(ratings.get(p, INITIAL_RATING) for p in players) / len(players)
+
+    # Equal ratings keep the pairing order, so a field of new players keeps its seed numbers
+    ordered = sorted(teams, key=lambda team: (-team_rating(team), team.seed_number or 0, team.team_id))
+    for seed, team in enumerate(ordered, 1):
+        team.seed_number = seed
+    return [team.team_id for team in ordered]
+
+
+def backfill_ratings():
+    """Rebuild ratings and their change rows by replaying every completed match; returns (matches, players)"""
+    PlayerRatingChange.query.delete()
+    PlayerRating.query.delete()
+
+    team1, team2 = aliased(Team), aliased(Team)
+    results = db.session.query(
+        Match.tournament_id, Match.match_id, Match.team1_score, Match.team2_score,
+        team1.player1_id, team1.player2_id, team2.player1_id, team2.player2_id
+    ).join(
+        Tournament, Tournament.tournament_id == Match.tournament_id
+    ).join(
+        team1, team1.team_id == Match.team1_id
+    ).join(
+        team2, team2.team_id == Match.team2_id
+    ).filter(
+        Match.match_status == 'Completed'
+    ).order_by(
+        Tournament.tournament_date, Match.tournament_id, Match.match_order
+    ).yield_per(BACKFILL_CHUNK_SIZE)
+
+    # player_id -> [rating, matches_rated]; change rows are held until the stream is closed,
+    # since a streaming cursor keeps the connection busy
+    ratings = {}
+    changes = []
+    matches_rated = 0
+    for tournament_id, match_id, team1_score, team2_score, *players in results:
+        for player_id in players:
+            if player_id and player_id not in ratings:
+                ratings[player_id] = [INITIAL_RATING, 0]
+        team1_players = [p for p in players[:2] if p]
+        team2_players = [p for p in players[2:] if p]
+        deltas = match_deltas(
+            [(p, *ratings[p]) for p in team1_players],
+            [(p, *ratings[p]) for p in team2_players],
+            team1_score > team2_score
+        )
+        for player_id, delta in deltas.items():
+            ratings[player_id][0] += delta
+            ratings[player_id][1] += 1
+            changes.append({'tournament_id': tournament_id, 'match_id': match_id, 'player_id': player_id, 'delta': delta})
+        matches_rated += 1
+
+    for start in range(0, len(changes), BACKFILL_CHUNK_SIZE):
+        db.session.execute(PlayerRatingChange.__table__.insert(), changes[start:start + BACKFILL_CHUNK_SIZE])
+    rows = [{'player_id': player_id, 'rating': rating, 'matches_rated': rated}
+            for player_id, (rating, rated) in ratings.items()]
+    for start in range(0, len(rows), BACKFILL_CHUNK_SIZE):
+        db.session.execute(PlayerRating.__table__.insert(), rows[start:start + BACKFILL_CHUNK_SIZE])
+    return matches_rated, len(ratings)
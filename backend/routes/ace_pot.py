@@ -1,16 +1,47 @@
-from flask import Blueprint, jsonify
-from database import db
+from flask import Blueprint, jsonify, request
 from models import AcePot
+from ace_pot_ledger import current_balance
 
 ace_pot_bp = Blueprint('ace_pot', __name__)
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
 @ace_pot_bp.route('/api/ace-pot', methods=['GET'])
 def get_ace_pot_entries():
-    entries = AcePot.query.order_by(AcePot.date.asc(), AcePot.ace_pot_id.asc()).all()
-    return jsonify([{
-        'ace_pot_id': entry.ace_pot_id,
-        'tournament_id': entry.tournament_id,
-        'date': entry.date.isoformat(),
-        'description': entry.description,
-        'amount': float(entry.amount)
-    } for entry in entries])
+    """Ace pot history in ledger order, paged by ace_pot_id cursor, with running balances"""
+    try:
+        limit = min(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        cursor = int(request.args['cursor']) if request.args.get('cursor') else None
+    except ValueError:
+        return jsonify({'error': 'limit and cursor must be integers'}), 400
+    if limit < 1:
+        return jsonify({'error': 'limit must be positive'}), 400
+    
+    newest_first = request.args.get('order', 'asc') == 'desc'
+    query = AcePot.query
+    if cursor is not None:
+        query = query.filter(AcePot.ace_pot_id < cursor if newest_first else AcePot.ace_pot_id > cursor)
+    query = query.order_by(AcePot.ace_pot_id.desc() if newest_first else AcePot.ace_pot_id.asc())
+    
+    # One extra row tells us whether there is another page
+    entries = query.limit(limit + 1).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    
+    return jsonify({
+        'entries': [{
+            'ace_pot_id': entry.ace_pot_id,
+            'tournament_id': entry.tournament_id,
+            'date': entry.date.isoformat(),
+            'description': entry.description,
+            'amount': float(entry.amount),
+            'running_balance': float(entry.balance_after)
+        } for entry in entries],
+        'next_cursor': entries[-1].ace_pot_id if has_more else None,
+        'balance': float(current_balance())
+    })
+
+@ace_pot_bp.route('/api/ace-pot/balance', methods=['GET'])
+def get_ace_pot_balance():
+    return jsonify({'balance': float(current_balance())})
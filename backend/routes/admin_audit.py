@@ -1,9 +1,16 @@
 from flask import Blueprint, jsonify, request
 from database import db
-from models import Tournament, Team, Match, RegisteredPlayer, TeamHistory, AcePot
+from models import CompletionJob, Tournament, Team, Match, RegisteredPlayer, TeamHistory, AcePot
 from routes.auth import require_auth
 from sqlalchemy import text
 from decimal import Decimal
+from placements import calculate_placements, update_final_places
+from payouts import record_payouts, reverse_payouts
+from career_stats import record_career_stats, reverse_career_stats
+from seasons import season_closed
+from team_roster import load_roster
+from tournament_state import bump_version
+from leaderboard_cache import invalidate as invalidate_leaderboard
 
 admin_audit_bp = Blueprint('admin_audit', __name__)
 
@@ -16,27 +23,32 @@ def get_tournament_audit_data(tournament_id):
         return jsonify({'error': 'Tournament not found'}), 404
     
     # Get all teams with player info
-    teams = Team.query.filter_by(tournament_id=tournament_id).all()
+    teams = load_roster(tournament_id)
+    
+    # Get all matches
+    matches = Match.query.filter_by(tournament_id=tournament_id).order_by(Match.match_order).all()
+    
+    # Bracket-derived places, with teams eliminated in the same round sharing a tied place
+    computed_places, tie_groups = calculate_placements(matches, {team.team_id: None for team in teams})
+    tied_places = {team_id: place for team_id, place in computed_places.items() if place <= 2}
+    for group in tie_groups:
+        tied_places.update({team_id: group['place'] for team_id in group['team_ids']})
     
     teams_data = []
     for team in teams:
-        # Get player names
-        player1 = RegisteredPlayer.query.get(team.player1_id)
-        player2 = RegisteredPlayer.query.get(team.player2_id) if team.player2_id else None
-        
         teams_data.append({
             'team_id': team.team_id,
             'player1_id': team.player1_id,
-            'player1_name': player1.player_name if player1 else 'Unknown',
+            'player1_name': team.player1_name or 'Unknown',
             'player2_id': team.player2_id,
-            'player2_name': player2.player_name if player2 else None,
+            'player2_name': team.player2_name,
             'is_ghost_team': team.is_ghost_team,
             'final_place': team.final_place,
+            'computed_place': computed_places.get(team.team_id),
+            'tied_place': tied_places.get(team.team_id),
             'points_earned': team.points_earned
         })
     
-    # Get all matches
-    matches = Match.query.filter_by(tournament_id=tournament_id).order_by(Match.match_order).all()
     match_data = []
     for match in matches:
         match_data.append({
@@ -66,22 +78,39 @@ def get_tournament_audit_data(tournament_id):
 @require_auth(['Admin'])
 def recalculate_tournament_stats(tournament_id):
     """Recalculate tournament-derived stats based on current final places (preserve manual overrides)"""
-    tournament = Tournament.query.get(tournament_id)
+    tournament = Tournament.query.filter_by(tournament_id=tournament_id).with_for_update().first()
     if not tournament or tournament.status != 'Completed':
         return jsonify({'error': 'Tournament not found or not completed'}), 404
+    if season_closed(tournament.tournament_date.year):
+        return jsonify({'error': f'Season {tournament.tournament_date.year} is closed'}), 400
+    
+    # A job that is still running or failed partway owns the derived data; retry it instead
+    job = CompletionJob.query.filter_by(tournament_id=tournament_id).first()
+    if not job or job.status != 'Completed':
+        status = job.status if job else 'missing'
+        return jsonify({'error': f'Completion job is {status}, stats can only be recalculated once it has completed'}), 409
+    
+    data = request.get_json(silent=True) or {}
     
     try:
         # Reset only the derived data, preserve final places
         _reset_derived_data_preserve_places(tournament_id)
         
+        # Optionally throw away manual overrides and place every team from the bracket again
+        if data.get('recompute_places'):
+            update_final_places(tournament_id, preserve_existing=False)
+        
         # Recalculate based on current final places (manual or original)
-        from routes.matches import (_update_teammate_history, _update_seasonal_points, _distribute_cash_payouts)
+        from routes.matches import (_update_teammate_history, _update_seasonal_points)
         
         _update_teammate_history(tournament_id)
         _update_seasonal_points(tournament_id)
-        _distribute_cash_payouts(tournament_id)
+        record_payouts(tournament_id)
+        record_career_stats(tournament_id)
+        bump_version(tournament_id)
         
         db.session.commit()
+        invalidate_leaderboard()
         return jsonify({'message': 'Tournament stats recalculated successfully'})
         
     except Exception as e:
@@ -104,6 +133,7 @@ def update_team_place(tournament_id, team_id):
     
     old_place = team.final_place
     team.final_place = new_place
+    bump_version(tournament_id)
     
     try:
         db.session.commit()
@@ -164,6 +194,10 @@ def _reset_derived_data_preserve_places(tournament_id):
                             total_place = (history.average_place * history.times_paired) - old_final_place
                             history.times_paired -= 1
                             history.average_place = total_place / history.times_paired if history.times_paired > 0 else 0
+    
+    # Reverse the cash and career stats recorded for this tournament
+    reverse_payouts(tournament_id)
+    reverse_career_stats(tournament_id)
 
 def _reset_tournament_derived_data(tournament_id):
     """Reset all calculated data for a tournament"""
@@ -211,6 +245,6 @@ def _reset_tournament_derived_data(tournament_id):
                             history.times_paired -= 1
                             history.average_place = total_place / history.times_paired if history.times_paired > 0 else 0
     
-    # Note: Cash payouts are harder to reverse without detailed tracking
-    # For now, we'll recalculate from scratch which may double-pay
-    # A production system would need payout history tracking
+    # Reverse the cash and career stats recorded for this tournament
+    reverse_payouts(tournament_id)
+    reverse_career_stats(tournament_id)
@@ -0,0 +1,45 @@
+from flask import Blueprint, jsonify, request
+from leaderboard_cache import DIVISIONS, SORTS, get_snapshot
+
+leaderboard_bp = Blueprint('leaderboard', __name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+@leaderboard_bp.route('/api/leaderboard', methods=['GET'])
+def get_leaderboard():
+    """Players ranked by seasonal points or cash, one page at a time from the cached snapshot"""
+    sort = request.args.get('sort', 'points')
+    if sort not in SORTS:
+        return jsonify({'error': 'sort must be points or cash'}), 400
+    
+    division = request.args.get('division')
+    if division and division not in DIVISIONS:
+        return jsonify({'error': 'Division must be Pro, Am, or Junior'}), 400
+    
+    try:
+        limit = min(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        cursor = int(request.args['cursor']) if request.args.get('cursor') else None
+    except ValueError:
+        return jsonify({'error': 'limit and cursor must be integers'}), 400
+    if limit < 1:
+        return jsonify({'error': 'limit must be positive'}), 400
+    
+    snapshot = get_snapshot()
+    if request.if_none_match.contains(snapshot.etag):
+        return '', 304
+    
+    try:
+        rows, next_cursor = snapshot.page(division or None, sort, cursor, limit)
+    except KeyError:
+        return jsonify({'error': 'Cursor player is not on this leaderboard'}), 400
+    
+    response = jsonify({
+        'version': snapshot.version,
+        'division': division,
+        'sort': sort,
+        'players': rows,
+        'next_cursor': next_cursor
+    })
+    response.set_etag(snapshot.etag)
+    return response
@@ -1,56 +1,42 @@
 from flask import Blueprint, jsonify, request
-from database import db
-from models import Tournament, Team, Match
+from database import db, expire_loaded
+from models import CompletionJob, Tournament, Team, Match, RegisteredPlayer
 from routes.auth import require_auth
-from sqlalchemy import text
+from bracket_engine import stamp_bracket, dependency_order
+from tournament_state import TournamentState, bump_version
+from placements import match_result, team_match_stats
+from completion_jobs import job_to_dict, queue_completion, submit_completion_job, withdraw_completion
+from station_allocator import claim_station, dispatch_ready_matches, free_stations, ready_queue
+from ratings import rate_match, seed_by_rating, unrate_matches
+from seasons import season_closed
+from sqlalchemy import case
 from typing import List
-import math
-from decimal import Decimal
+import time
+import heapq
 
 matches_bp = Blueprint('matches', __name__)
 
 @matches_bp.route('/api/tournaments/<int:tournament_id>/matches/<int:match_id>/start', methods=['POST'])
 @require_auth(['Admin', 'Director'])
 def start_match(tournament_id, match_id):
-    match = Match.query.filter_by(tournament_id=tournament_id, match_id=match_id).first()
+    # Lock the bracket so concurrent starts cannot claim the same station
+    state = TournamentState(tournament_id, lock=True)
+    match = state.get(match_id)
     if not match:
         return jsonify({'error': 'Match not found'}), 404
     
     if match.match_status != 'Scheduled':
         return jsonify({'error': 'Match is not scheduled'}), 400
     
-    # Get tournament to check available stations
-    tournament = Tournament.query.get(tournament_id)
-    max_stations = tournament.stations if tournament else 6
-    
-    # Find first available station using tournament's station count
-    occupied_stations = db.session.query(Match.station_assignment).filter(
-        Match.tournament_id == tournament_id,
-        Match.match_status == 'In_Progress'
-    ).all()
-    
-    occupied = {station[0] for station in occupied_stations if station[0]}
-    available_station = next((i for i in range(1, max_stations + 1) if i not in occupied), None)
-    
-    if not available_station:
+    if not claim_station(state, match):
         return jsonify({'error': 'No stations available'}), 400
-    
-    match.match_status = 'In_Progress'
-    match.station_assignment = available_station
+    bump_version(tournament_id)
     
     try:
         db.session.commit()
         
         # Emit WebSocket event for real-time updates
-        from flask import current_app
-        socketio = current_app.extensions.get('socketio')
-        if socketio:
-            socketio.emit('match_updated', {
-                'tournament_id': tournament_id,
-                'match_id': match.match_id,
-                'status': match.match_status,
-                'station': match.station_assignment
-            }, room=f'tournament_{tournament_id}')
+        _emit_matches_started(tournament_id, [match])
         
         return jsonify({
             'match_id': match.match_id,
@@ -61,43 +47,53 @@ def start_match(tournament_id, match_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@matches_bp.route('/api/tournaments/<int:tournament_id>/stations', methods=['GET'])
+def get_station_status(tournament_id):
+    state = TournamentState(tournament_id)
+    if not state.tournament:
+        return jsonify({'error': 'Tournament not found'}), 404
+    
+    return jsonify({
+        'tournament_id': tournament_id,
+        'auto_dispatch': bool(state.tournament.auto_dispatch),
+        'free_stations': free_stations(state),
+        'in_progress': [{
+            'match_id': m.match_id,
+            'station': m.station_assignment
+        } for m in state.matches if m.match_status == 'In_Progress'],
+        'ready_queue': [m.match_id for m in ready_queue(state)]
+    })
+
 @matches_bp.route('/api/tournaments/<int:tournament_id>/matches/<int:match_id>/score', methods=['POST'])
 @require_auth(['Admin', 'Director'])
 def score_match(tournament_id, match_id):
     data = request.get_json()
     
-    match = Match.query.filter_by(tournament_id=tournament_id, match_id=match_id).first()
+    # Load and lock the whole bracket once; everything below works against this state
+    state = TournamentState(tournament_id, lock=True)
+    match = state.get(match_id)
     if not match:
         return jsonify({'error': 'Match not found'}), 404
     
     # Validate match can be scored
-    validation_error = _validate_match_scoring(match, data)
+    reopen_error = _reopen_error(state)
+    if reopen_error:
+        return jsonify({'error': reopen_error[0]}), reopen_error[1]
+    validation_error = _match_scoring_error(match, data)
     if validation_error:
-        return validation_error
-    
-    # Check for rescore and store old results
-    is_rescore, old_winner_id, old_loser_id = _check_rescore_status(match)
-    
-    # Process the match scoring
-    winner_team_id, loser_team_id = _process_match_scoring(match, data)
-    
-    # Handle rollbacks if needed
-    rollback_results = []
-    if is_rescore and old_winner_id and (old_winner_id != winner_team_id):
-        rollback_results = _rollback_match_advancements(match, old_winner_id, old_loser_id)
+        return jsonify({'error': validation_error}), 400
     
-    # Advance teams to next matches
-    advancement_results = _advance_teams(match, tournament_id, winner_team_id, loser_team_id)
+    result = _apply_match_score(state, match, data)
+    winner_team_id = result['winner_team_id']
+    is_rescore = result['is_rescore']
     
-    # Handle post-match processing
-    _handle_post_match_processing(match, tournament_id, winner_team_id, loser_team_id)
-    
-    # Handle championship match rescoring if this is a rescore
-    if is_rescore and match.round_type == 'Championship' and match.round_number == 0:
-        _handle_championship_rescore(match, tournament_id, winner_team_id, loser_team_id, is_rescore=True)
+    # Byes, championship/tournament completion and station dispatch
+    dispatched = _finish_scoring(state, [result])
+    bump_version(tournament_id)
     
     try:
         db.session.commit()
+        completion = _submit_completion(state)
         
         # Emit WebSocket event for real-time updates
         from flask import current_app
@@ -112,6 +108,7 @@ def score_match(tournament_id, match_id):
                 'winner_team_id': winner_team_id,
                 'is_rescore': is_rescore
             }, room=f'tournament_{tournament_id}')
+        _emit_matches_started(tournament_id, dispatched)
         
         return jsonify({
             'match_id': match.match_id,
@@ -120,8 +117,12 @@ def score_match(tournament_id, match_id):
             'team2_score': match.team2_score,
             'winner_team_id': winner_team_id,
             'is_rescore': is_rescore,
-            'advancements': advancement_results,
-            'rollbacks': rollback_results
+            'advancements': result['advancements'],
+            'rollbacks': result['rollbacks'],
+            'cascade': result['cascade'],
+            'tournament_status': state.tournament.status,
+            'dispatched': [{'match_id': m.match_id, 'station': m.station_assignment} for m in dispatched],
+            'completion': completion
         })
     except Exception as e:
         print(f"ERROR in score_match: {str(e)}")
@@ -132,30 +133,219 @@ def score_match(tournament_id, match_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
-def _validate_match_scoring(match, data):
-    """Validate that a match can be scored"""
+@matches_bp.route('/api/tournaments/<int:tournament_id>/matches/scores', methods=['POST'])
+@require_auth(['Admin', 'Director'])
+def score_matches_batch(tournament_id):
+    """Apply many scores in one transaction, feeders before the matches they feed"""
+    data = request.get_json()
+    
+    if not data or not isinstance(data.get('scores'), list) or not data['scores']:
+        return jsonify({'error': 'Scores list is required'}), 400
+    
+    state = TournamentState(tournament_id, lock=True)
+    if not state.tournament:
+        return jsonify({'error': 'Tournament not found'}), 404
+    reopen_error = _reopen_error(state)
+    if reopen_error:
+        return jsonify({'error': reopen_error[0]}), reopen_error[1]
+    
+    # Validate every entry before touching the bracket
+    errors = []
+    scores_by_match = {}
+    for i, entry in enumerate(data['scores']):
+        match_id = entry.get('match_id') if isinstance(entry, dict) else None
+        if not isinstance(match_id, int) or isinstance(match_id, bool):
+            errors.append(f'Score {i+1}: match_id must be an integer')
+            continue
+        match = state.get(match_id)
+        if not match:
+            errors.append(f'Score {i+1}: Match not found')
+        elif match.match_id in scores_by_match:
+            errors.append(f'Score {i+1}: Match {match.match_id} is scored more than once')
+        else:
+            validation_error = _match_scoring_error(match, entry)
+            if validation_error:
+                errors.append(f'Score {i+1}: {validation_error}')
+            scores_by_match[match.match_id] = (match, entry)
+    
+    if errors:
+        return jsonify({'errors': errors}), 400
+    
+    # Targets come first in dependency order, so reverse it to score feeders first
+    ordered = reversed(dependency_order([match for match, _ in scores_by_match.values()]))
+    results = []
+    for match in ordered:
+        entry = scores_by_match[match.match_id][1]
+        # An earlier rescore in this batch may have pulled a team out of this match
+        validation_error = _match_scoring_error(match, entry)
+        if validation_error:
+            db.session.rollback()
+            return jsonify({'error': f'Match {match.match_id}: {validation_error} after earlier scores in this batch'}), 409
+        results.append(_apply_match_score(state, match, entry))
+    
+    dispatched = _finish_scoring(state, results)
+    bump_version(tournament_id)
+    
+    try:
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+    completion = _submit_completion(state)
+    
+    scored = [{
+        'match_id': r['match'].match_id,
+        'status': r['match'].match_status,
+        'team1_score': r['match'].team1_score,
+        'team2_score': r['match'].team2_score,
+        'winner_team_id': r['winner_team_id'],
+        'is_rescore': r['is_rescore'],
+        'advancements': r['advancements'],
+        'rollbacks': r['rollbacks'],
+        'cascade': r['cascade']
+    } for r in results]
+    dispatched_data = [{'match_id': m.match_id, 'station': m.station_assignment} for m in dispatched]
+    
+    # One consolidated event for the whole batch
+    from flask import current_app
+    socketio = current_app.extensions.get('socketio')
+    if socketio:
+        socketio.emit('match_updated', {
+            'tournament_id': tournament_id,
+            'matches': [{k: m[k] for k in ('match_id', 'status', 'team1_score', 'team2_score', 'winner_team_id', 'is_rescore')}
+                        for m in scored],
+            'dispatched': dispatched_data
+        }, room=f'tournament_{tournament_id}')
+    
+    return jsonify({
+        'tournament_id': tournament_id,
+        'tournament_status': state.tournament.status,
+        'scored': scored,
+        'dispatched': dispatched_data,
+        'completion': completion
+    })
+
+def _apply_match_score(state, match, data):
+    """Record a result, undo a previous result's advancements and advance the teams"""
+    # Check for rescore and store old results
+    is_rescore, old_winner_id, old_loser_id = _check_rescore_status(match)
+    
+    # Process the match scoring
+    winner_team_id, loser_team_id = _process_match_scoring(match, data)
+    
+    # Handle rollbacks if needed
+    rollback_results, cascade_report = [], None
+    if is_rescore and old_winner_id and (old_winner_id != winner_team_id):
+        rollback_results, cascade_report = _cascade_rescore(state, match, old_winner_id, old_loser_id)
+    
+    # Ratings: take back results that no longer stand, then apply this one
+    cleared = [match.match_id] if is_rescore else []
+    if cascade_report:
+        cleared += [m['match_id'] for m in cascade_report['invalidated'] if m['result_cleared']]
+        cleared += cascade_report['deleted_match_ids']
+    unrate_matches(state.tournament_id, cleared)
+    rate_match(match)
+    
+    # Advance teams to next matches
+    advancement_results = _advance_teams(state, match, winner_team_id, loser_team_id)
+    
+    return {
+        'match': match,
+        'winner_team_id': winner_team_id,
+        'loser_team_id': loser_team_id,
+        'is_rescore': is_rescore,
+        'advancements': advancement_results,
+        'rollbacks': rollback_results,
+        'cascade': cascade_report
+    }
+
+def _finish_scoring(state, results):
+    """Run byes, completion and dispatch once for a set of applied scores; returns dispatched matches"""
+    for result in results:
+        _auto_advance_byes(state, result['match'])
+    
+    # The deepest championship result decides whether the event is over
+    championship_results = [r for r in results if r['match'].round_type == 'Championship']
+    if championship_results:
+        final = max(championship_results, key=lambda r: r['match'].round_number)
+        _handle_championship_completion(state, final['match'], final['winner_team_id'], final['loser_team_id'])
+    elif not state.has_open_matches():
+        _process_tournament_completion(state)
+    
+    # Handle championship match rescoring if this is a rescore
+    for result in championship_results:
+        if result['is_rescore'] and result['match'].round_number == 0:
+            _handle_championship_rescore(state, result['match'], result['winner_team_id'],
+                                         result['loser_team_id'], is_rescore=True)
+    
+    # Refill freed stations from the ready queue if auto-dispatch is on
+    return dispatch_ready_matches(state)
+
+def _emit_matches_started(tournament_id, matches):
+    """Emit a match_updated event for each match that was just put on a station"""
+    from flask import current_app
+    socketio = current_app.extensions.get('socketio')
+    if not socketio:
+        return
+    
+    for match in matches:
+        socketio.emit('match_updated', {
+            'tournament_id': tournament_id,
+            'match_id': match.match_id,
+            'status': match.match_status,
+            'station': match.station_assignment
+        }, room=f'tournament_{tournament_id}')
+
+def _match_scoring_error(match, data):
+    """Return why a match cannot be scored, or None if it can"""
     if match.team2_id is None:
         if match.match_status not in ['Pending', 'Scheduled', 'Completed']:
-            return jsonify({'error': f'Bye match cannot be advanced (status: {match.match_status})'}), 400
+            return f'Bye match cannot be advanced (status: {match.match_status})'
+        if not match.team1_id:
+            return 'No team to advance'
     else:
         if match.match_status not in ['In_Progress', 'Completed']:
-            return jsonify({'error': 'Match is not in progress or completed'}), 400
+            return 'Match is not in progress or completed'
         
         if not data or 'team1_score' not in data or 'team2_score' not in data:
-            return jsonify({'error': 'Missing score data'}), 400
+            return 'Missing score data'
         
         try:
             team1_score = int(data['team1_score'])
             team2_score = int(data['team2_score'])
             if team1_score < 0 or team2_score < 0:
-                return jsonify({'error': 'Scores must be non-negative'}), 400
+                return 'Scores must be non-negative'
             if team1_score == team2_score:
-                return jsonify({'error': 'Matches cannot end in a tie'}), 400
+                return 'Matches cannot end in a tie'
         except (ValueError, TypeError):
-            return jsonify({'error': 'Invalid score format'}), 400
+            return 'Invalid score format'
+    
+    return None
+
+def _reopen_error(state):
+    """(message, status) when a completed tournament can't take a rescore right now, else None"""
+    tournament = state.tournament
+    if not tournament or tournament.status != 'Completed':
+        return None
+    
+    if season_closed(tournament.tournament_date.year):
+        return f'Season {tournament.tournament_date.year} is closed', 400
     
+    # Its effects can only be reversed once the completion job has stopped running
+    job = CompletionJob.query.filter_by(tournament_id=state.tournament_id).first()
+    if job and job.status in ('Queued', 'Running'):
+        return 'Tournament completion is still being processed, try again once it finishes', 409
     return None
 
+def _reopen_tournament(state):
+    """Put a completed tournament back in progress, reversing what its completion applied"""
+    if state.tournament.status != 'Completed':
+        return False
+    
+    withdraw_completion(state.tournament_id)
+    state.tournament.status = 'In_Progress'
+    return True
+
 def _check_rescore_status(match):
     """Check if this is a rescore and return old results"""
     is_rescore = match.match_status == 'Completed'
@@ -196,12 +386,12 @@ def _process_match_scoring(match, data):
         else:
             return match.team2_id, match.team1_id
 
-def _advance_teams(match, tournament_id, winner_team_id, loser_team_id):
+def _advance_teams(state, match, winner_team_id, loser_team_id):
     """Advance teams to next matches and return advancement results"""
     advancement_results = []
     
     if match.winner_advances_to_match_id and winner_team_id:
-        next_match = Match.query.filter_by(tournament_id=tournament_id, match_id=match.winner_advances_to_match_id).first()
+        next_match = state.get(match.winner_advances_to_match_id)
         if next_match:
             if not next_match.team1_id:
                 next_match.team1_id = winner_team_id
@@ -214,7 +404,7 @@ def _advance_teams(match, tournament_id, winner_team_id, loser_team_id):
                 next_match.match_status = 'Scheduled'
     
     if match.loser_advances_to_match_id and loser_team_id:
-        next_match = Match.query.filter_by(tournament_id=tournament_id, match_id=match.loser_advances_to_match_id).first()
+        next_match = state.get(match.loser_advances_to_match_id)
         if next_match:
             if not next_match.team1_id:
                 next_match.team1_id = loser_team_id
@@ -228,54 +418,29 @@ def _advance_teams(match, tournament_id, winner_team_id, loser_team_id):
     
     return advancement_results
 
-def _handle_post_match_processing(match, tournament_id, winner_team_id, loser_team_id):
-    """Handle auto-advancement, championship completion, and tournament completion"""
-    _auto_advance_byes(tournament_id)
-    
-    if match.round_type == 'Championship':
-        _handle_championship_completion(match, winner_team_id, loser_team_id)
-    else:
-        remaining_matches = Match.query.filter_by(
-            tournament_id=tournament_id, 
-            match_status='Pending'
-        ).filter(Match.team1_id.isnot(None)).count()
-        
-        scheduled_matches = Match.query.filter_by(
-            tournament_id=tournament_id, 
-            match_status='Scheduled'
-        ).count()
-        
-        if remaining_matches == 0 and scheduled_matches == 0:
-            tournament = Tournament.query.get(tournament_id)
-            tournament.status = 'Completed'
-            _process_tournament_completion(tournament_id)
-
-def _handle_championship_rescore(match, tournament_id, winner_team_id, loser_team_id, is_rescore=False):
+def _handle_championship_rescore(state, match, winner_team_id, loser_team_id, is_rescore=False):
     """Handle creation/removal of second championship match based on first championship result"""
     # Only run this logic during actual rescores, not initial scoring
     if not is_rescore:
         return
         
     # Check if second championship match exists
-    second_championship = Match.query.filter_by(
-        tournament_id=tournament_id,
-        round_type='Championship',
-        round_number=1
-    ).first()
+    second_championship = state.championship(1)
     
     # If WB winner (team1) won, remove second championship match if it exists
     if winner_team_id == match.team1_id:
         if second_championship:
-            db.session.delete(second_championship)
+            unrate_matches(state.tournament_id, [second_championship.match_id])
+            state.delete(second_championship)
     # If LB winner (team2) won, create second championship match if it doesn't exist
     else:
         if not second_championship:
-            # Get the highest match_id to continue numbering
-            last_match = Match.query.filter_by(tournament_id=tournament_id).order_by(Match.match_id.desc()).first()
-            next_match_id = (last_match.match_id + 1) if last_match else 1
+            _reopen_tournament(state)
+            # Continue numbering after the highest match_id
+            next_match_id = state.next_match_id()
             
             final_match = Match(
-                tournament_id=tournament_id,
+                tournament_id=state.tournament_id,
                 match_id=next_match_id,
                 stage_type='Finals',
                 round_type='Championship',
@@ -287,7 +452,7 @@ def _handle_championship_rescore(match, tournament_id, winner_team_id, loser_tea
                 team2_id=match.team2_id,  # LB winner
                 match_status='Scheduled'
             )
-            db.session.add(final_match)
+            state.add(final_match)
 
 @matches_bp.route('/api/tournaments/<int:tournament_id>/generate-matches', methods=['POST'])
 @require_auth(['Admin', 'Director'])
@@ -306,304 +471,138 @@ def generate_matches(tournament_id):
     if len(teams) < 4:
         return jsonify({'error': 'Need at least 4 teams'}), 400
     
-    matches = _create_winners_bracket_matches(tournament_id, teams)
-    _create_loser_bracket_matches(tournament_id, matches, len(teams))
-    _set_advancement_paths(matches)
-    _seed_teams_and_handle_byes(matches, teams)
-    _set_match_order(matches)
-    
-    # Single database transaction
-    db.session.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
-    db.session.add_all(matches)
-    db.session.commit()
-    db.session.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
-    
-    return jsonify({'tournament_id': tournament_id, 'matches_created': len(matches)}), 201
-
-def _create_winners_bracket_matches(tournament_id, teams):
-    """Create all bracket matches (winners, losers, championship)"""
-    bracket_size = 1 << (len(teams) - 1).bit_length() if len(teams) & (len(teams) - 1) else len(teams)
-    wb_rounds = int(math.log2(bracket_size))
-    
-    matches = []
-    match_id = 1
-    
-    # Create winners bracket matches
-    for round_num in range(wb_rounds):
-        matches_in_round = bracket_size >> (round_num + 1)
-        for pos in range(matches_in_round):
-            matches.append(Match(
-                tournament_id=tournament_id, match_id=match_id, stage_type='Group_A',
-                round_type='Winners', round_number=round_num, position_in_round=pos,
-                stage_match_number=match_id, match_order=match_id, match_status='Pending'
-            ))
-            match_id += 1
-    return matches
-
-def _create_loser_bracket_matches(tournament_id, matches, team_count):
-    wb_round = 0
-    lb_round = 0
-    prev_round_count = 0
-    match_id = matches[len(matches)-1].match_id + 1
-    bracket_size = 1 << (team_count - 1).bit_length() if team_count & (team_count - 1) else team_count
-    loserMatchesNeeded = bracket_size - 2
-
-    # Standard alternating pattern
-    while (loserMatchesNeeded > 0):
-        if lb_round == 0 or lb_round % 2 == 1:  # odd rounds get WB losers
-            matches_in_round = math.ceil(((bracket_size >> (wb_round + 1)) + prev_round_count) /2)
-            wb_round += 1
-            prev_round_count = matches_in_round
-
-        else:  # even rounds resolve LB matches
-            matches_in_round = math.ceil(prev_round_count / 2)
-            prev_round_count = matches_in_round
-
-        for pos in range(matches_in_round):
-            matches.append(Match(
-                tournament_id=tournament_id,
-                match_id=match_id,
-                stage_type='Group_A',
-                round_type='Losers',
-                round_number=lb_round,
-                position_in_round=pos + 1,
-                stage_match_number=match_id,
-                match_order=match_id,
-                match_status='Pending'
-            ))
-            loserMatchesNeeded -= 1
-            match_id += 1
-        lb_round += 1
-    _create_championship_match(tournament_id=tournament_id, match_id=match_id, matches=matches)
-
-def _create_championship_match(tournament_id, match_id, matches):
-    championship = Match(
-        tournament_id=tournament_id, match_id=match_id, stage_type='Finals',
-        round_type='Championship', round_number=0, position_in_round=0,
-        stage_match_number=match_id, match_order=match_id, match_status='Pending'
-    )
-    matches.append(championship)
-
-def _set_advancement_paths(matches):
-    """Set winner and loser advancement paths for all matches"""
-    wb_matches = [m for m in matches if m.round_type == 'Winners']
-    lb_matches = [m for m in matches if m.round_type == 'Losers']
-    championship = next(m for m in matches if m.round_type == 'Championship')
-    
-    # Winners bracket progression
-    for match in wb_matches:
-        if match.round_number < max(m.round_number for m in wb_matches):
-            next_pos = match.position_in_round // 2
-            next_match = next((m for m in wb_matches 
-                             if m.round_number == match.round_number + 1 
-                             and m.position_in_round == next_pos), None)
-            if next_match:
-                match.winner_advances_to_match_id = next_match.match_id
-        else:
-            match.winner_advances_to_match_id = championship.match_id
-    
-    # Group losers matches by round
-    lb_by_round = {}
-    for match in lb_matches:
-        if match.round_number not in lb_by_round:
-            lb_by_round[match.round_number] = []
-        lb_by_round[match.round_number].append(match)
-    
-    # Sort each round by match_id
-    for round_num in lb_by_round:
-        lb_by_round[round_num].sort(key=lambda x: x.match_id)
-    
-    # Track match capacity
-    match_capacity = {match.match_id: 2 for match in lb_matches}
-    match_assigned = {match.match_id: 0 for match in lb_matches}
-    
-    # Set LB internal progressions and track assignments
-    for round_num in sorted(lb_by_round.keys()):
-        current_round = lb_by_round[round_num]
-        next_round_num = round_num + 1
-        
-        if next_round_num in lb_by_round:
-            next_round = lb_by_round[next_round_num]
-            for i, match in enumerate(current_round):
-                target_match = next_round[i % len(next_round)]
-                match.winner_advances_to_match_id = target_match.match_id
-                match_assigned[target_match.match_id] += 1
-        else:
-            for match in current_round:
-                match.winner_advances_to_match_id = championship.match_id
-    
-    # WB losers drop to LB (only odd rounds accept WB losers)
-    for wb_match in sorted(wb_matches, key=lambda x: x.match_id):
-        if wb_match.round_number == max(m.round_number for m in wb_matches):
-            target_round = max(lb_by_round.keys())
-        else:
-            target_round = 0 if wb_match.round_number == 0 else wb_match.round_number * 2 - 1
-
-        if target_round in lb_by_round:
-            target_matches = lb_by_round[target_round]
-            matches_to_iterate = reversed(target_matches) if target_round == 1 else target_matches
-            for target_match in matches_to_iterate:
-                if match_assigned[target_match.match_id] < match_capacity[target_match.match_id]:
-                    wb_match.loser_advances_to_match_id = target_match.match_id
-                    match_assigned[target_match.match_id] += 1
-                    break
-
-
-def _seed_teams_and_handle_byes(matches, teams):
-    """Seed teams into first round and handle bye advancement"""
-    wb_matches = [m for m in matches if m.round_type == 'Winners']
-    bracket_size = 1 << (len(teams) - 1).bit_length() if len(teams) & (len(teams) - 1) else len(teams)
-    byes_needed = bracket_size - len(teams)
-    
-    first_round = [m for m in wb_matches if m.round_number == 0]
-    bye_matches_to_remove = []
-    
-    # Handle byes
-    for i in range(byes_needed):
-        first_round[i].team1_id = teams[i].team_id
-        first_round[i].match_status = 'Scheduled'
-        # Auto-advance bye teams
-        if first_round[i].winner_advances_to_match_id:
-            next_match = next((m for m in matches if m.match_id == first_round[i].winner_advances_to_match_id), None)
-            if next_match:
-                if next_match.team1_id is None:
-                    next_match.team1_id = teams[i].team_id
-                elif next_match.team2_id is None:
-                    next_match.team2_id = teams[i].team_id
-                if next_match.team1_id and next_match.team2_id:
-                    next_match.match_status = 'Scheduled'
-        bye_matches_to_remove.append(first_round[i])
-    
-    # Seed real matches
-    team_idx = byes_needed
-    for i in range(byes_needed, len(first_round)):
-        if team_idx < len(teams):
-            first_round[i].team1_id = teams[team_idx].team_id
-            team_idx += 1
-        if team_idx < len(teams):
-            first_round[i].team2_id = teams[team_idx].team_id
-            first_round[i].match_status = 'Scheduled'
-            team_idx += 1
-    
-    # Remove bye matches
-    for bye_match in bye_matches_to_remove:
-        matches.remove(bye_match)
-    
-    # Handle losers bracket byes
-    _handle_losers_bracket_byes(matches, byes_needed)
-
-def _handle_losers_bracket_byes(matches, byes_needed):
-    """Handle losers bracket adjustments when winners bracket has byes"""
-    if byes_needed == 0:
-        return
+    # Seed by rating: the strongest teams take the byes and are kept apart until late rounds
+    rows = stamp_bracket(seed_by_rating(teams))
     
-    lb_matches = [m for m in matches if m.round_type == 'Losers' and m.round_number == 0]
-    wb_matches = [m for m in matches if m.round_type == 'Winners' and m.round_number == 0]
+    try:
+        rows_written, elapsed_ms = _bulk_insert_matches(tournament_id, rows)
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
     
-    for lb_match in lb_matches:
-        # Find WB matches that feed into this LB match
-        feeding_wb_matches = [wb for wb in wb_matches if wb.loser_advances_to_match_id == lb_match.match_id]
-        
-        if len(feeding_wb_matches) <= 1:
-            if (len(feeding_wb_matches) == 0):
-                matches.remove(lb_match)
-            else:
-                # Single parent - redirect its loser to where this LB match winner would go
-                parent_wb = feeding_wb_matches[0]
-                parent_wb.loser_advances_to_match_id = lb_match.winner_advances_to_match_id
-                matches.remove(lb_match)
-
-def _set_match_order(matches):
-    """Set match order for scheduling"""
-    non_championship_matches = [m for m in matches if m.round_type != 'Championship']
-    non_championship_matches.sort(key=lambda m: (m.round_number, m.round_type == 'Losers', m.match_id))
-    for i, match in enumerate(non_championship_matches, 1):
-        match.match_order = i    
+    return jsonify({
+        'tournament_id': tournament_id,
+        'matches_created': rows_written,
+        'insert_ms': elapsed_ms
+    }), 201
+
+def _bulk_insert_matches(tournament_id, rows):
+    """Write generated match rows with one executemany in a single transaction.
+    
+    Rows arrive in dependency order (advancement targets first), so foreign key
+    checks stay on. Returns (rows_written, elapsed_ms).
+    """
+    start = time.perf_counter()
+    for row in rows:
+        row['tournament_id'] = tournament_id
+    db.session.execute(Match.__table__.insert(), rows)
+    bump_version(tournament_id)
+    db.session.commit()
+    return len(rows), round((time.perf_counter() - start) * 1000, 2)
 
-def _rollback_match_advancements(match, old_winner_id, old_loser_id):
-    """Remove teams from subsequent matches when re-scoring"""
+def _cascade_rescore(state, match, old_winner_id, old_loser_id):
+    """Pull a rescored match's old teams back out of the bracket, following them downstream.
     
+    Walks the advancement DAG once from the rescored match. A downstream match is
+    only invalidated if it holds a team that came from a result which no longer
+    stands; if that match was already played (or started) its own result is void
+    too, so the teams it sent on are pulled the same way. Returns the per-team
+    rollbacks plus a report of every invalidated match.
+    """
     rollbacks = []
+    report = {'invalidated': [], 'deleted_match_ids': [], 'tournament_reopened': False}
     
-    # Remove old winner from winner advancement match
-    if match.winner_advances_to_match_id:
-        target_match = Match.query.filter_by(tournament_id=match.tournament_id, match_id=match.winner_advances_to_match_id).first()
-        if target_match:
-            if target_match.team1_id == old_winner_id:
-                target_match.team1_id = None
-                rollbacks.append({'team_id': old_winner_id, 'removed_from_match_id': target_match.match_id})
-            elif target_match.team2_id == old_winner_id:
-                target_match.team2_id = None
-                rollbacks.append({'team_id': old_winner_id, 'removed_from_match_id': target_match.match_id})
-    
-    # Remove old loser from loser advancement match
-    if match.loser_advances_to_match_id:
-        target_match = Match.query.filter_by(tournament_id=match.tournament_id, match_id=match.loser_advances_to_match_id).first()
-        if target_match:
-            if target_match.team1_id == old_loser_id:
-                target_match.team1_id = None
-                rollbacks.append({'team_id': old_loser_id, 'removed_from_match_id': target_match.match_id})
-            elif target_match.team2_id == old_loser_id:
-                target_match.team2_id = None
-                rollbacks.append({'team_id': old_loser_id, 'removed_from_match_id': target_match.match_id})
-    
-    return rollbacks
-
-def _auto_advance_byes(tournament_id):
-    """Auto-advance teams in bye matches (matches with only one team that won't get a second team)"""
-    matches = Match.query.filter_by(tournament_id=tournament_id).all()
-    
-    for match in matches:
-        # Skip if match is already completed or in progress
-        if match.match_status not in ['Pending']:
+    stale = [(match.winner_advances_to_match_id, old_winner_id), (match.loser_advances_to_match_id, old_loser_id)]
+    while stale:
+        target_id, team_id = stale.pop()
+        target = state.get(target_id)
+        if not target or not team_id or team_id not in (target.team1_id, target.team2_id):
             continue
+        
+        previous_status = target.match_status
+        if previous_status == 'Completed':
+            # Everything this match sent downstream goes with it
+            winner_id, loser_id = match_result(target)
+            stale.append((target.winner_advances_to_match_id, winner_id))
+            stale.append((target.loser_advances_to_match_id, loser_id))
+        
+        if target.team1_id == team_id:
+            target.team1_id = None
+        else:
+            target.team2_id = None
+        rollbacks.append({'team_id': team_id, 'removed_from_match_id': target.match_id})
+        
+        if previous_status in ('Completed', 'In_Progress'):
+            target.team1_score = None
+            target.team2_score = None
+            target.station_assignment = None
+        target.match_status = 'Pending'
+        report['invalidated'].append({
+            'match_id': target.match_id,
+            'previous_status': previous_status,
+            'removed_team_id': team_id,
+            'result_cleared': previous_status == 'Completed'
+        })
+        
+        # The bracket final only exists because of the first championship result
+        if target.round_type == 'Championship' and target.round_number == 0:
+            final_match = state.championship(1)
+            if final_match:
+                state.delete(final_match)
+                report['deleted_match_ids'].append(final_match.match_id)
+    
+    if report['invalidated']:
+        report['tournament_reopened'] = _reopen_tournament(state)
+    
+    return rollbacks, report
+
+def _auto_advance_byes(state, scored_match):
+    """Auto-advance bye matches downstream of the scored match (one team and no second team coming)"""
+    # Walk targets in match_id order so cascading byes fill slots the same way a full sweep would
+    to_check = [m_id for m_id in (scored_match.winner_advances_to_match_id,
+                                  scored_match.loser_advances_to_match_id) if m_id]
+    heapq.heapify(to_check)
+    
+    while to_check:
+        match = state.get(heapq.heappop(to_check))
+        
+        # Only pending matches holding a single team can be byes
+        if not match or match.match_status != 'Pending' or not match.team1_id or match.team2_id:
+            continue
+        
+        # If only one match feeds into this one and it's completed, this is a true bye
+        feeding_matches = state.feeders_of(match.match_id)
+        if len(feeding_matches) != 1 or feeding_matches[0].match_status != 'Completed':
+            continue
+        
+        match.team1_score = 1
+        match.team2_score = 0
+        match.match_status = 'Completed'
+        
+        # Advance the team to the next match
+        next_match = state.get(match.winner_advances_to_match_id)
+        if next_match:
+            if not next_match.team1_id:
+                next_match.team1_id = match.team1_id
+            elif not next_match.team2_id:
+                next_match.team2_id = match.team1_id
             
-        # Check if this is a bye match (has one team but no second team will come)
-        if match.team1_id and not match.team2_id:
-            # Count how many matches feed into this match
-            feeding_matches = [m for m in matches if 
-                             m.winner_advances_to_match_id == match.match_id or 
-                             m.loser_advances_to_match_id == match.match_id]
-            
-            # If only one match feeds into this one and it's completed, this is a bye
-            completed_feeding = [m for m in feeding_matches if m.match_status == 'Completed']
+            # Update status to Scheduled if both teams are now assigned
+            if next_match.team1_id and next_match.team2_id and next_match.match_status == 'Pending':
+                next_match.match_status = 'Scheduled'
             
-            if len(feeding_matches) == 1 and len(completed_feeding) == 1:
-                # This is a true bye - auto-advance
-                match.team1_score = 1
-                match.team2_score = 0
-                match.match_status = 'Completed'
-                
-                # Advance the team to the next match
-                if match.winner_advances_to_match_id:
-                    next_match = next((m for m in matches if m.match_id == match.winner_advances_to_match_id), None)
-                    if next_match:
-                        if not next_match.team1_id:
-                            next_match.team1_id = match.team1_id
-                        elif not next_match.team2_id:
-                            next_match.team2_id = match.team1_id
-                        
-                        # Update status to Scheduled if both teams are now assigned
-                        if next_match.team1_id and next_match.team2_id and next_match.match_status == 'Pending':
-                            next_match.match_status = 'Scheduled'
-            elif len(feeding_matches) == 0:
-                # This match has a seeded team but no feeding matches - it's waiting for another team
-                # Check if it should be scheduled (if it will get a second team from another completed match)
-                pass  # Keep as Pending until second team arrives
+            heapq.heappush(to_check, next_match.match_id)
 
-def _handle_championship_completion(match, winner_team_id, loser_team_id):
+def _handle_championship_completion(state, match, winner_team_id, loser_team_id):
     """Handle championship match completion - either end tournament or create final match"""
-    from models import Tournament, Team, TeamHistory
-    
     # Check if this was WB winner vs LB winner (first championship match)
     if match.round_number == 0:
         # If WB winner won (team1), tournament is complete
         if winner_team_id == match.team1_id:
-            tournament = Tournament.query.get(match.tournament_id)
-            tournament.status = 'Completed'
-            _process_tournament_completion(match.tournament_id)
-        else:
-            # LB winner won, create final championship match
+            _process_tournament_completion(state)
+        elif not state.championship(1):
+            # LB winner won, create final championship match; a rescore can get here after completion
+            _reopen_tournament(state)
             next_match_id = match.match_id + 1
             
             final_match = Match(
@@ -619,79 +618,23 @@ def _handle_championship_completion(match, winner_team_id, loser_team_id):
                 team2_id=match.team2_id,  # LB winner 
                 match_status='Scheduled'
             )
-            db.session.add(final_match)
+            state.add(final_match)
     else:
         # This was the final championship match, tournament is complete
-        tournament = Tournament.query.get(match.tournament_id)
-        tournament.status = 'Completed'
-        _process_tournament_completion(match.tournament_id)
+        _process_tournament_completion(state)
 
-def _process_tournament_completion(tournament_id):
-    """Process all completion tasks for a tournament"""
-    _calculate_final_places(tournament_id)
-    _update_teammate_history(tournament_id)
-    _update_seasonal_points(tournament_id)
-    _distribute_cash_payouts(tournament_id)
+def _process_tournament_completion(state):
+    """Mark the tournament completed and queue places, history, points and payouts for the worker pool"""
+    state.tournament.status = 'Completed'
+    state.completion_job = queue_completion(state.tournament_id)
 
-def _calculate_final_places(tournament_id):
-    """Calculate and set final places for all teams"""
-    from models import Team
-    
-    # Find championship matches to determine 1st and 2nd
-    championship_matches = Match.query.filter_by(
-        tournament_id=tournament_id, 
-        round_type='Championship',
-        match_status='Completed'
-    ).order_by(Match.round_number.desc()).all()
-    
-    if championship_matches:
-        final_match = championship_matches[0]
-        
-        # Determine winner and runner-up from final championship match
-        if final_match.team1_score > final_match.team2_score:
-            winner_team_id = final_match.team1_id
-            runner_up_team_id = final_match.team2_id
-        else:
-            winner_team_id = final_match.team2_id
-            runner_up_team_id = final_match.team1_id
-            
-        # Set final places
-        winner_team = Team.query.filter_by(tournament_id=tournament_id, team_id=winner_team_id).first()
-        runner_up_team = Team.query.filter_by(tournament_id=tournament_id, team_id=runner_up_team_id).first()
-        
-        if winner_team:
-            winner_team.final_place = 1
-        if runner_up_team:
-            runner_up_team.final_place = 2
-    
-    # Calculate places for eliminated teams based on elimination order
-    _calculate_elimination_places(tournament_id)
-
-def _calculate_elimination_places(tournament_id):
-    """Calculate final places for teams based on when they were eliminated"""
-    from models import Team
-    
-    # Get all matches in reverse order (latest eliminations first)
-    matches = Match.query.filter_by(tournament_id=tournament_id, match_status='Completed').order_by(Match.match_order.desc()).all()
-    
-    current_place = 3  # Start with 3rd place (1st and 2nd set by championship)
-    
-    for match in matches:
-        # Skip championship matches (already handled)
-        if match.round_type == 'Championship':
-            continue
-            
-        # Find the losing team
-        if match.team1_score < match.team2_score:
-            losing_team_id = match.team1_id
-        else:
-            losing_team_id = match.team2_id
-            
-        # Set final place if not already set
-        losing_team = Team.query.filter_by(tournament_id=tournament_id, team_id=losing_team_id).first()
-        if losing_team and not losing_team.final_place:
-            losing_team.final_place = current_place
-            current_place += 1
+def _submit_completion(state):
+    """Start the queued completion job once the scoring transaction is committed"""
+    job = state.completion_job
+    if not job or job.status != 'Queued':
+        return None
+    submit_completion_job(job.job_id)
+    return job_to_dict(job)
 
 def _update_teammate_history(tournament_id):
     """Update teammate history for all teams in completed tournament"""
@@ -719,151 +662,93 @@ def _update_teammate_history(tournament_id):
                     )
                     db.session.add(history)
 
-def _update_seasonal_points(tournament_id):
-    """Update seasonal points for all teams and players in tournament"""
-    from models import RegisteredPlayer, Team
+def _reverse_teammate_history(tournament_id):
+    """Take a completed tournament's pairings back out of teammate history"""
+    from models import Team, TeamHistory
     
     teams = Team.query.filter_by(tournament_id=tournament_id).all()
     
     for team in teams:
-        # Calculate team points: 1 for participation + match wins + top 4 bonus + undefeated bonus
-        participation_points = 1
-        match_wins = _count_team_match_wins(tournament_id, team.team_id)
-        top_4_bonus = 2 if team.final_place and team.final_place <= 4 else 0
-        undefeated_bonus = 3 if _is_team_undefeated(tournament_id, team.team_id) else 0
-        
-        team.points_earned = participation_points + match_wins + top_4_bonus + undefeated_bonus
-        
-        # Update player seasonal points
-        if team.player1_id:
-            player1 = RegisteredPlayer.query.get(team.player1_id)
-            if player1:
-                player1.seasonal_points += team.points_earned
-        
-        if team.player2_id:
-            player2 = RegisteredPlayer.query.get(team.player2_id)
-            if player2:
-                player2.seasonal_points += team.points_earned
-
-def _distribute_cash_payouts(tournament_id):
-    """Calculate and distribute cash payouts to players"""
-    from models import RegisteredPlayer, TournamentRegistration, Team, AcePot
-    
-    registrations = TournamentRegistration.query.filter_by(tournament_id=tournament_id).all()
-    total_participants = len(registrations)
-    total_payout_pot = 5 * total_participants
-    
-    # Get total ace pot balance across all tournaments
-    ace_pot_balance = db.session.query(db.func.sum(AcePot.amount)).scalar() or 0
-    
-    # Find 1st and 2nd place teams
-    first_place_team = Team.query.filter_by(tournament_id=tournament_id, final_place=1).first()
-    second_place_team = Team.query.filter_by(tournament_id=tournament_id, final_place=2).first()
-    
-    # Calculate payouts
-    if total_payout_pot <= 60:
-        second_place_payout = 20
-        first_place_payout = total_payout_pot - second_place_payout
-    else:
-        second_place_payout = min(40, total_payout_pot - 40) if total_payout_pot > 40 else 0
-        first_place_payout = total_payout_pot - second_place_payout
-    
-    # Check if first place went undefeated for ace pot
-    ace_pot_payout = 0
-    if first_place_team and _team_is_undefeated(tournament_id, first_place_team.team_id):
-        ace_pot_payout = ace_pot_balance
-        first_place_payout += ace_pot_payout
-        
-        # Update ace pot tracker
-        if ace_pot_payout > 0:
-            # Get player names for description
-            from models import RegisteredPlayer
-            player1 = RegisteredPlayer.query.get(first_place_team.player1_id)
-            player2 = RegisteredPlayer.query.get(first_place_team.player2_id) if first_place_team.player2_id else None
-            
-            if player2 and not first_place_team.is_ghost_team:
-                team_names = f"{player1.player_name} & {player2.player_name}"
-            else:
-                team_names = player1.player_name
-            
-            payout_entry = AcePot(
-                tournament_id=tournament_id,
-                date=db.func.current_date(),
-                description=f'Ace pot payout to {team_names}',
-                amount=-ace_pot_payout
-            )
-            db.session.add(payout_entry)
-    
-    # Update tournament with ace pot payout amount
-    tournament = Tournament.query.get(tournament_id)
-    if tournament:
-        tournament.ace_pot_payout = ace_pot_payout
-    
-    # Distribute cash to players
-    for reg in registrations:
-        player = RegisteredPlayer.query.get(reg.player_id)
-        if player:
-            player_team = Team.query.filter_by(tournament_id=tournament_id).filter(
-                db.or_(Team.player1_id == reg.player_id, Team.player2_id == reg.player_id)
-            ).first()
-            
-            if player_team:
-                teammates_count = 2 if player_team.player2_id and not player_team.is_ghost_team else 1
+        if not team.is_ghost_team and team.player2_id and team.final_place:
+            for player_id, teammate_id in [(team.player1_id, team.player2_id), (team.player2_id, team.player1_id)]:
+                history = TeamHistory.query.filter_by(player_id=player_id, teammate_id=teammate_id).first()
+                if not history:
+                    continue
                 
-                if player_team.final_place == 1:
-                    player.seasonal_cash += Decimal(str(first_place_payout / teammates_count))
-                elif player_team.final_place == 2:
-                    player.seasonal_cash += Decimal(str(second_place_payout / teammates_count))
+                if history.times_paired <= 1:
+                    db.session.delete(history)
+                else:
+                    total_place = (history.average_place or 0) * history.times_paired - team.final_place
+                    history.times_paired -= 1
+                    history.average_place = total_place / history.times_paired
 
-def _count_team_match_wins(tournament_id, team_id):
-    """Count matches won by specific team (excluding byes)"""
-    matches = Match.query.filter_by(tournament_id=tournament_id).filter(
-        db.or_(Match.team1_id == team_id, Match.team2_id == team_id)
-    ).filter(Match.match_status == 'Completed').all()
-    
-    wins = 0
-    for match in matches:
-        # Skip bye matches (only one team)
-        if match.team2_id is None:
-            continue
-            
-        if ((match.team1_id == team_id and match.team1_score > match.team2_score) or
-            (match.team2_id == team_id and match.team2_score > match.team1_score)):
-            wins += 1
+def _add_to_player_column(column_name, amounts):
+    """Add per-player amounts to a registered_players column with a single UPDATE"""
+    if not amounts:
+        return
     
-    return wins
+    table = RegisteredPlayer.__table__
+    column = table.c[column_name]
+    db.session.execute(
+        table.update()
+        .where(table.c.player_id.in_(list(amounts)))
+        .values({column_name: db.func.coalesce(column, 0) + case(amounts, value=table.c.player_id)})
+    )
+    expire_loaded(RegisteredPlayer, column_name)
 
-def _is_team_undefeated(tournament_id, team_id):
-    """Check if specific team went undefeated"""
-    matches = Match.query.filter_by(tournament_id=tournament_id).filter(
-        db.or_(Match.team1_id == team_id, Match.team2_id == team_id)
-    ).filter(Match.match_status == 'Completed').all()
+def _update_seasonal_points(tournament_id):
+    """Update seasonal points for all teams and players in tournament"""
+    teams = db.session.query(Team.team_id, Team.player1_id, Team.player2_id, Team.final_place).filter(
+        Team.tournament_id == tournament_id
+    ).all()
+    if not teams:
+        return
     
-    for match in matches:
-        # Skip bye matches
-        if match.team2_id is None:
-            continue
-            
-        # If team lost any match, not undefeated
-        if ((match.team1_id == team_id and match.team1_score < match.team2_score) or
-            (match.team2_id == team_id and match.team2_score < match.team1_score)):
-            return False
+    stats = team_match_stats(tournament_id)
     
-    return True
+    team_points = {}
+    player_points = {}
+    for team_id, player1_id, player2_id, final_place in teams:
+        team_stats = stats.get(team_id, {'wins': 0, 'losses': 0})
+        
+        # Calculate team points: 1 for participation + match wins + top 4 bonus + undefeated bonus
+        participation_points = 1
+        top_4_bonus = 2 if final_place and final_place <= 4 else 0
+        undefeated_bonus = 3 if team_stats['losses'] == 0 else 0
+        team_points[team_id] = participation_points + team_stats['wins'] + top_4_bonus + undefeated_bonus
+        
+        for player_id in (player1_id, player2_id):
+            if player_id:
+                player_points[player_id] = player_points.get(player_id, 0) + team_points[team_id]
+    
+    # One UPDATE for the teams and one for their players
+    team_table = Team.__table__
+    db.session.execute(
+        team_table.update()
+        .where(team_table.c.team_id.in_(list(team_points)))
+        .values(points_earned=case(team_points, value=team_table.c.team_id))
+    )
+    expire_loaded(Team, 'points_earned')
+    _add_to_player_column('seasonal_points', player_points)
 
-def _team_is_undefeated(tournament_id, team_id):
-    """Check if specific team went undefeated"""
-    matches = Match.query.filter_by(tournament_id=tournament_id).filter(
-        db.or_(Match.team1_id == team_id, Match.team2_id == team_id)
-    ).filter(Match.match_status == 'Completed').all()
+def _reverse_seasonal_points(tournament_id):
+    """Subtract the points each team earned from its players and clear the team totals"""
+    teams = db.session.query(Team.player1_id, Team.player2_id, Team.points_earned).filter(
+        Team.tournament_id == tournament_id, Team.points_earned.isnot(None)
+    ).all()
     
-    for match in matches:
-        # If team lost any match, not undefeated
-        if ((match.team1_id == team_id and match.team1_score < match.team2_score) or
-            (match.team2_id == team_id and match.team2_score < match.team1_score)):
-            return False
+    player_points = {}
+    for player1_id, player2_id, points_earned in teams:
+        for player_id in (player1_id, player2_id):
+            if player_id:
+                player_points[player_id] = player_points.get(player_id, 0) - points_earned
     
-    return True
+    team_table = Team.__table__
+    db.session.execute(
+        team_table.update().where(team_table.c.tournament_id == tournament_id).values(points_earned=None)
+    )
+    expire_loaded(Team, 'points_earned')
+    _add_to_player_column('seasonal_points', player_points)
 
 @matches_bp.route('/api/tournaments/<int:tournament_id>/create-championship', methods=['POST'])
 @require_auth(['Admin', 'Director'])
@@ -906,6 +791,7 @@ def create_championship_round(tournament_id):
         championship_1.match_status = 'Scheduled'
     
     db.session.add(championship_1)
+    bump_version(tournament_id)
     db.session.commit()
     
     return jsonify({
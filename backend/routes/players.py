@@ -1,52 +1,62 @@
 from flask import Blueprint, jsonify, request
 from database import db
-from models import RegisteredPlayer, TournamentRegistration, Tournament, Team, TeamHistory
+from models import RegisteredPlayer, TournamentRegistration, Tournament, Team, TeamHistory, Match, PlayerCareerStats
 from routes.auth import require_auth
+from leaderboard_cache import invalidate as invalidate_leaderboard
+from career_stats import career_to_dict
+from tournament_state import bump_version
+from player_search import search_players, index_players, invalidate as invalidate_player_search
+from sqlalchemy import case
 import csv
 import io
 
 players_bp = Blueprint('players', __name__)
 
+# Rows per duplicate check and bulk insert in the CSV import
+CSV_CHUNK_SIZE = 1000
+
 @players_bp.route('/api/players/<int:player_id>', methods=['GET'])
 def get_player_detail(player_id):
     player = RegisteredPlayer.query.get(player_id)
     if not player:
         return jsonify({'error': 'Player not found'}), 404
     
-    # Get tournament history
-    tournaments = db.session.query(Tournament, TournamentRegistration, Team).join(
+    # Tournament history in one query: registrations, the player's team and that team's
+    # completed non-bye matches aggregated into wins and losses
+    team_won = db.or_(
+        db.and_(Match.team1_id == Team.team_id, Match.team1_score > Match.team2_score),
+        db.and_(Match.team2_id == Team.team_id, Match.team2_score > Match.team1_score)
+    )
+    history = db.session.query(
+        Tournament.tournament_id,
+        Tournament.tournament_date,
+        Tournament.status,
+        TournamentRegistration.bought_ace_pot,
+        Team.team_id,
+        Team.final_place,
+        Team.points_earned,
+        db.func.count(Match.match_id).label('matches_played'),
+        db.func.coalesce(db.func.sum(case((team_won, 1), else_=0)), 0).label('wins')
+    ).join(
         TournamentRegistration, Tournament.tournament_id == TournamentRegistration.tournament_id
     ).outerjoin(
-        Team, db.and_(Team.tournament_id == Tournament.tournament_id, 
+        Team, db.and_(Team.tournament_id == Tournament.tournament_id,
                      db.or_(Team.player1_id == player_id, Team.player2_id == player_id))
-    ).filter(TournamentRegistration.player_id == player_id).all()
+    ).outerjoin(
+        Match, db.and_(Match.tournament_id == Team.tournament_id,
+                       db.or_(Match.team1_id == Team.team_id, Match.team2_id == Team.team_id),
+                       Match.match_status == 'Completed',
+                       Match.team2_id.isnot(None))
+    ).filter(TournamentRegistration.player_id == player_id).group_by(
+        Tournament.tournament_id, Tournament.tournament_date, Tournament.status,
+        TournamentRegistration.bought_ace_pot, Team.team_id, Team.final_place, Team.points_earned
+    ).order_by(Tournament.tournament_date, Tournament.tournament_id).all()
     
     # Get teammate history with names
     teammates = db.session.query(TeamHistory, RegisteredPlayer).join(
         RegisteredPlayer, TeamHistory.teammate_id == RegisteredPlayer.player_id
     ).filter(TeamHistory.player_id == player_id).all()
     
-    # Get tournament history with undefeated check
-    tournaments_with_undefeated = []
-    for t in tournaments:
-        tournament_obj, registration, team = t
-        won_ace_pot = False
-        
-        if team and team.final_place == 1:
-            # Check if team went undefeated
-            from models import Match
-            team_matches = Match.query.filter_by(tournament_id=tournament_obj.tournament_id).filter(
-                db.or_(Match.team1_id == team.team_id, Match.team2_id == team.team_id)
-            ).filter(Match.match_status == 'Completed').filter(Match.team2_id.isnot(None)).all()
-            
-            won_ace_pot = all(
-                (match.team1_id == team.team_id and match.team1_score > match.team2_score) or
-                (match.team2_id == team.team_id and match.team2_score > match.team1_score)
-                for match in team_matches
-            )
-        
-        tournaments_with_undefeated.append((tournament_obj, registration, team, won_ace_pot))
-    
     return jsonify({
         'player_id': player.player_id,
         'player_name': player.player_name,
@@ -54,15 +64,17 @@ def get_player_detail(player_id):
         'division': player.division,
         'seasonal_points': player.seasonal_points,
         'seasonal_cash': float(player.seasonal_cash),
+        'career_stats': career_to_dict(PlayerCareerStats.query.get(player_id)),
         'tournament_history': [{
-            'tournament_id': t[0].tournament_id,
-            'tournament_date': t[0].tournament_date.isoformat(),
-            'status': t[0].status,
-            'bought_ace_pot': t[1].bought_ace_pot,
-            'final_place': t[2].final_place if t[2] else None,
-            'points_earned': t[2].points_earned if t[2] else 0,
-            'won_ace_pot': t[3]
-        } for t in tournaments_with_undefeated],
+            'tournament_id': t.tournament_id,
+            'tournament_date': t.tournament_date.isoformat(),
+            'status': t.status,
+            'bought_ace_pot': t.bought_ace_pot,
+            'final_place': t.final_place,
+            'points_earned': t.points_earned if t.team_id else 0,
+            # Champions who never lost a match take the ace pot
+            'won_ace_pot': t.final_place == 1 and t.wins == t.matches_played
+        } for t in history],
         'teammate_history': [{
             'teammate_id': th[0].teammate_id,
             'teammate_name': th[1].player_name,
@@ -74,16 +86,38 @@ def get_player_detail(player_id):
 
 @players_bp.route('/api/players', methods=['GET'])
 def get_players():
-    players = RegisteredPlayer.query.all()
+    # Plain column rows with the divisional rank from a window function, not full ORM objects
+    players = db.session.query(
+        RegisteredPlayer.player_id,
+        RegisteredPlayer.player_name,
+        RegisteredPlayer.nickname,
+        RegisteredPlayer.division,
+        RegisteredPlayer.seasonal_points,
+        RegisteredPlayer.seasonal_cash,
+        db.func.rank().over(
+            partition_by=RegisteredPlayer.division,
+            order_by=RegisteredPlayer.seasonal_points.desc()
+        ).label('division_rank')
+    ).order_by(RegisteredPlayer.player_id).all()
     return jsonify([{
         'player_id': p.player_id,
         'player_name': p.player_name,
         'nickname': p.nickname,
         'division': p.division,
         'seasonal_points': p.seasonal_points,
-        'seasonal_cash': float(p.seasonal_cash)
+        'seasonal_cash': float(p.seasonal_cash),
+        'division_rank': p.division_rank
     } for p in players])
 
+@players_bp.route('/api/players/search', methods=['GET'])
+def search_player_names():
+    query = request.args.get('q', '')
+    limit = request.args.get('limit', 10, type=int)
+    division = request.args.get('division')
+    if division is not None and division not in ['Pro', 'Am', 'Junior']:
+        return jsonify({'error': 'Division must be Pro, Am, or Junior'}), 400
+    return jsonify({'query': query, 'results': search_players(query, limit, division)})
+
 @players_bp.route('/api/players', methods=['POST'])
 @require_auth(['Admin', 'Director'])
 def create_players():
@@ -126,6 +160,8 @@ def create_players():
         return jsonify({'errors': errors}), 400
     
     db.session.commit()
+    invalidate_leaderboard()
+    index_players(created_players)
     
     result = {
         'created': [{
@@ -162,8 +198,15 @@ def update_player(player_id):
     if 'division' in data:
         player.division = data['division']
     
+    # Snapshots of every tournament the player is in carry their name
+    bump_version(*[tournament_id for (tournament_id,) in db.session.query(
+        TournamentRegistration.tournament_id
+    ).filter_by(player_id=player_id)])
+    
     try:
         db.session.commit()
+        invalidate_leaderboard()
+        index_players([player])
         return jsonify({
             'player_id': player.player_id,
             'player_name': player.player_name,
@@ -176,23 +219,12 @@ def update_player(player_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
-@players_bp.route('/api/players/batch-csv', methods=['POST'])
-@require_auth(['Admin', 'Director'])
-def create_players_csv():
-    if 'csv_data' not in request.json:
-        return jsonify({'error': 'csv_data field required'}), 400
-    
-    csv_data = request.json['csv_data']
-    reader = csv.DictReader(io.StringIO(csv_data))
-    
-    print(f"Debug - CSV Headers: {reader.fieldnames}")
-    
-    players_data = []
-    for i, row in enumerate(reader):
-        print(f"Debug - Row {i}: {dict(row)}")
+def _csv_rows(stream):
+    """Yield (row_number, player_data, error) per CSV row while reading the stream"""
+    reader = csv.DictReader(stream)
+    for row_number, row in enumerate(reader, 1):
         # Handle case-insensitive column lookup
-        division = row.get('division', row.get('Division', 'Am')).strip()
-        print(f"Debug - Raw division: '{division}'")
+        division = (row.get('division') or row.get('Division') or 'Am').strip()
         # Normalize division case
         if division.lower() == 'pro':
             division = 'Pro'
@@ -200,58 +232,78 @@ def create_players_csv():
             division = 'Junior'
         else:
             division = 'Am'
-        print(f"Debug - Normalized division: '{division}'")
-            
-        players_data.append({
-            'player_name': row.get('player_name', '').strip(),
-            'nickname': row.get('nickname', '').strip() or None,
+
+        player_name = (row.get('player_name') or '').strip()
+        if not player_name:
+            yield row_number, None, f'Row {row_number}: Player name is required'
+            continue
+
+        yield row_number, {
+            'player_name': player_name,
+            'nickname': (row.get('nickname') or '').strip() or None,
             'division': division
-        })
+        }, None
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _import_chunk(chunk, errors):
+    """Insert one chunk of parsed rows with a single IN duplicate check and one executemany; returns the rows inserted"""
+    names = {data['player_name'] for _, data, error in chunk if not error}
+    # Earlier chunks are already inserted in this transaction, so this also catches repeats within the file
+    taken = {name for (name,) in db.session.query(RegisteredPlayer.player_name).filter(
+        RegisteredPlayer.player_name.in_(names)
+    )} if names else set()
+
+    rows = []
+    for row_number, data, error in chunk:
+        if error:
+            errors.append(error)
+        elif data['player_name'] in taken:
+            errors.append(f'Row {row_number}: Player name "{data["player_name"]}" already exists')
+        else:
+            taken.add(data['player_name'])
+            rows.append(dict(data, seasonal_points=0, seasonal_cash=0))
+
+    if rows:
+        db.session.execute(RegisteredPlayer.__table__.insert(), rows)
+    return len(rows)
+
+@players_bp.route('/api/players/batch-csv', methods=['POST'])
+@require_auth(['Admin', 'Director'])
+def create_players_csv():
+    # An uploaded file is read as a stream; pasted text still comes in as csv_data
+    if 'file' in request.files:
+        stream = io.TextIOWrapper(request.files['file'].stream, encoding='utf-8-sig', newline='')
+    else:
+        data = request.get_json(silent=True) or {}
+        if 'csv_data' not in data:
+            return jsonify({'error': 'csv_data field or file upload required'}), 400
+        stream = io.StringIO(data['csv_data'])
     
-    # Reuse existing batch creation logic
-    created_players = []
+    # Only a count is kept, so memory stays flat however large the file is
+    created_count = 0
     errors = []
+    for chunk in _chunks(_csv_rows(stream), CSV_CHUNK_SIZE):
+        created_count += _import_chunk(chunk, errors)
     
-    for i, player_data in enumerate(players_data):
-        if not player_data.get('player_name'):
-            errors.append(f'Row {i+1}: Player name is required')
-            continue
-        
-        division = player_data.get('division', 'Am')
-        if division not in ['Pro', 'Am', 'Junior']:
-            errors.append(f'Row {i+1}: Division must be Pro, Am, or Junior')
-            continue
-        
-        existing = RegisteredPlayer.query.filter_by(player_name=player_data['player_name']).first()
-        if existing:
-            errors.append(f'Row {i+1}: Player name "{player_data["player_name"]}" already exists')
-            continue
-        
-        player = RegisteredPlayer(
-            player_name=player_data['player_name'],
-            nickname=player_data.get('nickname'),
-            division=division,
-            seasonal_points=0,
-            seasonal_cash=0.00
-        )
-        
-        db.session.add(player)
-        created_players.append(player)
-    
-    if errors and not created_players:
+    if errors and not created_count:
+        db.session.rollback()
         return jsonify({'errors': errors}), 400
     
     db.session.commit()
+    invalidate_leaderboard()
+    # One rebuild on the next search is cheaper than indexing a large import player by player
+    invalidate_player_search()
     
-    result = {
-        'created': [{
-            'player_id': p.player_id,
-            'player_name': p.player_name,
-            'nickname': p.nickname,
-            'division': p.division
-        } for p in created_players]
-    }
-    
+    result = {'created_count': created_count}
     if errors:
         result['errors'] = errors
     
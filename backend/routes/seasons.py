@@ -0,0 +1,70 @@
+from flask import Blueprint, jsonify, request
+from database import db
+from models import Season, SeasonStanding, RegisteredPlayer
+from routes.auth import require_auth
+from seasons import close_season, season_closed
+from leaderboard_cache import DIVISIONS, invalidate as invalidate_leaderboard
+
+seasons_bp = Blueprint('seasons', __name__)
+
+@seasons_bp.route('/api/seasons', methods=['GET'])
+def get_seasons():
+    """Closed seasons, newest first"""
+    seasons = Season.query.order_by(Season.season_year.desc()).all()
+    return jsonify([{'season_year': s.season_year, 'players': s.players_ranked} for s in seasons])
+
+@seasons_bp.route('/api/seasons/<int:season_year>/standings', methods=['GET'])
+def get_season_standings(season_year):
+    """Final standings of a closed season by division and place"""
+    division = request.args.get('division')
+    if division and division not in DIVISIONS:
+        return jsonify({'error': 'Division must be Pro, Am, or Junior'}), 400
+    
+    query = db.session.query(
+        SeasonStanding.player_id,
+        RegisteredPlayer.player_name,
+        RegisteredPlayer.nickname,
+        SeasonStanding.division,
+        SeasonStanding.final_place,
+        SeasonStanding.seasonal_points,
+        SeasonStanding.seasonal_cash
+    ).join(
+        RegisteredPlayer, RegisteredPlayer.player_id == SeasonStanding.player_id
+    ).filter(SeasonStanding.season_year == season_year)
+    if division:
+        query = query.filter(SeasonStanding.division == division)
+    standings = query.order_by(
+        SeasonStanding.division, SeasonStanding.final_place, RegisteredPlayer.player_name
+    ).all()
+    
+    if not standings and not season_closed(season_year):
+        return jsonify({'error': f'Season {season_year} has not been closed'}), 404
+    
+    return jsonify({
+        'season_year': season_year,
+        'standings': [{
+            'player_id': s.player_id,
+            'player_name': s.player_name,
+            'nickname': s.nickname,
+            'division': s.division,
+            'final_place': s.final_place,
+            'seasonal_points': s.seasonal_points,
+            'seasonal_cash': float(s.seasonal_cash)
+        } for s in standings]
+    })
+
+@seasons_bp.route('/api/seasons/<int:season_year>/close', methods=['POST'])
+@require_auth(['Admin'])
+def close_season_route(season_year):
+    try:
+        standings = close_season(season_year)
+        db.session.commit()
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+    
+    invalidate_leaderboard()
+    return jsonify({'season_year': season_year, 'standings_recorded': standings}), 201
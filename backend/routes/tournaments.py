@@ -1,17 +1,31 @@
 from flask import Blueprint, jsonify, request
 from datetime import datetime
-import random
+from sqlalchemy import case
+from sqlalchemy.orm import aliased
 from database import db
-from models import Tournament, TournamentRegistration, RegisteredPlayer, AcePot, Team, Match
+from models import Tournament, TournamentRegistration, RegisteredPlayer, AcePot, Team, Match, CompletionJob
 from routes.auth import require_auth
+from tournament_state import TournamentState, bump_version
+from station_allocator import dispatch_ready_matches
+from team_pairing import load_pair_counts, pair_players
+from ratings import reverse_ratings
+from ace_pot_ledger import add_ace_pot_entry, delete_ace_pot_entries
+from completion_jobs import job_to_dict, submit_completion_job, withdraw_completion
+from leaderboard_cache import invalidate as invalidate_leaderboard
+from player_search import index_players
+from seasons import season_closed
+from team_roster import load_roster
 
 tournaments_bp = Blueprint('tournaments', __name__)
 
+TOURNAMENT_STATUSES = ('Scheduled', 'In_Progress', 'Completed', 'Cancelled')
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
 def _register_players_helper(tournament_id, tournament_date, players_data):
     """Helper function to register players and handle ace pot"""
-    registered_players = []
-    ace_pot_buyins = 0
-    
+    # Keep the first entry per player, in request order (team generation draws from this order)
+    requested = {}
     for player_data in players_data:
         if isinstance(player_data, dict):
             player_id = player_data.get('player_id')
@@ -19,42 +33,79 @@ def _register_players_helper(tournament_id, tournament_date, players_data):
         else:
             player_id = player_data
             bought_ace_pot = False
-            
-        player = RegisteredPlayer.query.get(player_id)
-        if not player:
+        requested.setdefault(player_id, bought_ace_pot)
+    
+    # One query for the players and one for who is already registered
+    players = {p.player_id: p for p in RegisteredPlayer.query.filter(
+        RegisteredPlayer.player_id.in_(list(requested))
+    )} if requested else {}
+    for player_id in requested:
+        if player_id not in players:
             raise ValueError(f'Player ID {player_id} not found')
-        
-        # Check if already registered
-        existing_reg = TournamentRegistration.query.filter_by(
-            tournament_id=tournament_id, 
-            player_id=player_id
-        ).first()
-        
-        if not existing_reg:
-            registration = TournamentRegistration(
-                tournament_id=tournament_id,
-                player_id=player_id,
-                bought_ace_pot=bought_ace_pot
-            )
-            db.session.add(registration)
-            registered_players.append(player)
-            
-            if bought_ace_pot:
-                ace_pot_buyins += 1
+    
+    already_registered = {player_id for (player_id,) in db.session.query(TournamentRegistration.player_id).filter(
+        TournamentRegistration.tournament_id == tournament_id,
+        TournamentRegistration.player_id.in_(list(requested))
+    )} if requested else set()
+    
+    new_registrations = [{
+        'tournament_id': tournament_id,
+        'player_id': player_id,
+        'bought_ace_pot': bought_ace_pot
+    } for player_id, bought_ace_pot in requested.items() if player_id not in already_registered]
+    
+    if new_registrations:
+        db.session.execute(TournamentRegistration.__table__.insert(), new_registrations)
+    
+    registered_players = [players[row['player_id']] for row in new_registrations]
+    ace_pot_buyins = sum(1 for row in new_registrations if row['bought_ace_pot'])
     
     # Add ace pot entry if there are buy-ins
     if ace_pot_buyins > 0:
         ace_pot_amount = ace_pot_buyins * 1.00
-        ace_pot_entry = AcePot(
-            tournament_id=tournament_id,
-            date=tournament_date,
-            description=f'Tournament {tournament_date}: {ace_pot_buyins} buy-ins',
-            amount=ace_pot_amount
-        )
-        db.session.add(ace_pot_entry)
+        add_ace_pot_entry(tournament_id, tournament_date, f'Tournament {tournament_date}: {ace_pot_buyins} buy-ins', ace_pot_amount)
     
     return registered_players, ace_pot_buyins
 
+def _resolve_players_by_name(registrations):
+    """Set player_id on named registrations, creating missing players in one bulk insert; returns the new players"""
+    named = [reg for reg in registrations if 'player_name' in reg and 'player_id' not in reg]
+    if not named:
+        return []
+    
+    names = {reg['player_name'] for reg in named}
+    player_ids = {}
+    for player_id, player_name in db.session.query(RegisteredPlayer.player_id, RegisteredPlayer.player_name).filter(
+        RegisteredPlayer.player_name.in_(names)
+    ).order_by(RegisteredPlayer.player_id):
+        player_ids.setdefault(player_name, player_id)
+    
+    new_players = {}
+    for reg in named:
+        if reg['player_name'] not in player_ids:
+            new_players.setdefault(reg['player_name'], {
+                'player_name': reg['player_name'],
+                'nickname': reg.get('nickname'),
+                'division': reg.get('division', 'Am'),
+                'seasonal_points': 0,
+                'seasonal_cash': 0
+            })
+    
+    created_players = []
+    if new_players:
+        db.session.execute(RegisteredPlayer.__table__.insert(), list(new_players.values()))
+        created_players = db.session.query(
+            RegisteredPlayer.player_id,
+            RegisteredPlayer.player_name,
+            RegisteredPlayer.nickname,
+            RegisteredPlayer.division
+        ).filter(RegisteredPlayer.player_name.in_(list(new_players))).all()
+        player_ids.update((p.player_name, p.player_id) for p in created_players)
+    
+    for reg in named:
+        reg['player_id'] = player_ids[reg['player_name']]
+    return created_players
+
 @tournaments_bp.route('/api/tournaments', methods=['GET'])
 def get_tournaments():
     date_param = request.args.get('date')
@@ -79,25 +130,10 @@ def get_tournaments():
         if not tournament:
             return jsonify({'error': 'Tournament not found'}), 404
         
-        registrations = db.session.query(TournamentRegistration, RegisteredPlayer).join(
-            RegisteredPlayer, TournamentRegistration.player_id == RegisteredPlayer.player_id
-        ).filter(TournamentRegistration.tournament_id == tournament.tournament_id).all()
-        
         teams = Team.query.filter_by(tournament_id=tournament.tournament_id).all()
         
-        return jsonify({
-            'tournament_id': tournament.tournament_id,
-            'tournament_date': tournament.tournament_date.isoformat(),
-            'status': tournament.status,
-            'total_teams': tournament.total_teams,
-            'ace_pot_payout': float(tournament.ace_pot_payout),
-            'registered_players': [{
-                'player_id': reg[1].player_id,
-                'player_name': reg[1].player_name,
-                'nickname': reg[1].nickname,
-                'division': reg[1].division,
-                'bought_ace_pot': reg[0].bought_ace_pot
-            } for reg in registrations],
+        return jsonify(dict(_tournament_to_dict(tournament), **{
+            'registered_players': _registrations(tournament.tournament_id),
             'teams': [{
                 'team_id': t.team_id,
                 'player1_id': t.player1_id,
@@ -106,20 +142,111 @@ def get_tournaments():
                 'seed_number': t.seed_number,
                 'points_earned': t.points_earned
             } for t in teams]
-        })
+        }))
     else:
-        try:
-            tournaments = Tournament.query.order_by(Tournament.tournament_id.desc()).all()
-            return jsonify([{
-                'tournament_id': t.tournament_id,
-                'tournament_date': t.tournament_date.isoformat() if t.tournament_date else None,
-                'status': t.status,
-                'total_teams': t.total_teams,
-                'ace_pot_payout': float(t.ace_pot_payout) if t.ace_pot_payout else 0.00
-            } for t in tournaments])
-        except Exception as e:
-            print(f"Error fetching tournaments: {e}")
-            return jsonify({'error': 'Failed to fetch tournaments'}), 500
+        return _list_tournaments()
+
+def _list_tournaments():
+    """One page of the tournament directory, newest first, with summary counts and champions"""
+    status = request.args.get('status')
+    if status and status not in TOURNAMENT_STATUSES:
+        return jsonify({'error': f'status must be one of {", ".join(TOURNAMENT_STATUSES)}'}), 400
+    
+    try:
+        date_from = datetime.strptime(request.args['date_from'], '%Y-%m-%d').date() if request.args.get('date_from') else None
+        date_to = datetime.strptime(request.args['date_to'], '%Y-%m-%d').date() if request.args.get('date_to') else None
+    except ValueError:
+        return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
+    
+    try:
+        limit = min(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        cursor = int(request.args['cursor']) if request.args.get('cursor') else None
+    except ValueError:
+        return jsonify({'error': 'limit and cursor must be integers'}), 400
+    if limit < 1:
+        return jsonify({'error': 'limit must be positive'}), 400
+    
+    query = Tournament.query
+    if status:
+        query = query.filter(Tournament.status == status)
+    if date_from:
+        query = query.filter(Tournament.tournament_date >= date_from)
+    if date_to:
+        query = query.filter(Tournament.tournament_date <= date_to)
+    if cursor is not None:
+        # Keyset on (tournament_date, tournament_id), both descending
+        cursor_date = db.session.query(Tournament.tournament_date).filter_by(tournament_id=cursor).scalar()
+        if cursor_date is None:
+            return jsonify({'error': 'Unknown cursor'}), 400
+        query = query.filter(db.or_(
+            Tournament.tournament_date < cursor_date,
+            db.and_(Tournament.tournament_date == cursor_date, Tournament.tournament_id < cursor)
+        ))
+    
+    rows = query.order_by(Tournament.tournament_date.desc(), Tournament.tournament_id.desc()).limit(limit + 1).all()
+    page = rows[:limit]
+    summaries = _tournament_summaries([t.tournament_id for t in page])
+    
+    return jsonify({
+        'tournaments': [dict({
+            'tournament_id': t.tournament_id,
+            'tournament_date': t.tournament_date.isoformat() if t.tournament_date else None,
+            'status': t.status,
+            'total_teams': t.total_teams,
+            'ace_pot_payout': float(t.ace_pot_payout) if t.ace_pot_payout else 0.00
+        }, **summaries[t.tournament_id]) for t in page],
+        'next_cursor': page[-1].tournament_id if len(rows) > limit else None
+    })
+
+def _tournament_summaries(tournament_ids):
+    """Registration, team and match counts plus champion names for a page of tournaments, in one query"""
+    if not tournament_ids:
+        return {}
+    
+    # Each count is grouped over just this page's tournaments, then joined side by side
+    registrations = db.session.query(
+        TournamentRegistration.tournament_id, db.func.count().label('players')
+    ).filter(TournamentRegistration.tournament_id.in_(tournament_ids)).group_by(
+        TournamentRegistration.tournament_id
+    ).subquery()
+    team_counts = db.session.query(
+        Team.tournament_id,
+        db.func.count().label('teams'),
+        # Lowest team id if a manual edit ever left two teams in first
+        db.func.min(case((Team.final_place == 1, Team.team_id))).label('champion_team_id')
+    ).filter(Team.tournament_id.in_(tournament_ids)).group_by(Team.tournament_id).subquery()
+    match_counts = db.session.query(
+        Match.tournament_id,
+        db.func.count().label('matches_total'),
+        db.func.sum(case((Match.match_status == 'Completed', 1), else_=0)).label('matches_completed')
+    ).filter(Match.tournament_id.in_(tournament_ids)).group_by(Match.tournament_id).subquery()
+    champion_team = aliased(Team)
+    champion1 = aliased(RegisteredPlayer)
+    champion2 = aliased(RegisteredPlayer)
+    
+    rows = db.session.query(
+        Tournament.tournament_id,
+        registrations.c.players,
+        team_counts.c.teams,
+        match_counts.c.matches_total,
+        match_counts.c.matches_completed,
+        champion1.player_name,
+        champion2.player_name
+    ).outerjoin(registrations, registrations.c.tournament_id == Tournament.tournament_id
+    ).outerjoin(team_counts, team_counts.c.tournament_id == Tournament.tournament_id
+    ).outerjoin(match_counts, match_counts.c.tournament_id == Tournament.tournament_id
+    ).outerjoin(champion_team, champion_team.team_id == team_counts.c.champion_team_id
+    ).outerjoin(champion1, champion1.player_id == champion_team.player1_id
+    ).outerjoin(champion2, champion2.player_id == champion_team.player2_id
+    ).filter(Tournament.tournament_id.in_(tournament_ids)).all()
+    
+    return {tournament_id: {
+        'registered_players': players or 0,
+        'teams': teams or 0,
+        'matches_total': matches_total or 0,
+        'matches_completed': int(matches_completed or 0),
+        'champions': [name for name in (champion_one, champion_two) if name]
+    } for tournament_id, players, teams, matches_total, matches_completed, champion_one, champion_two in rows}
 
 @tournaments_bp.route('/api/tournaments', methods=['POST'])
 @require_auth(['Admin', 'Director'])
@@ -160,26 +287,16 @@ def create_tournament():
             tournament.tournament_id, tournament_date, players
         )
         
-        # Generate teams
-        player_list = registered_players.copy()
+        # Generate teams, avoiding past teammates where possible
+        player_ids = [player.player_id for player in registered_players]
+        pairs, ghost_id = pair_players(player_ids, load_pair_counts(player_ids))
         teams = []
         
-        while len(player_list) >= 2:
-            player_one = player_list.pop()
-            n = len(player_list)
-            index = random.randint(0, n-1)
-            
-            if index >= n:
-                player_two = player_list.pop()
-            else:
-                player_two = player_list[index]
-                player_list[index] = player_list[n-1]
-                player_list.pop()
-            
+        for player1_id, player2_id in pairs:
             team = Team(
                 tournament_id=tournament.tournament_id,
-                player1_id=player_one.player_id,
-                player2_id=player_two.player_id,
+                player1_id=player1_id,
+                player2_id=player2_id,
                 is_ghost_team=False,
                 seed_number=len(teams) + 1
             )
@@ -187,10 +304,10 @@ def create_tournament():
             teams.append(team)
         
         # Handle odd player (ghost team)
-        if len(player_list) > 0:
+        if ghost_id is not None:
             team = Team(
                 tournament_id=tournament.tournament_id,
-                player1_id=player_list.pop().player_id,
+                player1_id=ghost_id,
                 player2_id=None,
                 is_ghost_team=True,
                 seed_number=len(teams) + 1
@@ -235,50 +352,34 @@ def register_players_for_tournament(tournament_id):
         return jsonify({'error': 'Tournament not found'}), 404
     
     registrations = data['registrations']
-    created_players = []
     errors = []
     
-    # Create new players if needed
     for i, reg in enumerate(registrations):
-        if 'player_name' in reg:
-            division = reg.get('division', 'Am')
-            if division not in ['Pro', 'Am', 'Junior']:
-                errors.append(f'Registration {i+1}: Division must be Pro, Am, or Junior')
-                continue
-            
-            existing = RegisteredPlayer.query.filter_by(player_name=reg['player_name']).first()
-            if not existing:
-                player = RegisteredPlayer(
-                    player_name=reg['player_name'],
-                    nickname=reg.get('nickname'),
-                    division=division,
-                    seasonal_points=0,
-                    seasonal_cash=0.00
-                )
-                db.session.add(player)
-                db.session.flush()
-                created_players.append(player)
-                reg['player_id'] = player.player_id
+        if 'player_name' in reg and reg.get('division', 'Am') not in ['Pro', 'Am', 'Junior']:
+            errors.append(f'Registration {i+1}: Division must be Pro, Am, or Junior')
     
     if errors:
         return jsonify({'errors': errors}), 400
     
-    # Convert registrations to players format for helper
-    players_data = []
-    for reg in registrations:
-        if 'player_id' in reg:
-            players_data.append({
-                'player_id': reg['player_id'],
-                'bought_ace_pot': reg.get('bought_ace_pot', False)
-            })
-    
     try:
+        # Create new players if needed
+        created_players = _resolve_players_by_name(registrations)
+        
+        # Convert registrations to players format for helper
+        players_data = []
+        for reg in registrations:
+            if 'player_id' in reg:
+                players_data.append({
+                    'player_id': reg['player_id'],
+                    'bought_ace_pot': reg.get('bought_ace_pot', False)
+                })
+        
         registered_players, ace_pot_buyins = _register_players_helper(
             tournament_id, tournament.tournament_date, players_data
         )
         
-        db.session.commit()
-        
+        # Built before the commit expires the loaded players
+        bump_version(tournament_id)
         result = {
             'tournament_id': tournament_id,
             'registered_players': len(registered_players),
@@ -295,6 +396,11 @@ def register_players_for_tournament(tournament_id):
         if created_players:
             result['new_players_created'] = len(created_players)
         
+        db.session.commit()
+        if created_players:
+            invalidate_leaderboard()
+            index_players(created_players)
+        
         return jsonify(result), 201
         
     except ValueError as e:
@@ -304,10 +410,38 @@ def register_players_for_tournament(tournament_id):
         db.session.rollback()
         return jsonify({'error': 'Failed to register players'}), 500
 
-@tournaments_bp.route('/api/tournaments/<int:tournament_id>/matches', methods=['GET'])
-def get_tournament_matches(tournament_id):
-    matches = Match.query.filter_by(tournament_id=tournament_id).order_by(Match.match_order).all()
-    return jsonify([{
+def _tournament_to_dict(tournament):
+    return {
+        'tournament_id': tournament.tournament_id,
+        'tournament_date': tournament.tournament_date.isoformat(),
+        'status': tournament.status,
+        'total_teams': tournament.total_teams,
+        'ace_pot_payout': float(tournament.ace_pot_payout),
+        'stations': tournament.stations,
+        'auto_dispatch': bool(tournament.auto_dispatch)
+    }
+
+def _registrations(tournament_id):
+    """Registered players with their ace pot buy-in, from one join"""
+    registrations = db.session.query(
+        RegisteredPlayer.player_id,
+        RegisteredPlayer.player_name,
+        RegisteredPlayer.nickname,
+        RegisteredPlayer.division,
+        TournamentRegistration.bought_ace_pot
+    ).join(
+        RegisteredPlayer, TournamentRegistration.player_id == RegisteredPlayer.player_id
+    ).filter(TournamentRegistration.tournament_id == tournament_id).all()
+    return [{
+        'player_id': reg.player_id,
+        'player_name': reg.player_name,
+        'nickname': reg.nickname,
+        'division': reg.division,
+        'bought_ace_pot': reg.bought_ace_pot
+    } for reg in registrations]
+
+def _match_to_dict(m):
+    return {
         'match_id': m.match_id,
         'match_order': m.match_order,
         'round_type': m.round_type,
@@ -320,30 +454,56 @@ def get_tournament_matches(tournament_id):
         'station_assignment': m.station_assignment,
         'winner_advances_to_match_id': m.winner_advances_to_match_id,
         'loser_advances_to_match_id': m.loser_advances_to_match_id
-    } for m in matches])
+    }
+
+def _team_to_dict(team):
+    return {
+        'team_id': team.team_id,
+        'player1_id': team.player1_id,
+        'player1_name': team.player1_name,
+        'player1_nickname': team.player1_nickname,
+        'player2_id': team.player2_id,
+        'player2_name': team.player2_name,
+        'player2_nickname': team.player2_nickname,
+        'is_ghost_team': team.is_ghost_team,
+        'seed_number': team.seed_number,
+        'final_place': team.final_place
+    }
+
+@tournaments_bp.route('/api/tournaments/<int:tournament_id>/matches', methods=['GET'])
+def get_tournament_matches(tournament_id):
+    matches = Match.query.filter_by(tournament_id=tournament_id).order_by(Match.match_order).all()
+    return jsonify([_match_to_dict(m) for m in matches])
 
 @tournaments_bp.route('/api/tournaments/<int:tournament_id>/teams', methods=['GET'])
 def get_tournament_teams(tournament_id):
-    teams = Team.query.filter_by(tournament_id=tournament_id).all()
-    result = []
-    for team in teams:
-        player1 = RegisteredPlayer.query.get(team.player1_id)
-        player2 = RegisteredPlayer.query.get(team.player2_id) if team.player2_id else None
-        
-        result.append({
-            'team_id': team.team_id,
-            'player1_id': team.player1_id,
-            'player1_name': player1.player_name if player1 else None,
-            'player1_nickname': player1.nickname if player1 else None,
-            'player2_id': team.player2_id,
-            'player2_name': player2.player_name if player2 else None,
-            'player2_nickname': player2.nickname if player2 else None,
-            'is_ghost_team': team.is_ghost_team,
-            'seed_number': team.seed_number,
-            'final_place': team.final_place
-        })
-    
-    return jsonify(result)
+    return jsonify([_team_to_dict(team) for team in load_roster(tournament_id)])
+
+@tournaments_bp.route('/api/tournaments/<int:tournament_id>/snapshot', methods=['GET'])
+def get_tournament_snapshot(tournament_id):
+    """Tournament, registrations, named teams and matches in one response, tagged with the tournament version"""
+    # Read the version before the contents: a write landing in between can only make the
+    # body newer than its tag, never older
+    version = db.session.query(Tournament.version).filter_by(tournament_id=tournament_id).scalar()
+    if version is None:
+        return jsonify({'error': 'Tournament not found'}), 404
+    
+    etag = f't{tournament_id}-v{version}'
+    if request.if_none_match.contains(etag):
+        return '', 304
+    
+    tournament = Tournament.query.get(tournament_id)
+    matches = Match.query.filter_by(tournament_id=tournament_id).order_by(Match.match_order).all()
+    
+    response = jsonify({
+        'version': version,
+        'tournament': _tournament_to_dict(tournament),
+        'registrations': _registrations(tournament_id),
+        'teams': [dict(_team_to_dict(team), points_earned=team.points_earned) for team in load_roster(tournament_id)],
+        'matches': [_match_to_dict(m) for m in matches]
+    })
+    response.set_etag(etag)
+    return response
 
 @tournaments_bp.route('/api/tournaments/<int:tournament_id>/status', methods=['PUT'])
 @require_auth(['Admin', 'Director'])
@@ -362,33 +522,101 @@ def update_tournament_status(tournament_id):
         return jsonify({'error': 'Tournament not found'}), 404
     
     tournament.status = new_status
+    
+    # Fill every station straight away when play starts with auto-dispatch on
+    dispatched = []
+    if new_status == 'In_Progress' and tournament.auto_dispatch:
+        dispatched = dispatch_ready_matches(TournamentState(tournament_id, lock=True))
+    bump_version(tournament_id)
+    
     db.session.commit()
     
+    from routes.matches import _emit_matches_started
+    _emit_matches_started(tournament_id, dispatched)
+    
     return jsonify({
         'tournament_id': tournament_id,
         'status': tournament.status
     })
 
+@tournaments_bp.route('/api/tournaments/<int:tournament_id>/auto-dispatch', methods=['PUT'])
+@require_auth(['Admin', 'Director'])
+def update_auto_dispatch(tournament_id):
+    data = request.get_json()
+    
+    if not data or not isinstance(data.get('enabled'), bool):
+        return jsonify({'error': 'enabled must be true or false'}), 400
+    
+    state = TournamentState(tournament_id, lock=True)
+    if not state.tournament:
+        return jsonify({'error': 'Tournament not found'}), 404
+    
+    state.tournament.auto_dispatch = data['enabled']
+    dispatched = dispatch_ready_matches(state)
+    bump_version(tournament_id)
+    db.session.commit()
+    
+    from routes.matches import _emit_matches_started
+    _emit_matches_started(tournament_id, dispatched)
+    
+    return jsonify({
+        'tournament_id': tournament_id,
+        'auto_dispatch': state.tournament.auto_dispatch,
+        'dispatched': [{'match_id': m.match_id, 'station': m.station_assignment} for m in dispatched]
+    })
+
+@tournaments_bp.route('/api/tournaments/<int:tournament_id>/completion', methods=['GET'])
+def get_completion_status(tournament_id):
+    job = CompletionJob.query.filter_by(tournament_id=tournament_id).first()
+    if not job:
+        return jsonify({'error': 'No completion job for this tournament'}), 404
+    return jsonify(job_to_dict(job))
+
+@tournaments_bp.route('/api/tournaments/<int:tournament_id>/completion/retry', methods=['POST'])
+@require_auth(['Admin'])
+def retry_completion(tournament_id):
+    job = CompletionJob.query.filter_by(tournament_id=tournament_id).first()
+    if not job:
+        return jsonify({'error': 'No completion job for this tournament'}), 404
+    if job.status != 'Failed':
+        return jsonify({'error': f'Completion job is {job.status}, only failed jobs can be retried'}), 400
+    
+    # Finished stages are not repeated; the job resumes at the stage that failed
+    job.status = 'Queued'
+    job.attempts = 0
+    db.session.commit()
+    submit_completion_job(job.job_id)
+    
+    return jsonify(job_to_dict(job))
+
 @tournaments_bp.route('/api/tournaments/<int:tournament_id>', methods=['DELETE'])
 @require_auth(['Admin'])
 def delete_tournament(tournament_id):
     try:
-        # Clean up teammate history, seasonal points, and cash for any tournament
-        tournament = Tournament.query.get(tournament_id)
+        # Lock the tournament so no score can queue a completion job while it goes
+        tournament = Tournament.query.filter_by(tournament_id=tournament_id).with_for_update().first()
+        if tournament and season_closed(tournament.tournament_date.year):
+            return jsonify({'error': f'Season {tournament.tournament_date.year} is closed'}), 400
+        
+        job = CompletionJob.query.filter_by(tournament_id=tournament_id).first()
+        if job and job.status in ('Queued', 'Running'):
+            return jsonify({'error': 'Tournament completion is still being processed, try again once it finishes'}), 409
+        
         if tournament:
-            _cleanup_teammate_history(tournament_id)
-            _adjust_seasonal_points(tournament_id, reverse=True)
-            _adjust_seasonal_cash(tournament_id, reverse=True)
+            # Only the completion stages that actually ran are reversed
+            withdraw_completion(tournament_id)
+            reverse_ratings(tournament_id)
         
         # Delete in dependency order
         Match.query.filter_by(tournament_id=tournament_id).delete()
         Team.query.filter_by(tournament_id=tournament_id).delete()
         TournamentRegistration.query.filter_by(tournament_id=tournament_id).delete()
-        AcePot.query.filter_by(tournament_id=tournament_id).delete()
+        delete_ace_pot_entries(AcePot.tournament_id == tournament_id)
         
         if tournament:
             db.session.delete(tournament)
             db.session.commit()
+            invalidate_leaderboard()
             return jsonify({'message': 'Tournament deleted successfully'})
         else:
             return jsonify({'error': 'Tournament not found'}), 404
@@ -396,54 +624,6 @@ def delete_tournament(tournament_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
-def _cleanup_teammate_history(tournament_id):
-    """Remove teammate history entries for deleted tournament"""
-    from models import Team, TeamHistory
-    
-    teams = Team.query.filter_by(tournament_id=tournament_id).all()
-    
-    for team in teams:
-        if not team.is_ghost_team and team.player2_id:
-            # Decrement history for both players
-            for player_id, teammate_id in [(team.player1_id, team.player2_id), (team.player2_id, team.player1_id)]:
-                history = TeamHistory.query.filter_by(player_id=player_id, teammate_id=teammate_id).first()
-                
-                if history:
-                    history.times_paired -= 1
-                    if history.times_paired <= 0:
-                        db.session.delete(history)
-
-def _adjust_seasonal_points(tournament_id, reverse=False):
-    """Adjust seasonal points for tournament (add or subtract)"""
-    from models import RegisteredPlayer, Team
-    
-    # Only adjust points for completed tournaments (where points were actually awarded)
-    tournament = Tournament.query.get(tournament_id)
-    if not tournament or tournament.status != 'Completed':
-        return
-    
-    teams = Team.query.filter_by(tournament_id=tournament_id).all()
-    
-    for team in teams:
-        if team.points_earned:
-            # Adjust player1 points
-            if team.player1_id:
-                player1 = RegisteredPlayer.query.get(team.player1_id)
-                if player1:
-                    if reverse:
-                        player1.seasonal_points = max(0, player1.seasonal_points - team.points_earned)
-                    else:
-                        player1.seasonal_points += team.points_earned
-            
-            # Adjust player2 points
-            if team.player2_id:
-                player2 = RegisteredPlayer.query.get(team.player2_id)
-                if player2:
-                    if reverse:
-                        player2.seasonal_points = max(0, player2.seasonal_points - team.points_earned)
-                    else:
-                        player2.seasonal_points += team.points_earned
-
 def _count_match_wins_for_deletion(tournament_id, player_id):
     """Count matches won by player's team (for deletion)"""
     from models import Team, Match
@@ -474,79 +654,3 @@ def _is_top_4_finish_for_deletion(tournament_id, player_id):
     ).first()
     
     return team and team.final_place and team.final_place <= 4
-
-def _is_undefeated_for_deletion(tournament_id, player_id):
-    """Check if player's team went undefeated (for deletion)"""
-    from models import Team, Match
-    
-    teams = Team.query.filter_by(tournament_id=tournament_id).filter(
-        db.or_(Team.player1_id == player_id, Team.player2_id == player_id)
-    ).all()
-    
-    for team in teams:
-        matches = Match.query.filter_by(tournament_id=tournament_id).filter(
-            db.or_(Match.team1_id == team.team_id, Match.team2_id == team.team_id)
-        ).filter(Match.match_status == 'Completed').all()
-        
-        for match in matches:
-            if ((match.team1_id == team.team_id and match.team1_score < match.team2_score) or
-                (match.team2_id == team.team_id and match.team2_score < match.team1_score)):
-                return False
-    
-    return True
-
-def _adjust_seasonal_cash(tournament_id, reverse=False):
-    """Adjust seasonal cash for tournament (add or subtract)"""
-    from models import RegisteredPlayer, TournamentRegistration, Team
-    from decimal import Decimal
-    
-    # Only adjust cash for completed tournaments (where payouts were actually made)
-    tournament = Tournament.query.get(tournament_id)
-    if not tournament or tournament.status != 'Completed':
-        return
-    
-    registrations = TournamentRegistration.query.filter_by(tournament_id=tournament_id).all()
-    total_participants = len(registrations)
-    total_payout_pot = 5 * total_participants
-    
-    # Calculate payouts
-    second_place_payout = min(40, total_payout_pot - 40) if total_payout_pot > 40 else 0
-    first_place_payout = total_payout_pot - second_place_payout
-    
-    # Find 1st and 2nd place teams
-    first_place_team = Team.query.filter_by(tournament_id=tournament_id, final_place=1).first()
-    second_place_team = Team.query.filter_by(tournament_id=tournament_id, final_place=2).first()
-    
-    # Check if first place went undefeated for ace pot
-    ace_pot_payout = 0
-    if first_place_team and _is_undefeated_for_deletion(tournament_id, first_place_team.player1_id):
-        # Get ace pot balance at time of tournament (approximate)
-        ace_pot_entries = AcePot.query.filter_by(tournament_id=tournament_id).all()
-        for entry in ace_pot_entries:
-            if entry.amount < 0:  # This was a payout
-                ace_pot_payout = abs(entry.amount)
-                break
-    
-    first_place_payout += ace_pot_payout
-    
-    # Adjust cash for players
-    for reg in registrations:
-        player = RegisteredPlayer.query.get(reg.player_id)
-        if player:
-            player_team = Team.query.filter_by(tournament_id=tournament_id).filter(
-                db.or_(Team.player1_id == reg.player_id, Team.player2_id == reg.player_id)
-            ).first()
-            
-            if player_team:
-                teammates_count = 2 if player_team.player2_id and not player_team.is_ghost_team else 1
-                cash_adjustment = Decimal('0')
-                
-                if player_team.final_place == 1:
-                    cash_adjustment = Decimal(str(first_place_payout / teammates_count))
-                elif player_team.final_place == 2:
-                    cash_adjustment = Decimal(str(second_place_payout / teammates_count))
-                
-                if reverse:
-                    player.seasonal_cash = max(Decimal('0'), player.seasonal_cash - cash_adjustment)
-                else:
-                    player.seasonal_cash += cash_adjustment
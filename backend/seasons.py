@@ -0,0 +1,90 @@
+"""
+Season rollover.
+
+A season is a calendar year of tournaments. Closing it ranks every player who
+took part within their division with a window function, writes the results to
+season_standings with one INSERT ... SELECT, records the close in seasons and
+zeroes the seasonal columns with one UPDATE, all in the caller's transaction. Tournaments from a closed
+season can no longer be deleted or recalculated, since their points and cash
+have already been rolled into the standings.
+"""
+
+from sqlalchemy import select
+
+from database import db, expire_loaded
+from models import CompletionJob, RegisteredPlayer, Season, SeasonStanding, Tournament, TournamentRegistration
+
+
+def _tournament_year():
+    return db.extract('year', Tournament.tournament_date)
+
+
+def season_closed(season_year):
+    """True once the season has been closed, even if it ranked nobody"""
+    return db.session.query(Season.query.filter_by(season_year=season_year).exists()).scalar()
+
+
+def close_season(season_year):
+    """Record final standings for a season and reset seasonal totals; returns the number of standings written"""
+    if season_closed(season_year):
+        raise ValueError(f'Season {season_year} is already closed')
+
+    unfinished = Tournament.query.filter(
+        _tournament_year() == season_year,
+        Tournament.status.in_(['Scheduled', 'In_Progress'])
+    ).count()
+    pending_jobs = CompletionJob.query.join(
+        Tournament, Tournament.tournament_id == CompletionJob.tournament_id
+    ).filter(
+        _tournament_year() == season_year,
+        CompletionJob.status.in_(['Queued', 'Running'])
+    ).count()
+    if unfinished or pending_jobs:
+        raise ValueError(f'Season {season_year} still has tournaments in progress or awaiting completion')
+
+    # Seasonal totals accumulate across years, so a later season must not have started scoring yet
+    if Tournament.query.filter(_tournament_year() > season_year, Tournament.status == 'Completed').count():
+        raise ValueError(f'Tournaments after {season_year} have already been completed')
+
+    # Likewise an earlier season still holding its totals has to be closed first
+    closed_years = select(Season.season_year)
+    unclosed = db.session.query(_tournament_year()).filter(
+        _tournament_year() < season_year,
+        Tournament.status == 'Completed',
+        _tournament_year().notin_(closed_years)
+    ).order_by(_tournament_year()).first()
+    if unclosed:
+        raise ValueError(f'Season {int(unclosed[0])} has completed tournaments and must be closed first')
+
+    # Hold every player row so no result can land between the snapshot and the reset
+    db.session.query(RegisteredPlayer.player_id).with_for_update().all()
+
+    played = select(TournamentRegistration.player_id).join(
+        Tournament, Tournament.tournament_id == TournamentRegistration.tournament_id
+    ).where(_tournament_year() == season_year)
+
+    players = RegisteredPlayer.__table__
+    standings = select(
+        players.c.player_id,
+        db.literal(season_year),
+        players.c.division,
+        db.func.rank().over(
+            partition_by=players.c.division,
+            order_by=(players.c.seasonal_points.desc(), players.c.seasonal_cash.desc())
+        ),
+        db.func.coalesce(players.c.seasonal_points, 0),
+        db.func.coalesce(players.c.seasonal_cash, 0)
+    ).where(db.or_(
+        players.c.seasonal_points > 0,
+        players.c.seasonal_cash != 0,
+        players.c.player_id.in_(played)
+    ))
+    written = db.session.execute(SeasonStanding.__table__.insert().from_select(
+        ['player_id', 'season_year', 'division', 'final_place', 'seasonal_points', 'seasonal_cash'],
+        standings
+    )).rowcount
+    db.session.add(Season(season_year=season_year, players_ranked=written))
+
+    db.session.execute(players.update().values(seasonal_points=0, seasonal_cash=0))
+    expire_loaded(RegisteredPlayer, 'seasonal_points', 'seasonal_cash')
+    return written
@@ -0,0 +1,55 @@
+"""
+Station allocation for in-progress matches.
+
+Stations are claimed against a TournamentState loaded with lock=True, which
+holds row locks on the tournament and its matches until commit. Two directors
+starting matches at the same time are therefore serialized and can never be
+handed the same station.
+
+When a tournament has auto_dispatch enabled, stations freed by scoring are
+filled straight away from the ready queue: Scheduled matches with both teams
+assigned, in match_order.
+"""
+
+DEFAULT_STATIONS = 6
+
+
+def free_stations(state):
+    """Station numbers not held by an in-progress match, lowest first"""
+    max_stations = state.tournament.stations if state.tournament and state.tournament.stations else DEFAULT_STATIONS
+    occupied = {m.station_assignment for m in state.matches
+                if m.match_status == 'In_Progress' and m.station_assignment}
+    return [station for station in range(1, max_stations + 1) if station not in occupied]
+
+
+def ready_queue(state):
+    """Scheduled matches that can start now, in match_order"""
+    return sorted(
+        (m for m in state.matches if m.match_status == 'Scheduled' and m.team1_id and m.team2_id),
+        key=lambda m: m.match_order
+    )
+
+
+def claim_station(state, match):
+    """Start match on the first free station; returns the station or None if all are busy"""
+    stations = free_stations(state)
+    if not stations:
+        return None
+
+    match.match_status = 'In_Progress'
+    match.station_assignment = stations[0]
+    return stations[0]
+
+
+def dispatch_ready_matches(state):
+    """Start queued matches on every free station when auto-dispatch is on"""
+    tournament = state.tournament
+    if not tournament or not tournament.auto_dispatch or tournament.status != 'In_Progress':
+        return []
+
+    started = []
+    for station, match in zip(free_stations(state), ready_queue(state)):
+        match.match_status = 'In_Progress'
+        match.station_assignment = station
+        started.append(match)
+    return started
@@ -0,0 +1,103 @@
+"""
+Team pairing that steers away from repeat teammates.
+
+The times_paired counts between every pair of registered players come from
+team_history in one query. Players are shuffled, paired greedily with the
+first remaining player they have the fewest past pairings with, and the
+result is then improved with 2-opt swaps: any two teams that still contain a
+repeat try both ways of trading partners and keep the cheaper one. History is
+sparse, so most players find a fresh partner straight away and the swap
+passes only revisit the few teams that still carry a repeat.
+
+Ties are broken by the shuffle, so players without any history are paired
+as randomly as before. With an odd field the last player in the shuffle is
+left out for the ghost team, as the random swap loop did.
+"""
+
+import random
+
+from database import db
+from models import TeamHistory
+
+# Full 2-opt passes over the repeat teams before settling for the current pairing
+MAX_SWAP_PASSES = 20
+
+
+def load_pair_counts(player_ids):
+    """{player_id: {teammate_id: times_paired}} among the given players, from one query"""
+    player_ids = list(player_ids)
+    counts = {player_id: {} for player_id in player_ids}
+    if len(player_ids) < 2:
+        return counts
+    rows = db.session.query(
+        TeamHistory.player_id,
+        TeamHistory.teammate_id,
+        TeamHistory.times_paired
+    ).filter(
+        TeamHistory.player_id.in_(player_ids),
+        TeamHistory.teammate_id.in_(player_ids),
+        TeamHistory.times_paired > 0
+    )
+    for player_id, teammate_id, times_paired in rows:
+        counts[player_id][teammate_id] = times_paired
+    return counts
+
+
+def repeat_cost(pairs, pair_counts):
+    """Total past pairings across the given teams"""
+    return sum(pair_counts.get(a, {}).get(b, 0) for a, b in pairs)
+
+
+def pair_players(player_ids, pair_counts, rng=random):
+    """Return ([(player1_id, player2_id), ...], ghost_player_id or None) with as few repeats as practical"""
+    order = list(player_ids)
+    rng.shuffle(order)
+    ghost = order.pop() if len(order) % 2 else None
+
+    def cost(a, b):
+        return pair_counts.get(a, {}).get(b, 0)
+
+    # Greedy: each player in shuffle order takes the first remaining player with the fewest past pairings
+    remaining = order
+    pairs = []
+    while remaining:
+        player = remaining.pop(0)
+        history = pair_counts.get(player)
+        best_index = 0
+        if history:
+            best_cost = None
+            for index, candidate in enumerate(remaining):
+                candidate_cost = history.get(candidate, 0)
+                if best_cost is None or candidate_cost < best_cost:
+                    best_index, best_cost = index, candidate_cost
+                    if not candidate_cost:
+                        break
+        pairs.append((player, remaining.pop(best_index)))
+
+    # 2-opt: trade partners between a repeat team and any other team while that lowers the total
+    for _ in range(MAX_SWAP_PASSES):
+        improved = False
+        for p in range(len(pairs)):
+            a, b = pairs[p]
+            if not cost(a, b):
+                continue
+            for q in range(len(pairs)):
+                if q == p:
+                    continue
+                c, d = pairs[q]
+                current = cost(a, b) + cost(c, d)
+                crossed = cost(a, c) + cost(b, d)
+                swapped = cost(a, d) + cost(b, c)
+                if min(crossed, swapped) < current:
+                    if crossed <= swapped:
+                        pairs[p], pairs[q] = (a, c), (b, d)
+                    else:
+                        pairs[p], pairs[q] = (a, d), (b, c)
+                    improved = True
+                    a, b = pairs[p]
+                    if not cost(a, b):
+                        break
+        if not improved:
+            break
+
+    return pairs, ghost
@@ -0,0 +1,35 @@
+"""
+Shared read path for a tournament's team roster.
+
+Both players come from the same query as their team through two aliased
+joins on registered_players, and rows are plain named tuples rather than
+ORM objects, so a roster costs one query however many teams there are.
+"""
+
+from sqlalchemy.orm import aliased
+
+from database import db
+from models import RegisteredPlayer, Team
+
+
+def load_roster(tournament_id):
+    """Teams of a tournament in team_id order, each row carrying both players' names and nicknames"""
+    player1 = aliased(RegisteredPlayer)
+    player2 = aliased(RegisteredPlayer)
+    return db.session.query(
+        Team.team_id,
+        Team.player1_id,
+        Team.player2_id,
+        Team.is_ghost_team,
+        Team.seed_number,
+        Team.final_place,
+        Team.points_earned,
+        player1.player_name.label('player1_name'),
+        player1.nickname.label('player1_nickname'),
+        player2.player_name.label('player2_name'),
+        player2.nickname.label('player2_nickname')
+    ).outerjoin(
+        player1, player1.player_id == Team.player1_id
+    ).outerjoin(
+        player2, player2.player_id == Team.player2_id
+    ).filter(Team.tournament_id == tournament_id).order_by(Team.team_id).all()
@@ -0,0 +1,23 @@
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import db
+
+
+@pytest.fixture
+def app():
+    """App on an in-memory SQLite database with every table created"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['COMPLETION_JOBS_INLINE'] = True
+    db.init_app(app)
+    with app.app_context():
+        import models  # noqa: F401 - registers the tables
+        db.create_all()
+        yield app
+        db.session.remove()
@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from bracket_engine import stamp_bracket
+from database import db
+from models import Match, RegisteredPlayer, Team, Tournament
+from placements import team_match_stats
+from routes.matches import _update_seasonal_points
+
+
+def _completed_tournament(team_count):
+    """A tournament whose first round is played and every team has a place"""
+    tournament = Tournament(tournament_date=date(2025, 1, 1), status='Completed', total_teams=team_count)
+    players = [RegisteredPlayer(player_name=f'Player {i}', division='Am') for i in range(2 * team_count)]
+    db.session.add(tournament)
+    db.session.add_all(players)
+    db.session.flush()
+
+    teams = [
+        Team(tournament_id=tournament.tournament_id, player1_id=players[2 * i].player_id,
+             player2_id=players[2 * i + 1].player_id, seed_number=i + 1, final_place=i + 1)
+        for i in range(team_count)
+    ]
+    db.session.add_all(teams)
+    db.session.flush()
+
+    for row in stamp_bracket([team.team_id for team in teams]):
+        match = Match(tournament_id=tournament.tournament_id, **row)
+        if match.team1_id and match.team2_id:
+            match.team1_score, match.team2_score, match.match_status = 21, 10, 'Completed'
+        db.session.add(match)
+    db.session.commit()
+    return tournament.tournament_id
+
+
+def _count_statements(fn, *args):
+    count = [0]
+
+    def before_cursor_execute(*_):
+        count[0] += 1
+
+    engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        fn(*args)
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return count[0]
+
+
+@pytest.mark.parametrize('fn', [_update_seasonal_points, team_match_stats])
+def test_completion_query_count_does_not_grow_with_field_size(app, fn):
+    small = _completed_tournament(4)
+    large = _completed_tournament(48)
+
+    assert _count_statements(fn, small) == _count_statements(fn, large)
+
+
+def test_seasonal_points_are_written(app):
+    tournament_id = _completed_tournament(4)
+
+    _update_seasonal_points(tournament_id)
+
+    # Participation, wins and the top 4 bonus for everyone; seeds 1 and 2 won their only match unbeaten
+    points = {team.seed_number: team.points_earned for team in Team.query.filter_by(tournament_id=tournament_id)}
+    assert points == {1: 1 + 1 + 2 + 3, 2: 1 + 1 + 2 + 3, 3: 1 + 0 + 2, 4: 1 + 0 + 2}
+    assert sorted(player.seasonal_points for player in RegisteredPlayer.query) == [3, 3, 3, 3, 7, 7, 7, 7]
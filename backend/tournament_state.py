@@ -0,0 +1,86 @@
+"""
+Per-request view of a tournament's bracket.
+
+Scoring a match touches the scored match, its advancement targets, any byes
+that resolve as a result and the completion checks. TournamentState loads the
+tournament and all of its matches once and indexes them by match_id so all of
+that work runs in memory; the session flushes every change on commit.
+
+The same pass builds a feeder index (which matches advance a team into each
+match), so bye resolution can look at a match's feeders directly instead of
+scanning the bracket.
+
+Every write that changes what the tournament snapshot returns calls
+bump_version() in the same transaction.
+"""
+
+from database import db, expire_loaded
+from models import Tournament, Match
+
+
+def bump_version(*tournament_ids):
+    """Advance the snapshot version of the given tournaments with one atomic UPDATE"""
+    if not tournament_ids:
+        return
+    table = Tournament.__table__
+    db.session.execute(
+        table.update().where(table.c.tournament_id.in_(tournament_ids)).values(version=table.c.version + 1)
+    )
+    expire_loaded(Tournament, 'version')
+
+
+class TournamentState:
+    """Tournament row plus all of its matches, indexed by match_id"""
+
+    def __init__(self, tournament_id, lock=False):
+        self.tournament_id = tournament_id
+        tournament_query = Tournament.query.filter_by(tournament_id=tournament_id)
+        match_query = Match.query.filter_by(tournament_id=tournament_id)
+        if lock:
+            # Row locks serialize concurrent writers on this bracket until commit (no-op on SQLite)
+            tournament_query = tournament_query.with_for_update()
+            match_query = match_query.with_for_update()
+        
+        self.tournament = tournament_query.first()
+        self.completion_job = None
+        self.by_id = {}
+        self.feeders = {}
+        for match in match_query.all():
+            self.by_id[match.match_id] = match
+            for target_id in (match.winner_advances_to_match_id, match.loser_advances_to_match_id):
+                if target_id:
+                    self.feeders.setdefault(target_id, []).append(match.match_id)
+
+    @property
+    def matches(self):
+        return list(self.by_id.values())
+
+    def get(self, match_id):
+        return self.by_id.get(match_id) if match_id else None
+
+    def feeders_of(self, match_id):
+        """Matches whose winner or loser advances into match_id"""
+        return [self.by_id[feeder_id] for feeder_id in self.feeders.get(match_id, ()) if feeder_id in self.by_id]
+
+    def add(self, match):
+        db.session.add(match)
+        self.by_id[match.match_id] = match
+        return match
+
+    def delete(self, match):
+        db.session.delete(match)
+        self.by_id.pop(match.match_id, None)
+
+    def next_match_id(self):
+        return max(self.by_id, default=0) + 1
+
+    def championship(self, round_number):
+        return next((m for m in self.by_id.values()
+                     if m.round_type == 'Championship' and m.round_number == round_number), None)
+
+    def has_open_matches(self):
+        """True while any match is scheduled or still waiting on a seeded team"""
+        return any(
+            m.match_status == 'Scheduled' or (m.match_status == 'Pending' and m.team1_id is not None)
+            for m in self.by_id.values()
+        )
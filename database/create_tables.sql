@@ -18,7 +18,9 @@ CREATE TABLE tournaments (
     status ENUM('Scheduled', 'In_Progress', 'Completed', 'Cancelled') DEFAULT 'Scheduled',
     total_teams INT,
     ace_pot_payout DECIMAL(10,2) DEFAULT 0.00,
-    stations INT DEFAULT 6
+    stations INT DEFAULT 6,
+    auto_dispatch BOOLEAN DEFAULT FALSE,
+    version INT NOT NULL DEFAULT 1
 );
 
 -- Main player registry
@@ -58,11 +60,20 @@ CREATE TABLE season_standings (
     season_year INT,
     division ENUM('Pro', 'Am', 'Junior') NOT NULL,
     final_place INT,
+    seasonal_points INT NOT NULL DEFAULT 0,
+    seasonal_cash DECIMAL(10,2) NOT NULL DEFAULT 0.00,
     PRIMARY KEY (player_id, season_year),
     FOREIGN KEY (player_id) REFERENCES registered_players(player_id),
     CHECK (final_place > 0)
 );
 
+-- One row per closed season, written together with its standings
+CREATE TABLE seasons (
+    season_year INT PRIMARY KEY,
+    players_ranked INT NOT NULL DEFAULT 0,
+    closed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Ace pot transaction history
 CREATE TABLE ace_pot (
     ace_pot_id INT AUTO_INCREMENT PRIMARY KEY,
@@ -70,10 +81,18 @@ CREATE TABLE ace_pot (
     date DATE NOT NULL,
     description VARCHAR(255) NOT NULL,
     amount DECIMAL(10,2) NOT NULL,
+    balance_after DECIMAL(10,2) NOT NULL DEFAULT 0.00,
     FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id),
     CHECK (amount != 0)
 );
 
+-- Current ace pot total, moved in the same transaction as every ace_pot row
+CREATE TABLE ace_pot_balance (
+    balance_id INT PRIMARY KEY,
+    balance DECIMAL(10,2) NOT NULL DEFAULT 0.00,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
 -- Team compositions for tournaments
 CREATE TABLE teams (
     team_id INT AUTO_INCREMENT PRIMARY KEY,
@@ -91,6 +110,89 @@ CREATE TABLE teams (
     CHECK (final_place > 0 OR final_place IS NULL)
 );
 
+-- Cash paid to each player per tournament, reversed row by row on delete/recalculate
+CREATE TABLE payouts (
+    payout_id INT AUTO_INCREMENT PRIMARY KEY,
+    tournament_id INT NOT NULL,
+    player_id INT NOT NULL,
+    team_id INT NOT NULL,
+    final_place INT NOT NULL,
+    amount DECIMAL(10,2) NOT NULL,
+    ace_pot_amount DECIMAL(10,2) DEFAULT 0.00,
+    FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id),
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+
+-- Each player's result in a completed tournament, reversed row by row on delete/recalculate
+CREATE TABLE player_tournament_stats (
+    player_id INT NOT NULL,
+    tournament_id INT NOT NULL,
+    team_id INT NOT NULL,
+    final_place INT NULL,
+    wins INT NOT NULL DEFAULT 0,
+    losses INT NOT NULL DEFAULT 0,
+    won_ace_pot BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (player_id, tournament_id),
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id),
+    FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+
+-- Career totals maintained from player_tournament_stats
+CREATE TABLE player_career_stats (
+    player_id INT PRIMARY KEY,
+    tournaments_played INT NOT NULL DEFAULT 0,
+    match_wins INT NOT NULL DEFAULT 0,
+    match_losses INT NOT NULL DEFAULT 0,
+    podiums INT NOT NULL DEFAULT 0,
+    ace_pots_won INT NOT NULL DEFAULT 0,
+    place_total INT NOT NULL DEFAULT 0,
+    places_counted INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id)
+);
+
+-- Current rating per player, updated as each match is scored
+CREATE TABLE player_ratings (
+    player_id INT PRIMARY KEY,
+    rating DOUBLE NOT NULL DEFAULT 1500,
+    matches_rated INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id)
+);
+
+-- Rating change per player per scored match, reversed row by row on rescore/delete
+CREATE TABLE player_rating_changes (
+    tournament_id INT NOT NULL,
+    match_id INT NOT NULL,
+    player_id INT NOT NULL,
+    delta DOUBLE NOT NULL,
+    PRIMARY KEY (tournament_id, match_id, player_id),
+    FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id),
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id)
+);
+
+-- Background completion jobs (places, teammate history, points, payouts, career stats) per tournament
+CREATE TABLE completion_jobs (
+    job_id INT AUTO_INCREMENT PRIMARY KEY,
+    tournament_id INT NOT NULL UNIQUE,
+    status ENUM('Queued', 'Running', 'Completed', 'Failed') NOT NULL DEFAULT 'Queued',
+    stages_done INT NOT NULL DEFAULT 0,
+    attempts INT NOT NULL DEFAULT 0,
+    error VARCHAR(255) NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id)
+);
+
+-- Generation counters shared by every worker's in-memory caches, bumped after the writes they cover
+CREATE TABLE cache_generations (
+    name VARCHAR(50) PRIMARY KEY,
+    generation BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO cache_generations (name, generation) VALUES ('leaderboard', 0), ('player_search', 0);
+
 -- Individual match records
 CREATE TABLE matches (
     tournament_id INT NOT NULL,
@@ -124,8 +226,13 @@ CREATE TABLE matches (
 
 -- Performance indexes
 CREATE INDEX idx_player_name ON registered_players(player_name);
+CREATE INDEX idx_player_division_points ON registered_players(division, seasonal_points DESC, player_id);
+CREATE INDEX idx_player_division_cash ON registered_players(division, seasonal_cash DESC, player_id);
+CREATE INDEX idx_player_points ON registered_players(seasonal_points DESC, player_id);
+CREATE INDEX idx_player_cash ON registered_players(seasonal_cash DESC, player_id);
 CREATE INDEX idx_tournament_date ON tournaments(tournament_date);
 CREATE INDEX idx_season_year ON season_standings(season_year);
 CREATE INDEX idx_match_tournament ON matches(tournament_id, match_order);
 CREATE INDEX idx_team_tournament ON teams(tournament_id);
+CREATE INDEX idx_payout_tournament ON payouts(tournament_id, player_id);
 CREATE INDEX idx_username ON users(username);
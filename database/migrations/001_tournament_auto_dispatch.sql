@@ -0,0 +1,2 @@
+-- Per-tournament flag: start the next scheduled match as soon as a station frees up
+ALTER TABLE tournaments ADD COLUMN auto_dispatch BOOLEAN DEFAULT FALSE;
@@ -0,0 +1,34 @@
+-- Ledger of cash paid per player per tournament; seasonal_cash is reversed from these rows
+CREATE TABLE payouts (
+    payout_id INT AUTO_INCREMENT PRIMARY KEY,
+    tournament_id INT NOT NULL,
+    player_id INT NOT NULL,
+    team_id INT NOT NULL,
+    final_place INT NOT NULL,
+    amount DECIMAL(10,2) NOT NULL,
+    ace_pot_amount DECIMAL(10,2) DEFAULT 0.00,
+    FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id),
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+
+CREATE INDEX idx_payout_tournament ON payouts(tournament_id, player_id);
+
+-- Backfill tournaments completed before the ledger existed from their final places,
+-- using the payout schedule (5 per player, 2nd gets 20 up to a 60 pot, else up to 40)
+INSERT INTO payouts (tournament_id, player_id, team_id, final_place, amount, ace_pot_amount)
+SELECT t.tournament_id, r.player_id, t.team_id, t.final_place,
+       (CASE WHEN t.final_place = 1 THEN pot.total - pot.second_place + tr.ace_pot_payout ELSE pot.second_place END)
+           / (CASE WHEN t.player2_id IS NOT NULL AND NOT t.is_ghost_team THEN 2 ELSE 1 END),
+       (CASE WHEN t.final_place = 1 THEN tr.ace_pot_payout ELSE 0 END)
+           / (CASE WHEN t.player2_id IS NOT NULL AND NOT t.is_ghost_team THEN 2 ELSE 1 END)
+FROM teams t
+JOIN tournaments tr ON tr.tournament_id = t.tournament_id AND tr.status = 'Completed'
+JOIN tournament_registrations r ON r.tournament_id = t.tournament_id AND r.player_id IN (t.player1_id, t.player2_id)
+JOIN (
+    SELECT tournament_id, 5 * COUNT(*) AS total,
+           CASE WHEN 5 * COUNT(*) <= 60 THEN 20 ELSE LEAST(40, 5 * COUNT(*) - 40) END AS second_place
+    FROM tournament_registrations
+    GROUP BY tournament_id
+) pot ON pot.tournament_id = t.tournament_id
+WHERE t.final_place IN (1, 2);
@@ -0,0 +1,19 @@
+-- Persisted background jobs that run a tournament's completion stages off the request path
+CREATE TABLE completion_jobs (
+    job_id INT AUTO_INCREMENT PRIMARY KEY,
+    tournament_id INT NOT NULL UNIQUE,
+    status ENUM('Queued', 'Running', 'Completed', 'Failed') NOT NULL DEFAULT 'Queued',
+    stages_done INT NOT NULL DEFAULT 0,
+    attempts INT NOT NULL DEFAULT 0,
+    error VARCHAR(255) NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id)
+);
+
+-- Tournaments completed before jobs existed already have every stage applied; record that
+-- so a rescore that reopens one reverses those stages instead of applying them a second time
+INSERT INTO completion_jobs (tournament_id, status, stages_done, attempts)
+SELECT tournament_id, 'Completed', 5, 1
+FROM tournaments
+WHERE status = 'Completed';
@@ -0,0 +1,15 @@
+-- Running balance on every ace pot row plus a maintained current total
+ALTER TABLE ace_pot ADD COLUMN balance_after DECIMAL(10,2) NOT NULL DEFAULT 0.00;
+
+UPDATE ace_pot a
+JOIN (SELECT ace_pot_id, SUM(amount) OVER (ORDER BY ace_pot_id) AS running FROM ace_pot) r
+    ON r.ace_pot_id = a.ace_pot_id
+SET a.balance_after = r.running;
+
+CREATE TABLE ace_pot_balance (
+    balance_id INT PRIMARY KEY,
+    balance DECIMAL(10,2) NOT NULL DEFAULT 0.00,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+INSERT INTO ace_pot_balance (balance_id, balance) SELECT 1, COALESCE(SUM(amount), 0) FROM ace_pot;
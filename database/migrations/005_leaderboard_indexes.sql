@@ -0,0 +1,5 @@
+-- Leaderboard pages walk these in (sort value DESC, player_id) order within a division
+CREATE INDEX idx_player_division_points ON registered_players(division, seasonal_points DESC, player_id);
+CREATE INDEX idx_player_division_cash ON registered_players(division, seasonal_cash DESC, player_id);
+CREATE INDEX idx_player_points ON registered_players(seasonal_points DESC, player_id);
+CREATE INDEX idx_player_cash ON registered_players(seasonal_cash DESC, player_id);
@@ -0,0 +1,56 @@
+-- Per-tournament player results and the career totals maintained from them
+CREATE TABLE player_tournament_stats (
+    player_id INT NOT NULL,
+    tournament_id INT NOT NULL,
+    team_id INT NOT NULL,
+    final_place INT NULL,
+    wins INT NOT NULL DEFAULT 0,
+    losses INT NOT NULL DEFAULT 0,
+    won_ace_pot BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (player_id, tournament_id),
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id),
+    FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+
+CREATE TABLE player_career_stats (
+    player_id INT PRIMARY KEY,
+    tournaments_played INT NOT NULL DEFAULT 0,
+    match_wins INT NOT NULL DEFAULT 0,
+    match_losses INT NOT NULL DEFAULT 0,
+    podiums INT NOT NULL DEFAULT 0,
+    ace_pots_won INT NOT NULL DEFAULT 0,
+    place_total INT NOT NULL DEFAULT 0,
+    places_counted INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id)
+);
+
+-- Backfill completed tournaments from their teams and completed non-bye matches
+INSERT INTO player_tournament_stats (player_id, tournament_id, team_id, final_place, wins, losses, won_ace_pot)
+SELECT p.player_id, s.tournament_id, s.team_id, s.final_place, s.wins, s.losses,
+       s.final_place = 1 AND s.losses = 0
+FROM (
+    SELECT t.tournament_id, t.team_id, t.player1_id, t.player2_id, t.final_place,
+           COALESCE(SUM(CASE WHEN (m.team1_id = t.team_id AND m.team1_score > m.team2_score)
+                               OR (m.team2_id = t.team_id AND m.team2_score > m.team1_score) THEN 1 ELSE 0 END), 0) AS wins,
+           COALESCE(SUM(CASE WHEN (m.team1_id = t.team_id AND m.team1_score < m.team2_score)
+                               OR (m.team2_id = t.team_id AND m.team2_score < m.team1_score) THEN 1 ELSE 0 END), 0) AS losses
+    FROM teams t
+    JOIN tournaments tr ON tr.tournament_id = t.tournament_id AND tr.status = 'Completed'
+    LEFT JOIN matches m ON m.tournament_id = t.tournament_id
+        AND t.team_id IN (m.team1_id, m.team2_id)
+        AND m.match_status = 'Completed' AND m.team2_id IS NOT NULL
+    GROUP BY t.tournament_id, t.team_id, t.player1_id, t.player2_id, t.final_place
+) s
+JOIN registered_players p ON p.player_id IN (s.player1_id, s.player2_id);
+
+INSERT INTO player_career_stats (player_id, tournaments_played, match_wins, match_losses, podiums,
+                                 ace_pots_won, place_total, places_counted)
+SELECT player_id, COUNT(*), SUM(wins), SUM(losses),
+       SUM(CASE WHEN final_place <= 3 THEN 1 ELSE 0 END),
+       SUM(CASE WHEN won_ace_pot THEN 1 ELSE 0 END),
+       SUM(COALESCE(final_place, 0)),
+       SUM(CASE WHEN final_place IS NOT NULL THEN 1 ELSE 0 END)
+FROM player_tournament_stats
+GROUP BY player_id;
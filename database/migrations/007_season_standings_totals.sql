@@ -0,0 +1,3 @@
+-- Keep each player's final seasonal totals alongside their place when a season is closed
+ALTER TABLE season_standings ADD COLUMN seasonal_points INT NOT NULL DEFAULT 0;
+ALTER TABLE season_standings ADD COLUMN seasonal_cash DECIMAL(10,2) NOT NULL DEFAULT 0.00;
@@ -0,0 +1,2 @@
+-- Bumped by every write to a tournament's bracket, teams or registrations; the snapshot ETag
+ALTER TABLE tournaments ADD COLUMN version INT NOT NULL DEFAULT 1;
@@ -0,0 +1,18 @@
+-- Per-player ratings updated as matches are scored, with the per-match changes kept for reversal.
+-- Existing results are loaded with: flask --app app backfill-ratings
+CREATE TABLE player_ratings (
+    player_id INT PRIMARY KEY,
+    rating DOUBLE NOT NULL DEFAULT 1500,
+    matches_rated INT NOT NULL DEFAULT 0,
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id)
+);
+
+CREATE TABLE player_rating_changes (
+    tournament_id INT NOT NULL,
+    match_id INT NOT NULL,
+    player_id INT NOT NULL,
+    delta DOUBLE NOT NULL,
+    PRIMARY KEY (tournament_id, match_id, player_id),
+    FOREIGN KEY (tournament_id) REFERENCES tournaments(tournament_id),
+    FOREIGN KEY (player_id) REFERENCES registered_players(player_id)
+);
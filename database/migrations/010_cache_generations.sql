@@ -0,0 +1,8 @@
+-- Generation counters shared by every worker's in-memory caches. A write bumps the counter
+-- and every process compares it with its own copy on read, rebuilding when it has moved.
+CREATE TABLE cache_generations (
+    name VARCHAR(50) PRIMARY KEY,
+    generation BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO cache_generations (name, generation) VALUES ('leaderboard', 0), ('player_search', 0);
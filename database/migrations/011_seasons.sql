@@ -0,0 +1,12 @@
+-- Record each season close explicitly, so a season that ranked no players still counts as closed
+CREATE TABLE seasons (
+    season_year INT PRIMARY KEY,
+    players_ranked INT NOT NULL DEFAULT 0,
+    closed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Seasons closed before this table existed
+INSERT INTO seasons (season_year, players_ranked)
+SELECT season_year, COUNT(*)
+FROM season_standings
+GROUP BY season_year;
@@ -7,27 +7,34 @@ interface AcePotEntry {
   date: string;
   description: string;
   amount: number;
+  running_balance: number;
+}
+
+interface AcePotPage {
+  entries: AcePotEntry[];
+  next_cursor: number | null;
+  balance: number;
 }
 
 const AcePotTracker: React.FC = () => {
   const [entries, setEntries] = useState<AcePotEntry[]>([]);
   const [loading, setLoading] = useState(true);
   const [currentTotal, setCurrentTotal] = useState(0);
+  const [nextCursor, setNextCursor] = useState<number | null>(null);
 
   useEffect(() => {
     fetchAcePotEntries();
   }, []);
 
-  const fetchAcePotEntries = async () => {
+  const fetchAcePotEntries = async (cursor?: number) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/ace-pot`, { credentials: 'include' });
+      const query = cursor ? `?cursor=${cursor}` : '';
+      const response = await fetch(`${API_BASE_URL}/api/ace-pot${query}`, { credentials: 'include' });
       if (response.ok) {
-        const data = await response.json();
-        setEntries(data);
-        
-        // Calculate current total
-        const total = data.reduce((sum: number, entry: AcePotEntry) => sum + entry.amount, 0);
-        setCurrentTotal(total);
+        const data: AcePotPage = await response.json();
+        setEntries(prev => cursor ? [...prev, ...data.entries] : data.entries);
+        setNextCursor(data.next_cursor);
+        setCurrentTotal(data.balance);
       }
     } catch (error) {
       console.error('Failed to fetch ace pot entries:', error);
@@ -58,24 +65,21 @@ const AcePotTracker: React.FC = () => {
             </tr>
           </thead>
           <tbody>
-            {entries.map((entry, index) => {
-              const runningTotal = entries
-                .slice(0, index + 1)
-                .reduce((sum, e) => sum + e.amount, 0);
-              
-              return (
-                <tr key={entry.ace_pot_id}>
-                  <td>{new Date(entry.date).toLocaleDateString()}</td>
-                  <td>{entry.description}</td>
-                  <td className={entry.amount >= 0 ? 'positive' : 'negative'}>
-                    {entry.amount >= 0 ? '+' : ''}${entry.amount.toFixed(2)}
-                  </td>
-                  <td className="running-total">${runningTotal.toFixed(2)}</td>
-                </tr>
-              );
-            })}
+            {entries.map((entry) => (
+              <tr key={entry.ace_pot_id}>
+                <td>{new Date(entry.date).toLocaleDateString()}</td>
+                <td>{entry.description}</td>
+                <td className={entry.amount >= 0 ? 'positive' : 'negative'}>
+                  {entry.amount >= 0 ? '+' : ''}${entry.amount.toFixed(2)}
+                </td>
+                <td className="running-total">${entry.running_balance.toFixed(2)}</td>
+              </tr>
+            ))}
           </tbody>
         </table>
+        {nextCursor && (
+          <button onClick={() => fetchAcePotEntries(nextCursor)}>Load more</button>
+        )}
         {entries.length === 0 && (
           <div className="empty-state">No ace pot entries found.</div>
         )}
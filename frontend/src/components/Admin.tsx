@@ -56,13 +56,20 @@ const Admin: React.FC<AdminProps> = ({ currentUser }) => {
 
   const fetchTournaments = async () => {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/tournaments`, {
-        credentials: 'include'
-      });
-      if (response.ok) {
+      // Follow the cursor so no in-progress tournament is cut off by the page size
+      const all: Tournament[] = [];
+      let cursor: number | null = null;
+      do {
+        const query: string = cursor ? `&cursor=${cursor}` : '';
+        const response = await fetch(`${API_BASE_URL}/api/tournaments?status=In_Progress&limit=200${query}`, {
+          credentials: 'include'
+        });
+        if (!response.ok) return;
         const data = await response.json();
-        setTournaments(data.filter((t: Tournament) => t.status === 'In_Progress'));
-      }
+        all.push(...data.tournaments);
+        cursor = data.next_cursor;
+      } while (cursor);
+      setTournaments(all);
     } catch (error) {
       console.error('Failed to fetch tournaments:', error);
     }
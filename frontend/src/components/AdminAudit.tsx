@@ -57,12 +57,19 @@ const AdminAudit: React.FC<AdminAuditProps> = ({ user }) => {
 
   const fetchCompletedTournaments = async () => {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/tournaments`, {
-        credentials: 'include'
-      });
-      const data = await response.json();
-      const completed = data.filter((t: Tournament) => t.status === 'Completed');
-      setCompletedTournaments(completed);
+      // Follow the cursor so every completed tournament can be audited, not just the first page
+      const all: Tournament[] = [];
+      let cursor: number | null = null;
+      do {
+        const query: string = cursor ? `&cursor=${cursor}` : '';
+        const response = await fetch(`${API_BASE_URL}/api/tournaments?status=Completed&limit=200${query}`, {
+          credentials: 'include'
+        });
+        const data = await response.json();
+        all.push(...data.tournaments);
+        cursor = data.next_cursor;
+      } while (cursor);
+      setCompletedTournaments(all);
     } catch (error) {
       console.error('Error fetching tournaments:', error);
     }
@@ -2,8 +2,22 @@ import React, { useState, useEffect } from 'react';
 import { API_BASE_URL } from '../config/api';
 import { Player } from '../types/player';
 
+const DIVISIONS = ['Pro', 'Am', 'Junior'];
+const PAGE_SIZE = 50;
+
+interface LeaderboardPlayer extends Player {
+  rank: number;
+}
+
+interface LeaderboardPage {
+  players: LeaderboardPlayer[];
+  next_cursor: number | null;
+  version: number;
+}
+
 const Leaderboard: React.FC = () => {
-  const [players, setPlayers] = useState<Player[]>([]);
+  const [players, setPlayers] = useState<Record<string, LeaderboardPlayer[]>>({});
+  const [cursors, setCursors] = useState<Record<string, number | null>>({});
   const [loading, setLoading] = useState(true);
   const [searchTerms, setSearchTerms] = useState<Record<string, string>>({
     Pro: '',
@@ -12,40 +26,33 @@ const Leaderboard: React.FC = () => {
   });
 
   useEffect(() => {
-    fetchPlayers();
+    Promise.all(DIVISIONS.map(division => fetchPage(division))).finally(() => setLoading(false));
   }, []);
 
-  const fetchPlayers = async () => {
+  const fetchPage = async (division: string, cursor?: number) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/players`, { credentials: 'include' });
+      const params = new URLSearchParams({ division, limit: String(PAGE_SIZE) });
+      if (cursor) params.set('cursor', String(cursor));
+      const response = await fetch(`${API_BASE_URL}/api/leaderboard?${params}`, { credentials: 'include' });
       if (response.ok) {
-        const data = await response.json();
-        setPlayers(data);
+        const data: LeaderboardPage = await response.json();
+        setPlayers(prev => ({ ...prev, [division]: cursor ? [...(prev[division] || []), ...data.players] : data.players }));
+        setCursors(prev => ({ ...prev, [division]: data.next_cursor }));
       }
     } catch (error) {
-      console.error('Failed to fetch players:', error);
-    } finally {
-      setLoading(false);
+      console.error('Failed to fetch leaderboard:', error);
     }
   };
 
-  const groupedPlayers = players.reduce((acc, player) => {
-    if (!acc[player.division]) acc[player.division] = [];
-    acc[player.division].push(player);
-    return acc;
-  }, {} as Record<string, Player[]>);
-
-  // Sort each division by points (descending) and filter by search
+  // Rows arrive ranked and sorted by points; search only narrows what is loaded
   const getFilteredPlayers = (division: string) => {
-    const divisionPlayers = groupedPlayers[division] || [];
+    const divisionPlayers = players[division] || [];
     const searchTerm = searchTerms[division].toLowerCase();
     
-    return divisionPlayers
-      .filter(player => {
-        const name = (player.nickname || player.player_name).toLowerCase();
-        return name.includes(searchTerm);
-      })
-      .sort((a, b) => b.seasonal_points - a.seasonal_points);
+    return divisionPlayers.filter(player => {
+      const name = (player.nickname || player.player_name).toLowerCase();
+      return name.includes(searchTerm);
+    });
   };
 
   const handleSearchChange = (division: string, value: string) => {
@@ -61,8 +68,8 @@ const Leaderboard: React.FC = () => {
       </div>
       
       <div className="divisions-container">
-        {['Pro', 'Am', 'Junior'].map(division => {
-          const divisionPlayers = groupedPlayers[division] || [];
+        {DIVISIONS.map(division => {
+          const divisionPlayers = players[division] || [];
           if (divisionPlayers.length === 0) return null;
           
           const filteredPlayers = getFilteredPlayers(division);
@@ -87,22 +94,25 @@ const Leaderboard: React.FC = () => {
                     </tr>
                   </thead>
                   <tbody>
-                    {filteredPlayers.map((player, index) => (
+                    {filteredPlayers.map(player => (
                       <tr key={player.player_id}>
-                        <td>{index + 1}</td>
+                        <td>{player.rank}</td>
                         <td>{player.nickname || player.player_name}</td>
                         <td>{player.seasonal_points}</td>
                       </tr>
                     ))}
                   </tbody>
                 </table>
+                {cursors[division] && (
+                  <button onClick={() => fetchPage(division, cursors[division] ?? undefined)}>Load more</button>
+                )}
               </div>
             </div>
           );
         })}
       </div>
       
-      {players.length === 0 && (
+      {DIVISIONS.every(division => !(players[division] || []).length) && (
         <div className="empty-state">No players registered yet.</div>
       )}
     </div>
@@ -20,25 +20,8 @@ const PlayerList: React.FC<PlayerListProps> = ({ players, onPlayerClick, onEditP
     a.player_name.localeCompare(b.player_name)
   );
 
-  // Calculate divisional rankings
-  const getDivisionalRank = (player: Player): number => {
-    const divisionPlayers = players
-      .filter(p => p.division === player.division)
-      .sort((a, b) => b.seasonal_points - a.seasonal_points);
-    
-    // Handle ties - players with same points get same rank
-    let rank = 1;
-    for (let i = 0; i < divisionPlayers.length; i++) {
-      if (i > 0 && divisionPlayers[i].seasonal_points < divisionPlayers[i-1].seasonal_points) {
-        rank = i + 1;
-      }
-      if (divisionPlayers[i].player_id === player.player_id) {
-        return rank;
-      }
-    }
-    
-    return divisionPlayers.length + 1;
-  };
+  // Divisional rank comes from the server, computed over the whole division
+  const getDivisionalRank = (player: Player): number => player.division_rank ?? Number.MAX_SAFE_INTEGER;
 
   // Get CSS class for divisional leaders
   const getLeaderClass = (player: Player): string => {
@@ -23,24 +23,8 @@ const PlayerManager: React.FC<PlayerManagerProps> = ({ userRole = 'Viewer' }) =>
   const [editingPlayer, setEditingPlayer] = useState<Player | null>(null);
   const [editForm, setEditForm] = useState({ player_name: '', nickname: '', division: '' });
 
-  const getDivisionalRank = (player: Player): number => {
-    const divisionPlayers = players
-      .filter(p => p.division === player.division)
-      .sort((a, b) => b.seasonal_points - a.seasonal_points);
-    
-    // Handle ties - players with same points get same rank
-    let rank = 1;
-    for (let i = 0; i < divisionPlayers.length; i++) {
-      if (i > 0 && divisionPlayers[i].seasonal_points < divisionPlayers[i-1].seasonal_points) {
-        rank = i + 1;
-      }
-      if (divisionPlayers[i].player_id === player.player_id) {
-        return rank;
-      }
-    }
-    
-    return divisionPlayers.length + 1;
-  };
+  // Divisional rank comes from the server, computed over the whole division
+  const getDivisionalRank = (player: Player): number => player.division_rank ?? Number.MAX_SAFE_INTEGER;
 
   const getDivisionalRankSuffix = (player: Player): string => {
     const rank = getDivisionalRank(player);
@@ -135,30 +119,41 @@ const PlayerManager: React.FC<PlayerManagerProps> = ({ userRole = 'Viewer' }) =>
       reader.onload = (e) => {
         setCsvData(e.target?.result as string);
       };
-      reader.readAsText(file);
+      // Only the start of the file is needed for the preview; the upload sends the file itself
+      reader.readAsText(file.slice(0, 8192));
     }
   };
 
   const handleBulkRegister = async () => {
-    if (!csvData.trim()) return;
+    if (!selectedFile && !csvData.trim()) return;
     
     setBulkLoading(true);
     try {
-      const response = await fetch(`${API_BASE_URL}/api/players/batch-csv`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        credentials: 'include',
-        body: JSON.stringify({ csv_data: csvData })
-      });
+      // Upload the file itself so the server can stream it; pasted text goes as JSON
+      let request: RequestInit;
+      if (selectedFile) {
+        const form = new FormData();
+        form.append('file', selectedFile);
+        request = { method: 'POST', credentials: 'include', body: form };
+      } else {
+        request = {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          credentials: 'include',
+          body: JSON.stringify({ csv_data: csvData })
+        };
+      }
+      const response = await fetch(`${API_BASE_URL}/api/players/batch-csv`, request);
       
       if (response.ok) {
         const result = await response.json();
-        setPlayers(prev => [...prev, ...result.created]);
+        // The import only reports a count, so reload the list to pick up the new players
+        await fetchPlayers();
         setShowBulkRegister(false);
         setCsvData('');
         setSelectedFile(null);
         if (result.errors?.length > 0) {
-          alert(`Registered ${result.created.length} players. Errors: ${result.errors.join(', ')}`);
+          alert(`Registered ${result.created_count} players. Errors: ${result.errors.join(', ')}`);
         }
       }
     } catch (error) {
@@ -12,7 +12,7 @@ interface SelectedPlayer extends Player {
 }
 
 const TournamentCreation: React.FC<TournamentCreationProps> = ({ onBack, onTournamentCreated }) => {
-  const [availablePlayers, setAvailablePlayers] = useState<Player[]>([]);
+  const [searchResults, setSearchResults] = useState<Player[]>([]);
   const [selectedPlayers, setSelectedPlayers] = useState<SelectedPlayer[]>([]);
   const [tournamentDate, setTournamentDate] = useState(new Date().toISOString().split('T')[0]);
   const [stations, setStations] = useState(6);
@@ -26,26 +26,36 @@ const TournamentCreation: React.FC<TournamentCreationProps> = ({ onBack, onTourn
   });
 
   useEffect(() => {
-    fetchPlayers();
-  }, []);
-
-  const fetchPlayers = async () => {
-    try {
-      const response = await fetch(`${API_BASE_URL}/api/players`, { credentials: 'include' });
-      if (response.ok) {
-        const data = await response.json();
-        setAvailablePlayers(data);
-      }
-    } catch (error) {
-      console.error('Failed to fetch players:', error);
+    if (!searchTerm.trim()) {
+      setSearchResults([]);
+      return;
     }
-  };
+    // Debounce keystrokes, and ignore responses for a term that has since changed
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const response = await fetch(
+          `${API_BASE_URL}/api/players/search?q=${encodeURIComponent(searchTerm)}&limit=25`,
+          { credentials: 'include' }
+        );
+        if (response.ok && !cancelled) {
+          const data = await response.json();
+          setSearchResults(data.results);
+        }
+      } catch (error) {
+        console.error('Failed to search players:', error);
+      }
+    }, 150);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchTerm]);
 
-  const filteredPlayers = availablePlayers.filter(player =>
-    !selectedPlayers.find(p => p.player_id === player.player_id) &&
-    (player.player_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    (player.nickname && player.nickname.toLowerCase().includes(searchTerm.toLowerCase())))
-  ).sort((a, b) => a.player_name.localeCompare(b.player_name));
+  // Results arrive ranked from the server
+  const filteredPlayers = searchResults.filter(player =>
+    !selectedPlayers.find(p => p.player_id === player.player_id)
+  );
 
   const addPlayer = (player: Player) => {
     if (!selectedPlayers.find(p => p.player_id === player.player_id)) {
@@ -65,16 +75,23 @@ const TournamentCreation: React.FC<TournamentCreationProps> = ({ onBack, onTourn
 
   const handleNewPlayerSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
-    
-    const duplicate = availablePlayers.find(p => 
-      p.player_name.toLowerCase() === newPlayer.player_name.toLowerCase()
-    );
-    if (duplicate) {
-      alert('Player already exists in the league');
-      return;
-    }
 
     try {
+      const existing = await fetch(
+        `${API_BASE_URL}/api/players/search?q=${encodeURIComponent(newPlayer.player_name)}&limit=5`,
+        { credentials: 'include' }
+      );
+      if (existing.ok) {
+        const data = await existing.json();
+        const duplicate = data.results.find((p: Player) =>
+          p.player_name.toLowerCase() === newPlayer.player_name.trim().toLowerCase()
+        );
+        if (duplicate) {
+          alert('Player already exists in the league');
+          return;
+        }
+      }
+
       const response = await fetch(`${API_BASE_URL}/api/players`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
@@ -85,7 +102,6 @@ const TournamentCreation: React.FC<TournamentCreationProps> = ({ onBack, onTourn
       if (response.ok) {
         const result = await response.json();
         const createdPlayer = result.created[0];
-        setAvailablePlayers([...availablePlayers, createdPlayer]);
         addPlayer(createdPlayer);
         setNewPlayer({ player_name: '', nickname: '', division: 'Am' });
         setShowNewPlayerForm(false);
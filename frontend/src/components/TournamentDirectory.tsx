@@ -6,6 +6,15 @@ interface Tournament {
   tournament_date: string;
   status: string;
   total_teams?: number;
+  registered_players: number;
+  matches_total: number;
+  matches_completed: number;
+  champions: string[];
+}
+
+interface TournamentPage {
+  tournaments: Tournament[];
+  next_cursor: number | null;
 }
 
 interface TournamentDirectoryProps {
@@ -23,17 +32,20 @@ const TournamentDirectory: React.FC<TournamentDirectoryProps> = ({
 }) => {
   const [tournaments, setTournaments] = useState<Tournament[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<number | null>(null);
 
   useEffect(() => {
     fetchTournaments();
   }, []);
 
-  const fetchTournaments = async () => {
+  const fetchTournaments = async (cursor?: number) => {
     try {
-      const response = await fetch(`${API_BASE_URL}/api/tournaments`, { credentials: 'include' });
+      const query = cursor ? `?cursor=${cursor}` : '';
+      const response = await fetch(`${API_BASE_URL}/api/tournaments${query}`, { credentials: 'include' });
       if (response.ok) {
-        const data = await response.json();
-        setTournaments(data);
+        const data: TournamentPage = await response.json();
+        setTournaments(prev => cursor ? [...prev, ...data.tournaments] : data.tournaments);
+        setNextCursor(data.next_cursor);
       }
     } catch (error) {
       console.error('Failed to fetch tournaments:', error);
@@ -84,7 +96,10 @@ const TournamentDirectory: React.FC<TournamentDirectoryProps> = ({
             <tr>
               <th>Date</th>
               <th>Status</th>
+              <th>Players</th>
               <th>Teams</th>
+              <th>Matches</th>
+              <th>Champions</th>
               <th>Actions</th>
             </tr>
           </thead>
@@ -93,7 +108,10 @@ const TournamentDirectory: React.FC<TournamentDirectoryProps> = ({
               <tr key={tournament.tournament_id}>
                 <td>{new Date(tournament.tournament_date).toLocaleDateString()}</td>
                 <td>{tournament.status}</td>
+                <td>{tournament.registered_players}</td>
                 <td>{tournament.total_teams || 0}</td>
+                <td>{tournament.matches_completed}/{tournament.matches_total}</td>
+                <td>{tournament.champions.join(' & ') || '-'}</td>
                 <td>
                   <div className="action-buttons">
                     <button 
@@ -124,6 +142,9 @@ const TournamentDirectory: React.FC<TournamentDirectoryProps> = ({
             ))}
           </tbody>
         </table>
+        {nextCursor && (
+          <button onClick={() => fetchTournaments(nextCursor)}>Load more</button>
+        )}
         {tournaments.length === 0 && (
           <div className="empty-state">No tournaments found.</div>
         )}
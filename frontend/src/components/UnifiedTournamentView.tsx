@@ -1,4 +1,4 @@
-import React, { useEffect, useState, useCallback } from 'react';
+import React, { useEffect, useState, useCallback, useRef } from 'react';
 import { API_BASE_URL } from '../config/api';
 import Bracket from './Bracket';
 import { Tournament, Match } from '../types/tournament';
@@ -29,26 +29,39 @@ const UnifiedTournamentView: React.FC<UnifiedTournamentViewProps> = ({
 
   const accentTexts = ['Shoot Well', 'Bang Chains', 'Aim Straight', 'Double Up'];
 
+  const snapshotEtag = useRef<string | null>(null);
+
+  // One request for tournament, teams and matches; a 304 means nothing changed since the last load
+  const loadSnapshot = useCallback(async () => {
+    const headers: Record<string, string> = {};
+    if (snapshotEtag.current) headers['If-None-Match'] = snapshotEtag.current;
+    const response = await fetch(`${API_BASE_URL}/api/tournaments/${tournamentId}/snapshot`, {
+      credentials: 'include',
+      cache: 'no-store',
+      headers
+    });
+    if (response.status === 304 || !response.ok) return;
+
+    const snapshot = await response.json();
+    snapshotEtag.current = response.headers.get('ETag');
+    setTournament({ id: tournamentId, name: `Tournament ${tournamentId}`, teams: snapshot.teams, matches: snapshot.matches });
+    setTournamentData({ ...snapshot.tournament, registered_players: snapshot.registrations, teams: snapshot.teams });
+    setTournamentStatus(snapshot.tournament.status);
+    setShowCompletionOverlay(snapshot.tournament.status === 'Completed');
+  }, [tournamentId]);
+
   const fetchTournamentData = useCallback(async () => {
     try {
-      const [matches, teams, tournamentData, acePotData] = await Promise.all([
-        fetch(`${API_BASE_URL}/api/tournaments/${tournamentId}/matches`, { credentials: 'include' }).then(res => res.json()),
-        fetch(`${API_BASE_URL}/api/tournaments/${tournamentId}/teams`, { credentials: 'include' }).then(res => res.json()),
-        fetch(`${API_BASE_URL}/api/tournaments?id=${tournamentId}`, { credentials: 'include' }).then(res => res.json()),
-        fetch(`${API_BASE_URL}/api/ace-pot`, { credentials: 'include' }).then(res => res.json())
+      const [, acePotData] = await Promise.all([
+        loadSnapshot(),
+        fetch(`${API_BASE_URL}/api/ace-pot/balance`, { credentials: 'include' }).then(res => res.json())
       ]);
       
-      setTournament({ id: tournamentId, name: `Tournament ${tournamentId}`, teams, matches });
-      setTournamentData(tournamentData);
-      setTournamentStatus(tournamentData.status);
-      setShowCompletionOverlay(tournamentData.status === 'Completed');
-      
-      const totalBalance = acePotData.reduce((sum: number, entry: any) => sum + entry.amount, 0);
-      setAcePotBalance(totalBalance);
+      setAcePotBalance(acePotData.balance);
     } catch (error) {
       console.error('Failed to fetch tournament data:', error);
     }
-  }, [tournamentId]);
+  }, [tournamentId, loadSnapshot]);
 
   // WebSocket for real-time updates
   useWebSocket({
@@ -101,15 +114,7 @@ const UnifiedTournamentView: React.FC<UnifiedTournamentViewProps> = ({
       });
       
       if (response.ok) {
-        const [matches, teams, tournamentData] = await Promise.all([
-          fetch(`${API_BASE_URL}/api/tournaments/${tournamentId}/matches`, { credentials: 'include' }).then(res => res.json()),
-          fetch(`${API_BASE_URL}/api/tournaments/${tournamentId}/teams`, { credentials: 'include' }).then(res => res.json()),
-          fetch(`${API_BASE_URL}/api/tournaments?id=${tournamentId}`, { credentials: 'include' }).then(res => res.json())
-        ]);
-        setTournament({ id: tournamentId, name: `Tournament ${tournamentId}`, teams, matches });
-        setTournamentData(tournamentData);
-        setTournamentStatus(tournamentData.status);
-        setShowCompletionOverlay(tournamentData.status === 'Completed');
+        await loadSnapshot();
       } else {
         const error = await response.json();
         alert(`Error scoring match: ${error.error || 'Unknown error'}`);
@@ -131,11 +136,7 @@ const UnifiedTournamentView: React.FC<UnifiedTournamentViewProps> = ({
       });
       
       if (response.ok) {
-        const [matches, teams] = await Promise.all([
-          fetch(`${API_BASE_URL}/api/tournaments/${tournamentId}/matches`, { credentials: 'include' }).then(res => res.json()),
-          fetch(`${API_BASE_URL}/api/tournaments/${tournamentId}/teams`, { credentials: 'include' }).then(res => res.json())
-        ]);
-        setTournament({ id: tournamentId, name: `Tournament ${tournamentId}`, teams, matches });
+        await loadSnapshot();
       } else {
         const error = await response.json();
         alert(`Error starting match: ${error.error || 'Unknown error'}`);
@@ -29,6 +29,14 @@ export const useWebSocket = ({ tournamentId, onMatchUpdate }: UseWebSocketProps)
       }
     });
 
+    // Final places, points and payouts land after the last score, when the completion job finishes
+    socket.on('tournament_completed', (data) => {
+      console.log('Tournament completed:', data);
+      if (data.tournament_id === tournamentId) {
+        onMatchUpdate();
+      }
+    });
+
     // Handle connection events
     socket.on('connect', () => {
       console.log('Connected to WebSocket server');
@@ -5,4 +5,5 @@ export interface Player {
   division: 'Pro' | 'Am' | 'Junior';
   seasonal_points: number;
   seasonal_cash: number;
+  division_rank?: number;
 }